@@ -4,7 +4,12 @@
 PresidioエンジンによるPII分析（重複除去はCLI共通ユーティリティへ委譲）
 """
 
+import hashlib
 import logging
+import operator
+import re
+from collections import OrderedDict
+
 import spacy
 from presidio_analyzer import (
     AnalyzerEngine,
@@ -12,14 +17,53 @@ from presidio_analyzer import (
     Pattern,
     RecognizerResult,
 )
-from presidio_analyzer.nlp_engine import NlpEngineProvider
-from typing import List, Dict
+from presidio_analyzer.nlp_engine import NlpArtifacts, SpacyNlpEngine
+from typing import Callable, List, Dict, Optional, Tuple
 
 from src.core.config_manager import ConfigManager
 from src.core.regex_match_utils import resolve_mark_span
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasickは任意依存（未導入なら1パターンずつ正規表現で検索）
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# 文字・数字（かな・漢字を含む）を1文字でも含むかの判定用
+_WORD_CHAR_RE = re.compile(r"\w")
+
+# 固有名詞検出結果で共有するメタデータ（読み取り専用として扱う）
+_PROPER_NOUN_METADATA = {"recognizer_name": "ProperNounRecognizer"}
+
+
+def _literal_of(pattern: str) -> Optional[str]:
+    """エスケープ済みの文字だけで構成された正規表現なら、そのリテラル文字列を返す"""
+    literal = re.sub(r"\\(.)", r"\1", pattern, flags=re.DOTALL)
+    return literal if literal and re.escape(literal) == pattern else None
+
+
+_DIGIT_HYPHEN_SPACE_RE = re.compile(r"[0-9\-\s]+")
+_PHONE_CHARS_RE = re.compile(r"[0-9\-]+")
+
+
+def _refine_without_digits(entity_text: str) -> str:
+    """数字・ハイフン・空白を除いた文字列（人名・地名向け）"""
+    return _DIGIT_HYPHEN_SPACE_RE.sub("", entity_text).strip()
+
+
+def _refine_phone_number(entity_text: str) -> str:
+    """数字とハイフンだけを連結した文字列（電話番号向け）"""
+    return "".join(_PHONE_CHARS_RE.findall(entity_text))
+
+
+# エンティティタイプ -> テキスト境界の調整関数（空文字を返した場合は調整しない）
+_ENTITY_TEXT_REFINERS: Dict[str, Callable[[str], str]] = {
+    "PERSON": _refine_without_digits,
+    "LOCATION": _refine_without_digits,
+    "PHONE_NUMBER": _refine_phone_number,
+}
+
 
 class Analyzer:
     """Presidioエンジンの設定とPII分析を担当するクラス"""
@@ -27,6 +71,19 @@ class Analyzer:
     # 上限値手前でチャンクを確定して tokenization エラーを回避する。
     _SUDACHI_MAX_INPUT_BYTES = 49149
     _SUDACHI_SAFE_MARGIN_BYTES = 1024
+    # 固有名詞検出（品詞）とPresidio（トークン・見出し語・NER）が使わない構成要素。
+    # GiNZAは文節解析が係り受けに依存するため ja_core_news 系のみ除外する。
+    _SPACY_EXCLUDED_COMPONENTS = ("parser", "lemmatizer")
+    # 大容量テキストのチャンク解析でnlp.pipeへ渡すチャンクのバッチサイズ
+    _NLP_PIPE_BATCH_SIZE = 8
+    # リテラルの追加パターン（人名リスト等）がこの件数以上ならオートマトンで一括検索
+    _LITERAL_AUTOMATON_MIN_PATTERNS = 32
+    # 既定のPatternRecognizer（_default_recognizersで初回のみ構築）
+    _DEFAULT_RECOGNIZERS: Optional[Tuple[PatternRecognizer, ...]] = None
+    # 同一テキスト（定型ページ・ヘッダ等）の解析結果を保持する件数の上限
+    _RESULT_CACHE_MAX_ENTRIES = 512
+    # 直近に構築したエンジン（モデル構成キー, AnalyzerEngine, spaCy）。プロセス内で再利用する
+    _SHARED_ENGINE: Optional[Tuple[tuple, AnalyzerEngine, object]] = None
 
     def __init__(self, config_manager: ConfigManager):
         """
@@ -37,6 +94,8 @@ class Analyzer:
         self._chunk_delimiter = config_manager.get_chunk_delimiter()
         self._chunk_max_chars = config_manager.get_chunk_max_chars()
         self.analyzer = self._setup_presidio()
+        self._literal_automaton_cache: Optional[Tuple[tuple, object]] = None
+        self._result_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
 
     def _setup_presidio(self) -> AnalyzerEngine:
         """Presidioエンジンを初期化"""
@@ -53,20 +112,37 @@ class Analyzer:
         if not candidate_models:
             candidate_models = ["ja_core_news_trf", "ja_core_news_lg", "ja_core_news_md", "ja_core_news_sm"]
 
+        # 同じモデル構成のエンジンが読み込み済みなら再利用（実行ごとのモデル再読み込みを避ける）
+        engine_key = (tuple(candidate_models), self.config_manager.is_gpu_enabled())
+        shared = Analyzer._SHARED_ENGINE
+        if shared is not None and shared[0] == engine_key:
+            self.nlp = shared[2]
+            return shared[1]
+
         last_error: Exception | None = None
 
+        # GPUはモデル読み込み前に有効化する必要がある（使えなければCPUのまま続行）
+        if self.config_manager.is_gpu_enabled():
+            if spacy.prefer_gpu():
+                logger.info("spaCyのGPU実行を有効化しました")
+            else:
+                logger.warning("GPUが利用できないためspaCyはCPUで実行します")
+
         for model_name in candidate_models:
             try:
-                nlp = spacy.load(model_name)
-                config_models = [{"lang_code": "ja", "model_name": model_name}]
-                provider = NlpEngineProvider(
-                    nlp_configuration={
-                        "nlp_engine_name": "spacy",
-                        "models": config_models,
-                    }
+                excluded = (
+                    list(self._SPACY_EXCLUDED_COMPONENTS)
+                    if model_name.startswith("ja_core_news")
+                    else []
+                )
+                nlp = spacy.load(model_name, exclude=excluded)
+                # 読み込んだパイプラインをPresidioと共有し、同じモデルの二重ロードを避ける
+                nlp_engine = SpacyNlpEngine(
+                    models=[{"lang_code": "ja", "model_name": model_name}]
                 )
+                nlp_engine.nlp = {"ja": nlp}
                 analyzer = AnalyzerEngine(
-                    nlp_engine=provider.create_engine(),
+                    nlp_engine=nlp_engine,
                     supported_languages=["ja"],
                 )
                 self.nlp = nlp
@@ -74,6 +150,8 @@ class Analyzer:
                 # 既定の認識器のみを登録（追加ルールは独自パイプラインで適用）
                 self._add_default_recognizers(analyzer)
                 logger.info(f"spaCyモデルを読み込みました: {model_name}")
+                # モデル構成が変わった場合は前のエンジンを手放す（大きなモデルを複数保持しない）
+                Analyzer._SHARED_ENGINE = (engine_key, analyzer, nlp)
                 return analyzer
             except Exception as exc:
                 last_error = exc
@@ -95,6 +173,15 @@ class Analyzer:
 
     def _add_default_recognizers(self, analyzer: AnalyzerEngine):
         """デフォルトの認識器を追加"""
+        for recognizer in self._default_recognizers():
+            analyzer.registry.add_recognizer(recognizer)
+
+    @classmethod
+    def _default_recognizers(cls) -> Tuple[PatternRecognizer, ...]:
+        """既定の認識器を初回のみ構築して返す（コンパイル済み正規表現をインスタンス間で共有）"""
+        if cls._DEFAULT_RECOGNIZERS is not None:
+            return cls._DEFAULT_RECOGNIZERS
+
         # マイナンバー認識
         individual_number_recognizer = PatternRecognizer(
             supported_entity="INDIVIDUAL_NUMBER",
@@ -107,7 +194,6 @@ class Analyzer:
                 )
             ],
         )
-        analyzer.registry.add_recognizer(individual_number_recognizer)
 
         # 年号認識
         year_recognizer = PatternRecognizer(
@@ -121,7 +207,6 @@ class Analyzer:
                 )
             ],
         )
-        analyzer.registry.add_recognizer(year_recognizer)
 
         # 敬称付き人名認識
         person_name_recognizer = PatternRecognizer(
@@ -135,7 +220,6 @@ class Analyzer:
                 )
             ],
         )
-        analyzer.registry.add_recognizer(person_name_recognizer)
 
         # 電話番号認識
         phone_recognizer = PatternRecognizer(
@@ -149,28 +233,55 @@ class Analyzer:
                 )
             ],
         )
-        analyzer.registry.add_recognizer(phone_recognizer)
+
+        cls._DEFAULT_RECOGNIZERS = (
+            individual_number_recognizer,
+            year_recognizer,
+            person_name_recognizer,
+            phone_recognizer,
+        )
+        return cls._DEFAULT_RECOGNIZERS
 
-    def analyze_text(self, text: str, entities: List[str] = None) -> List[Dict]:
-        """テキストの個人情報を解析（大容量ファイル対応）"""
+    def analyze_text(
+        self, text: str, entities: List[str] = None, text_bytes: Optional[int] = None
+    ) -> List[Dict]:
+        """テキストの個人情報を解析（大容量ファイル対応）
+
+        text_bytesにtextのUTF-8バイト長が分かっていれば渡す（未指定ならここで求める）。
+        """
         if entities is None:
             entities = self.config_manager.get_enabled_entities()
 
-        if self._needs_chunking(text):
+        # UTF-8バイト長は一度だけ求めて下位の判定へ引き回す
+        if text_bytes is None:
+            text_bytes = self._utf8_len(text)
+        if self._needs_chunking(text, text_bytes):
             logger.info(
-                f"大容量テキスト検出 ({len(text):,} 文字 / {self._utf8_len(text):,} bytes)"
+                f"大容量テキスト検出 ({len(text):,} 文字 / {text_bytes:,} bytes)"
                 " - チャンク処理を実行"
             )
-            return self._analyze_text_chunked(text, entities)
+            return self._analyze_text_chunked(text, entities, text_bytes)
 
         return self._analyze_text_single(text, entities)
 
-    def _analyze_text_single(self, text: str, entities: List[str]) -> List[Dict]:
-        """単一テキストの個人情報解析（追加>モデル>除外）"""
+    def _analyze_text_single(
+        self, text: str, entities: List[str], nlp_artifacts: Optional[NlpArtifacts] = None
+    ) -> List[Dict]:
+        """単一テキストの個人情報解析（追加>モデル>除外）
+
+        nlp_artifactsを渡すとspaCyの解析結果を再利用する（未指定ならここで一度だけ解析）。
+        """
         import re
 
         # 1) 追加パターンの適用（右→左適用、左定義が高優先、長さ無視）
         add_map = self.config_manager.get_additional_patterns_mapping()
+
+        # 同じテキスト・エンティティ・追加/除外設定なら前回の結果を返す（LRU）
+        cache_key = self._result_cache_key(text, entities, add_map)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return [dict(result) for result in cached]
         add_candidates = []
         priority_seq = []
         for etype, pats in add_map.items():
@@ -179,15 +290,21 @@ class Analyzer:
             # パターン順序: 左(0)が高優先。適用は右→左。
             for idx, pat in enumerate(pats):
                 priority_seq.append((etype, idx, pat))
+        # リテラルのパターンは可能なら1回の走査でまとめて検索しておく
+        literal_spans = self._find_literal_pattern_spans(text, priority_seq)
         # 探索: 右→左
-        for etype, idx, pat in reversed(priority_seq):
-            try:
-                cre = re.compile(pat, re.MULTILINE)
-            except re.error as e:
-                logger.warning(f"無効な追加正規表現をスキップ: {pat}: {e}")
-                continue
-            for m in cre.finditer(text):
-                s, e = resolve_mark_span(m)
+        for seq_idx in reversed(range(len(priority_seq))):
+            etype, idx, pat = priority_seq[seq_idx]
+            if seq_idx in literal_spans:
+                spans = literal_spans[seq_idx]
+            else:
+                try:
+                    cre = re.compile(pat, re.MULTILINE)
+                except re.error as e:
+                    logger.warning(f"無効な追加正規表現をスキップ: {pat}: {e}")
+                    continue
+                spans = (resolve_mark_span(m) for m in cre.finditer(text))
+            for s, e in spans:
                 if s == e:
                     continue
                 add_candidates.append(
@@ -210,10 +327,19 @@ class Analyzer:
             occupied.append((s, e))
             add_selected.append({k: v for k, v in cand.items() if not k.startswith("_")})
 
-        # 2) モデル検出（既存Presidio + 固有名詞）
-        analyzer_results = self.analyzer.analyze(text=text, language="ja", entities=entities)
-        if "PROPER_NOUN" in entities:
-            analyzer_results.extend(self._detect_proper_nouns(text))
+        # 2) モデル検出（既存Presidio + 固有名詞）: 同じspaCy解析結果を両方で使う
+        # 空白・記号だけのテキスト（画像のみのページ等）はモデルに渡さない
+        analyzer_results: List[RecognizerResult] = []
+        if _WORD_CHAR_RE.search(text):
+            if nlp_artifacts is None:
+                nlp_artifacts = self.analyzer.nlp_engine.process_text(text, "ja")
+            analyzer_results = self.analyzer.analyze(
+                text=text, language="ja", entities=entities, nlp_artifacts=nlp_artifacts
+            )
+            if "PROPER_NOUN" in entities:
+                analyzer_results.extend(
+                    self._proper_nouns_from_doc(nlp_artifacts.tokens, 0)
+                )
 
         # 3) モデル結果に除外適用＆追加と重複するものを抑制
         def overlaps_any(span):
@@ -256,7 +382,67 @@ class Analyzer:
 
         results = add_selected + model_filtered
         # Analyzer系の重複除去は廃止（Web/CLIで実施）
-        return sorted(results, key=lambda x: x["start"]) 
+        results = sorted(results, key=operator.itemgetter("start"))
+
+        self._result_cache[cache_key] = [dict(result) for result in results]
+        if len(self._result_cache) > self._RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+        return results
+
+    def _result_cache_key(
+        self, text: str, entities: List[str], add_map: Dict[str, List[str]]
+    ) -> tuple:
+        """解析結果キャッシュのキー（テキストと結果に影響する設定のダイジェスト）"""
+        settings = repr((add_map, self.config_manager.config.get("exclusions")))
+        return (
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            len(text),
+            tuple(entities),
+            hashlib.blake2b(settings.encode("utf-8"), digest_size=16).digest(),
+        )
+
+    def _find_literal_pattern_spans(
+        self, text: str, priority_seq: List[Tuple[str, int, str]]
+    ) -> Dict[int, List[Tuple[int, int]]]:
+        """リテラルの追加パターンをAho-Corasickで一括検索（priority_seqの位置 -> 一致範囲）
+
+        各語の一致はfinditerと同じく語ごとに重ならない範囲だけを返す。
+        """
+        if ahocorasick is None:
+            return {}
+        literal_positions: Dict[str, List[int]] = {}
+        for seq_idx, (_etype, _idx, pat) in enumerate(priority_seq):
+            literal = _literal_of(pat)
+            if literal is not None:
+                literal_positions.setdefault(literal, []).append(seq_idx)
+        if len(literal_positions) < self._LITERAL_AUTOMATON_MIN_PATTERNS:
+            return {}
+
+        cache_key = tuple(literal_positions)
+        if self._literal_automaton_cache and self._literal_automaton_cache[0] == cache_key:
+            automaton = self._literal_automaton_cache[1]
+        else:
+            automaton = ahocorasick.Automaton()
+            for literal in literal_positions:
+                automaton.add_word(literal, literal)
+            automaton.make_automaton()
+            self._literal_automaton_cache = (cache_key, automaton)
+
+        spans_by_literal: Dict[str, List[Tuple[int, int]]] = {
+            literal: [] for literal in literal_positions
+        }
+        for end_idx, literal in automaton.iter(text):
+            start = end_idx + 1 - len(literal)
+            spans = spans_by_literal[literal]
+            if spans and start < spans[-1][1]:
+                continue  # 同じ語の重なる一致はfinditerと同様に捨てる
+            spans.append((start, end_idx + 1))
+
+        return {
+            seq_idx: spans_by_literal[literal]
+            for literal, positions in literal_positions.items()
+            for seq_idx in positions
+        }
 
     @staticmethod
     def _digits_only(text: str) -> str:
@@ -316,22 +502,64 @@ class Analyzer:
             return 0
         return 11 - remainder
 
-    def _analyze_text_chunked(self, text: str, entities: List[str]) -> List[Dict]:
+    def _analyze_text_chunked(
+        self, text: str, entities: List[str], text_bytes: Optional[int] = None
+    ) -> List[Dict]:
         """チャンク分割による大容量テキスト解析"""
-        chunks = self._chunk_text(text)
+        chunks = self._chunk_text(text, text_bytes)
         all_results = []
 
         logger.info(f"テキストを{len(chunks)}個のチャンクに分割して処理")
 
+        # キャッシュ済み・文字を含まない・同じ内容が先に出るチャンクはspaCyに渡さない
+        add_map = self.config_manager.get_additional_patterns_mapping()
+        nlp_chunk_indices = set()
+        queued_keys = set()
+        for i, chunk_info in enumerate(chunks):
+            chunk_text = chunk_info["text"]
+            if not _WORD_CHAR_RE.search(chunk_text):
+                continue
+            cache_key = self._result_cache_key(chunk_text, entities, add_map)
+            if cache_key in self._result_cache or cache_key in queued_keys:
+                continue
+            queued_keys.add(cache_key)
+            nlp_chunk_indices.add(i)
+
+        # 残りのチャンクをnlp.pipeでまとめて解析し、得たNlpArtifactsをPresidioへ渡す
+        batch_artifacts = None
+        if nlp_chunk_indices:
+            try:
+                batch_artifacts = self.analyzer.nlp_engine.process_batch(
+                    [
+                        chunk_info["text"]
+                        for i, chunk_info in enumerate(chunks)
+                        if i in nlp_chunk_indices
+                    ],
+                    language="ja",
+                    batch_size=self._NLP_PIPE_BATCH_SIZE,
+                )
+            except AttributeError as e:  # process_batchの無い古いpresidio-analyzer
+                logger.warning(f"一括NLP処理が使えないためチャンクごとに解析: {e}")
+
         for i, chunk_info in enumerate(chunks):
             chunk_text = chunk_info["text"]
             start_offset = chunk_info["start_offset"]
 
+            nlp_artifacts = None
+            if batch_artifacts is not None and i in nlp_chunk_indices:
+                try:
+                    _, nlp_artifacts = next(batch_artifacts)
+                except Exception as e:
+                    logger.warning(f"一括NLP処理に失敗したため以降はチャンクごとに解析: {e}")
+                    batch_artifacts = None
+
             try:
                 logger.debug(
                     f"チャンク {i+1}/{len(chunks)} 処理中 ({len(chunk_text):,} 文字)"
                 )
-                chunk_results = self._analyze_text_single(chunk_text, entities)
+                chunk_results = self._analyze_text_single(
+                    chunk_text, entities, nlp_artifacts
+                )
 
                 for result in chunk_results:
                     result["start"] += start_offset
@@ -343,38 +571,40 @@ class Analyzer:
                 logger.error(f"チャンク {i+1} の処理でエラー: {e}")
                 continue
 
-        return sorted(all_results, key=lambda x: x["start"])
+        return sorted(all_results, key=operator.itemgetter("start"))
 
-    def _detect_proper_nouns(self, text: str) -> List[RecognizerResult]:
-        """固有名詞を検出（大容量テキスト対応）"""
-        if self._needs_chunking(text):
-            logger.debug(
-                f"固有名詞検出: 大容量テキスト ({len(text):,} 文字 / {self._utf8_len(text):,} bytes)"
-                " - チャンク処理"
-            )
-            return self._detect_proper_nouns_chunked(text)
-
-        return self._detect_proper_nouns_single(text)
-
     @staticmethod
     def _utf8_len(text: str) -> int:
         """UTF-8バイト長を返す"""
+        if text.isascii():
+            return len(text)  # ASCIIのみなら文字数と一致するためエンコードを省く
         return len(text.encode("utf-8"))
 
     def _chunk_max_bytes(self) -> int:
         """Sudachi入力上限より手前の安全なチャンクバイト上限"""
         return max(1, self._SUDACHI_MAX_INPUT_BYTES - self._SUDACHI_SAFE_MARGIN_BYTES)
 
-    def _is_within_chunk_limits(self, text: str, max_chars: int, max_bytes: int) -> bool:
-        """文字数・UTF-8バイト数の両方でチャンク制約を判定"""
-        return len(text) <= max_chars and self._utf8_len(text) <= max_bytes
+    def _is_within_chunk_limits(
+        self,
+        text: str,
+        max_chars: int,
+        max_bytes: int,
+        text_bytes: Optional[int] = None,
+    ) -> bool:
+        """文字数・UTF-8バイト数の両方でチャンク制約を判定（text_bytesは既知のバイト長）"""
+        if len(text) > max_chars:
+            return False
+        if text_bytes is None:
+            text_bytes = self._utf8_len(text)
+        return text_bytes <= max_bytes
 
-    def _needs_chunking(self, text: str) -> bool:
+    def _needs_chunking(self, text: str, text_bytes: Optional[int] = None) -> bool:
         """文字数またはUTF-8バイト数が上限を超える場合にチャンク分割が必要"""
         return not self._is_within_chunk_limits(
             text,
             self._chunk_max_chars,
             self._chunk_max_bytes(),
+            text_bytes,
         )
 
     def _split_text_by_hard_limits(
@@ -415,54 +645,27 @@ class Analyzer:
 
         return chunks
 
-    def _detect_proper_nouns_single(self, text: str) -> List[RecognizerResult]:
-        """単一テキストの固有名詞検出"""
-        results = []
-        doc = self.nlp(text)
-
-        for token in doc:
-            if token.pos_ == "PROPN":
-                result = RecognizerResult(
-                    entity_type="PROPER_NOUN",
-                    start=token.idx,
-                    end=token.idx + len(token.text),
-                    score=0.85,
-                    recognition_metadata={"recognizer_name": "ProperNounRecognizer"},
-                )
-                results.append(result)
-
-        return results
-
-    def _detect_proper_nouns_chunked(self, text: str) -> List[RecognizerResult]:
-        """チャンク分割による大容量テキストの固有名詞検出"""
-        chunks = self._chunk_text(text)
-        all_results = []
-
-        for i, chunk_info in enumerate(chunks):
-            chunk_text = chunk_info["text"]
-            start_offset = chunk_info["start_offset"]
-
-            try:
-                chunk_results = self._detect_proper_nouns_single(chunk_text)
-
-                for result in chunk_results:
-                    result.start += start_offset
-                    result.end += start_offset
-
-                all_results.extend(chunk_results)
-
-            except Exception as e:
-                logger.error(f"固有名詞検出 チャンク {i+1} でエラー: {e}")
-                continue
-
-        return all_results
+    @staticmethod
+    def _proper_nouns_from_doc(doc, start_offset: int) -> List[RecognizerResult]:
+        """解析済みDocから固有名詞を抽出（位置はstart_offsetだけずらす）"""
+        return [
+            RecognizerResult(
+                entity_type="PROPER_NOUN",
+                start=start_offset + token.idx,
+                end=start_offset + token.idx + len(token.text),
+                score=0.85,
+                recognition_metadata=_PROPER_NOUN_METADATA,
+            )
+            for token in doc
+            if token.pos_ == "PROPN"
+        ]
 
-    def _chunk_text(self, text: str) -> List[Dict]:
+    def _chunk_text(self, text: str, text_bytes: Optional[int] = None) -> List[Dict]:
         """テキストをチャンクに分割（区切り文字→文字数/バイト数フォールバック）"""
         max_chars = self._chunk_max_chars
         max_bytes = self._chunk_max_bytes()
 
-        if self._is_within_chunk_limits(text, max_chars, max_bytes):
+        if self._is_within_chunk_limits(text, max_chars, max_bytes, text_bytes):
             return [{"text": text, "start_offset": 0}]
 
         delimiter = self._chunk_delimiter
@@ -476,27 +679,41 @@ class Analyzer:
         segments = text.split(delimiter)
 
         if len(segments) > 1:
-            current_chunk = ""
+            # 確定前のチャンクは部品リストと文字数・バイト数の累計で持ち、
+            # セグメント追加のたびにチャンク全体を連結・再エンコードしない
+            current_parts: List[str] = []
+            current_chars = 0
+            current_bytes = 0
             current_offset = 0
 
             for i, segment in enumerate(segments):
                 # 最後のセグメント以外は区切り文字を付加
                 seg = segment + delimiter if i < len(segments) - 1 else segment
-                test_chunk = current_chunk + seg
-
-                if self._is_within_chunk_limits(test_chunk, max_chars, max_bytes):
-                    current_chunk = test_chunk
+                seg_chars = len(seg)
+                seg_bytes = self._utf8_len(seg)
+
+                if (
+                    current_chars + seg_chars <= max_chars
+                    and current_bytes + seg_bytes <= max_bytes
+                ):
+                    current_parts.append(seg)
+                    current_chars += seg_chars
+                    current_bytes += seg_bytes
                     continue
 
-                if current_chunk:
+                if current_chars:
                     chunks.append(
-                        {"text": current_chunk, "start_offset": current_offset}
+                        {"text": "".join(current_parts), "start_offset": current_offset}
                     )
-                    current_offset += len(current_chunk)
-                    current_chunk = ""
-
-                if self._is_within_chunk_limits(seg, max_chars, max_bytes):
-                    current_chunk = seg
+                    current_offset += current_chars
+                current_parts = []
+                current_chars = 0
+                current_bytes = 0
+
+                if seg_chars <= max_chars and seg_bytes <= max_bytes:
+                    current_parts = [seg]
+                    current_chars = seg_chars
+                    current_bytes = seg_bytes
                     continue
 
                 forced_chunks = self._split_text_by_hard_limits(
@@ -512,9 +729,9 @@ class Analyzer:
                 else:
                     current_offset += len(seg)
 
-            if current_chunk:
+            if current_chars:
                 chunks.append(
-                    {"text": current_chunk, "start_offset": current_offset}
+                    {"text": "".join(current_parts), "start_offset": current_offset}
                 )
         else:
             # 2) 区切り文字がない場合、文字数/バイト数で強制分割
@@ -531,24 +748,10 @@ class Analyzer:
         self, entity_text: str, entity_type: str, full_text: str, start: int, end: int
     ) -> str:
         """エンティティタイプに応じてテキスト境界を調整"""
-        import re
-
-        if entity_type == "PERSON":
-            refined = re.sub(r"[0-9\-\s]*", "", entity_text).strip()
-            if refined:
-                return refined
-
-        elif entity_type == "LOCATION":
-            refined = re.sub(r"[0-9\-\s]*", "", entity_text).strip()
-            if refined:
-                return refined
-
-        elif entity_type == "PHONE_NUMBER":
-            refined = re.findall(r"[0-9\-]+", entity_text)
-            if refined:
-                return "".join(refined)
-
-        return entity_text
+        refiner = _ENTITY_TEXT_REFINERS.get(entity_type)
+        if refiner is None:
+            return entity_text
+        return refiner(entity_text) or entity_text
 
     def _calculate_refined_positions(
         self, full_text: str, original_start: int, original_end: int, refined_text: str
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import bisect
 import json
 import re
 from datetime import datetime
@@ -29,7 +30,42 @@ from src.cli.common import (
 ALLOWED_ENTITIES = ENTITY_ALIASES
 ALLOWED_ENTITY_NAMES = ENTITY_TYPES
 
-def _convert_offsets_to_position(start_offset: int, end_offset_exclusive: int, text_2d: List[List[str]]) -> Tuple[Dict[str, int], Dict[str, int]]:
+BlockOffsetIndex = Tuple[List[int], List[Tuple[int, int]], int, Tuple[int, int, int]]
+
+
+def _build_block_offset_index(text_2d: List[List[str]]) -> BlockOffsetIndex:
+    """text_2dから空でないブロックの開始オフセット表を作る（二分探索用）"""
+    starts: List[int] = []
+    keys: List[Tuple[int, int]] = []
+    current_offset = 0
+    last_block = (0, 0, 0)
+    for page_num, page_blocks in enumerate(text_2d):
+        for block_num, block_text in enumerate(page_blocks):
+            block_len = len(block_text)
+            last_block = (page_num, block_num, block_len)
+            if block_len:
+                starts.append(current_offset)
+                keys.append((page_num, block_num))
+            current_offset += block_len
+    return starts, keys, current_offset, last_block
+
+
+def _lookup_block_position(offset: int, block_index: BlockOffsetIndex) -> Optional[Dict[str, int]]:
+    """グローバルオフセットが属するブロックを二分探索で求める"""
+    starts, keys, total_len, _ = block_index
+    if offset < 0 or offset >= total_len:
+        return None
+    idx = bisect.bisect_right(starts, offset) - 1
+    page_num, block_num = keys[idx]
+    return {"page_num": page_num, "block_num": block_num, "offset": offset - starts[idx]}
+
+
+def _convert_offsets_to_position(
+    start_offset: int,
+    end_offset_exclusive: int,
+    text_2d: List[List[str]],
+    block_index: Optional[BlockOffsetIndex] = None,
+) -> Tuple[Dict[str, int], Dict[str, int]]:
     """グローバルオフセットをpage_num,block_num,offset形式に変換
 
     注意:
@@ -37,49 +73,23 @@ def _convert_offsets_to_position(start_offset: int, end_offset_exclusive: int, t
     - end_offset_exclusive はPythonスライス互換の終端（非包含）
     - 本関数は end.offset を「最後の文字そのもの」の位置（包含）に合わせて算出する
     - 開始と終了は別々のブロック/ページにまたがってもよい
+    - 複数エンティティを変換する場合は _build_block_offset_index の結果を block_index に渡す
     """
+    if block_index is None:
+        block_index = _build_block_offset_index(text_2d)
 
     # 終了位置は包含端に合わせる（最後の文字そのもののオフセット）
     last_char_global = max(0, end_offset_exclusive - 1)
 
-    start_pos: Optional[Dict[str, int]] = None
-    end_pos: Optional[Dict[str, int]] = None
-
-    current_offset = 0
-    last_page_num = 0
-    last_block_num = 0
-    last_block_len = 0
-
-    for page_num, page_blocks in enumerate(text_2d):
-        for block_num, block_text in enumerate(page_blocks):
-            block_len = len(block_text)
-            last_page_num = page_num
-            last_block_num = block_num
-            last_block_len = block_len
-
-            # start の属する位置
-            if start_pos is None and current_offset <= start_offset < current_offset + block_len:
-                start_pos = {
-                    "page_num": page_num,
-                    "block_num": block_num,
-                    "offset": start_offset - current_offset,
-                }
-
-            # end(包含) の属する位置
-            if end_pos is None and current_offset <= last_char_global < current_offset + block_len:
-                end_pos = {
-                    "page_num": page_num,
-                    "block_num": block_num,
-                    "offset": last_char_global - current_offset,
-                }
-
-            current_offset += block_len
+    start_pos = _lookup_block_position(start_offset, block_index)
+    end_pos = _lookup_block_position(last_char_global, block_index)
 
     # フォールバック: いずれか見つからない場合、末尾/先頭にクランプ
     if start_pos is None:
         start_pos = {"page_num": 0, "block_num": 0, "offset": 0}
     if end_pos is None:
         # 最後のブロックの末尾に合わせる（空でない前提。空なら0にクランプ）
+        last_page_num, last_block_num, last_block_len = block_index[3]
         end_pos = {
             "page_num": last_page_num,
             "block_num": last_block_num,
@@ -209,6 +219,7 @@ def main(adds: Tuple[str, ...], excludes: Tuple[str, ...], json_file: str, model
         add_specs: List[Tuple[str, str]] = [parse_add_arg(a) for a in adds]
         exclude_specs: List[str] = list(excludes)
 
+        block_index = _build_block_offset_index(text_2d)
         for r in model_results:
             ent = r.get("entity_type") or r.get("entity")
             s = int(r["start"]); e = int(r["end"])  # codepoint offsets (no newlines)
@@ -216,7 +227,7 @@ def main(adds: Tuple[str, ...], excludes: Tuple[str, ...], json_file: str, model
             did = _detection_id(ent, txt, (s, e))
             # 仕様書形式: start/endをpage_num,block_num,offset形式に変換
             # endは「最後の文字そのもの」のoffset（包含端）になるようにマッピング
-            start_pos, end_pos = _convert_offsets_to_position(s, e, text_2d)
+            start_pos, end_pos = _convert_offsets_to_position(s, e, text_2d, block_index)
             entry_plain = {
                 "start": start_pos,
                 "end": end_pos,
@@ -242,7 +253,7 @@ def main(adds: Tuple[str, ...], excludes: Tuple[str, ...], json_file: str, model
                 txt = target_text[s:e]
                 did = _detection_id(ent_name, txt, (s, e))
                 # endは包含端に合わせる
-                start_pos, end_pos = _convert_offsets_to_position(s, e, text_2d)
+                start_pos, end_pos = _convert_offsets_to_position(s, e, text_2d, block_index)
                 detections_plain.append({
                     "start": start_pos,
                     "end": end_pos,
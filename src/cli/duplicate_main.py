@@ -145,25 +145,31 @@ def _dedupe_detections_spec_format(
 
     block_start_map = _build_block_start_map(text_2d)
     n = len(detect_list)
+    spans = [_entity_span(item, block_start_map) for item in detect_list]
 
     # 重複グラフを構築
+    # どのモードでも重複には区間の交差が必要なため、開始位置順に走査し
+    # 開始位置が相手の終了位置以内の組だけを比較する
     adjacency: List[List[int]] = [[] for _ in range(n)]
-    for i in range(n):
+    order = sorted(range(n), key=lambda idx: spans[idx][0])
+    for pos, i in enumerate(order):
         left = detect_list[i]
-        for j in range(i + 1, n):
+        left_span = spans[i]
+        for j in order[pos + 1:]:
+            right_span = spans[j]
+            if right_span[0] > left_span[1]:
+                break
             right = detect_list[j]
 
             if not _should_compare_entities(left, right, entity_overlap_mode):
                 continue
 
-            if _positions_overlap(left, right, overlap, block_start_map):
+            if _spans_overlap(left_span, right_span, overlap):
                 # sameモードの異種エンティティ比較は、包含関係がある場合のみ重複扱い
                 if entity_overlap_mode == "same":
                     left_entity = str(left.get("entity", "")).strip().upper()
                     right_entity = str(right.get("entity", "")).strip().upper()
                     if left_entity != right_entity:
-                        left_span = _entity_span(left, block_start_map)
-                        right_span = _entity_span(right, block_start_map)
                         if not (
                             _span_contains(left_span, right_span)
                             or _span_contains(right_span, left_span)
@@ -208,16 +214,12 @@ def _dedupe_detections_spec_format(
 
     return result
 
-def _positions_overlap(
-    item1: Dict[str, Any],
-    item2: Dict[str, Any],
+def _spans_overlap(
+    span1: Tuple[int, int],
+    span2: Tuple[int, int],
     overlap_mode: str,
-    block_start_map: Dict[Tuple[int, int], int],
 ) -> bool:
-    """位置の重複判定（start/endは包含端として扱う）"""
-    span1 = _entity_span(item1, block_start_map)
-    span2 = _entity_span(item2, block_start_map)
-
+    """グローバル値に変換済みの区間同士の重複判定"""
     if overlap_mode == "exact":
         return span1 == span2
     if overlap_mode == "contain":
@@ -96,6 +96,16 @@ def _structured_from_pdf(pdf_path: str) -> Dict[str, Any]:
     return {"pages": pages}
 
 
+def _blocks_plain_text_from_mapper(mapper: Any, page_count: int) -> List[List[str]]:
+    """PDFBlockTextMapperからページごとのブロックテキスト（2D配列）を取り出す"""
+    pages_out: List[List[str]] = []
+    for page_num in range(page_count):
+        page_block_texts = mapper.get_page_block_texts(page_num)
+        if page_block_texts:
+            pages_out.append(page_block_texts)
+    return pages_out
+
+
 def _blocks_plain_text(pdf_path: str) -> List[List[str]]:
     """仕様書に従い2D配列形式で返す: [["xxxx","yyyy"],["zzzz","aaa"],...]"""
     import fitz
@@ -108,13 +118,8 @@ def _blocks_plain_text(pdf_path: str) -> List[List[str]]:
         with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
             with fitz.open(pdf_path) as doc:
                 # PDFBlockTextMapperを使用してブロック単位のテキストを取得
-                mapper = PDFBlockTextMapper(doc, enable_cache=True)
-                
-                # ページごとにブロックテキストを取得
-                for page_num in range(len(doc)):
-                    page_block_texts = mapper.get_page_block_texts(page_num)
-                    if page_block_texts:
-                        pages_out.append(page_block_texts)
+                mapper = PDFBlockTextMapper(doc, enable_cache=True, enable_spatial_index=False)
+                pages_out = _blocks_plain_text_from_mapper(mapper, len(doc))
     
     except Exception as e:
         print(f"ブロックテキスト抽出エラー: {e}")
@@ -294,72 +299,80 @@ def _read_embedded_coordinate_maps(pdf_path: str) -> Tuple[Dict[str, Any], Dict[
         return {}, {}
 
 
-def _generate_coordinate_maps(pdf_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    """座標マップを新規生成する（常に生成。埋め込みは参照しない）"""
-    import fitz
-    from src.pdf.pdf_block_mapper import PDFBlockTextMapper
-    from src.pdf.pdf_coordinate_mapper import PDFCoordinateMapper
-    
+def _coordinate_maps_from_mapper(
+    mapper: Any, total_pages: int
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """PDFBlockTextMapperのブロック別文字bboxから座標マップ（offset2coords / coords2offset）を作る"""
     # 仕様書形式: {page_num:{block_num:[[x0,y0,x1,y1],...]}}
     offset2coords_map: Dict[str, Any] = {}
     # 仕様書形式: {(x0,y0,x1,y1):(page_num,block_num,offset)}
     coords2offset_map: Dict[str, Any] = {}
-    
+
+    logging.debug("座標マップ生成開始: 総ページ数=%d", total_pages)
+    # ページごとの処理進捗を表示（stderr）。TTYでない場合も安全に動作。
+    label = "座標マップ生成中: ページ処理"
+    iterable = range(total_pages)
+    with click.progressbar(iterable, label=label, file=sys.stderr, length=total_pages) as bar:
+        for page_num in bar:
+            blocks_processed = 0
+            coords_emitted = 0
+            offset2coords_map[str(page_num)] = {}
+            page_block_texts = mapper.get_page_block_texts(page_num)
+            page_block_bboxes = mapper.get_page_block_char_bboxes(page_num)
+            for page_block_id, (block_text, char_bboxes) in enumerate(
+                zip(page_block_texts, page_block_bboxes)
+            ):
+                if not block_text:
+                    continue
+                blocks_processed += 1
+                block_coords: List[List[float]] = []
+                for char_offset, (_char, bbox) in enumerate(zip(block_text, char_bboxes)):
+                    if not bbox:
+                        continue
+                    x0, y0, x1, y1 = bbox
+                    block_coords.append([x0, y0, x1, y1])
+                    coord_key = f"({x0},{y0},{x1},{y1})"
+                    coords2offset_map[coord_key] = f"({page_num},{page_block_id},{char_offset})"
+                    coords_emitted += 1
+                if block_coords:
+                    offset2coords_map[str(page_num)][str(page_block_id)] = block_coords
+            logging.debug(
+                "ページ処理完了: %d/%d, ブロック=%d, 生成座標=%d",
+                page_num + 1,
+                total_pages,
+                blocks_processed,
+                coords_emitted,
+            )
+
+    return offset2coords_map, coords2offset_map
+
+
+def _read_text_and_coordinate_maps(
+    pdf_path: str,
+) -> Tuple[List[List[str]], Dict[str, Any], Dict[str, Any]]:
+    """1回のページ解析からブロックテキスト（2D配列）と座標マップを作る"""
+    import fitz
+    from src.pdf.pdf_block_mapper import PDFBlockTextMapper
+
+    text_2d: List[List[str]] = []
+    offset2coords_map: Dict[str, Any] = {}
+    coords2offset_map: Dict[str, Any] = {}
+
     try:
         # MuPDFの標準出力を抑制
         with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
             with fitz.open(pdf_path) as doc:
-                # PDFBlockTextMapperを使用してブロック単位の座標マッピングを取得
-                mapper = PDFBlockTextMapper(doc, enable_cache=True)
-
-                total_pages = len(doc)
-                logging.debug("座標マップ生成開始: 総ページ数=%d", total_pages)
-                # ページごとの処理進捗を表示（stderr）。TTYでない場合も安全に動作。
-                label = "座標マップ生成中: ページ処理"
-                iterable = range(total_pages)
-                with click.progressbar(iterable, label=label, file=sys.stderr, length=total_pages) as bar:
-                    for page_num in bar:
-                        blocks_processed = 0
-                        coords_emitted = 0
-                        offset2coords_map[str(page_num)] = {}
-                        page_block_texts = mapper.get_page_block_texts(page_num)
-                        page_mapping = mapper.page_block_offset_mapping.get(page_num, {})
-                        for page_block_id, offset_map in page_mapping.items():
-                            block_text = page_block_texts[page_block_id] if page_block_id < len(page_block_texts) else ""
-                            if not block_text:
-                                continue
-                            blocks_processed += 1
-                            block_coords: List[List[float]] = []
-                            for char_offset in range(len(block_text)):
-                                idx = offset_map.get(char_offset)
-                                if idx is None:
-                                    continue
-                                char_pos = mapper.char_positions[idx]
-                                if not char_pos.bbox:
-                                    continue
-                                x0, y0, x1, y1 = char_pos.bbox
-                                bbox = [x0, y0, x1, y1]
-                                block_coords.append(bbox)
-                                coord_key = f"({x0},{y0},{x1},{y1})"
-                                coords2offset_map[coord_key] = f"({page_num},{page_block_id},{char_offset})"
-                                coords_emitted += 1
-                            if block_coords:
-                                offset2coords_map[str(page_num)][str(page_block_id)] = block_coords
-                        logging.debug(
-                            "ページ処理完了: %d/%d, ブロック=%d, 生成座標=%d",
-                            page_num + 1,
-                            total_pages,
-                            blocks_processed,
-                            coords_emitted,
-                        )
-    
+                mapper = PDFBlockTextMapper(doc, enable_cache=True, enable_spatial_index=False)
+                text_2d = _blocks_plain_text_from_mapper(mapper, len(doc))
+                offset2coords_map, coords2offset_map = _coordinate_maps_from_mapper(
+                    mapper, len(doc)
+                )
+
     except Exception as e:
-        # エラー時は空のマップを返す
-        print(f"座標マップ生成エラー: {e}")
-        offset2coords_map = {}
-        coords2offset_map = {}
-    
-    return offset2coords_map, coords2offset_map
+        # エラー時は取得できた分だけ返す（座標マップは空）
+        print(f"ブロックテキスト・座標マップ生成エラー: {e}")
+
+    return text_2d, offset2coords_map, coords2offset_map
 
 
 @click.command(help="PDFを読み込み 統一スキーマのJSONをファイル出力（text.*, detect.*）")
@@ -394,21 +407,10 @@ def main(pdf: str, out: str, pretty: bool, with_map: bool, with_highlights: bool
 
         metadata = _get_pdf_metadata(pdf)
         
-        # 仕様書に従い、まずstructured textを読み込む（structured_text読み込みは廃止予定だが座標マップ生成に必要）
-        structured = _structured_from_pdf(pdf)
-        
-        # text は2D配列形式で出力
-        text_2d = _blocks_plain_text(pdf)
-        
-        detect_list: List[Dict[str, Any]] = []
-        if with_highlights:
-            highlights = _read_highlight_raw(pdf, cfg)
-            # ハイライト位置推定は 2Dテキスト配列を用いて行う
-            detect_list = _convert_highlights_to_spec_format(highlights, {"text": text_2d})
-        
         # 座標マップ: --with-map のときのみ出力へ含める
         offset2coords_map: Dict[str, Any] = {}
         coords2offset_map: Dict[str, Any] = {}
+        text_2d: Optional[List[List[str]]] = None
         if with_map:
             embedded_maps: Tuple[Dict[str, Any], Dict[str, Any]] = _read_embedded_coordinate_maps(pdf)
             if embedded_maps[0] or embedded_maps[1]:
@@ -418,7 +420,18 @@ def main(pdf: str, out: str, pretty: bool, with_map: bool, with_highlights: bool
             else:
                 print("座標マップを新規生成します", file=sys.stderr)
                 logging.debug("座標マップの新規生成を開始")
-                offset2coords_map, coords2offset_map = _generate_coordinate_maps(pdf)
+                # text と座標マップは同じページ解析結果から作る
+                text_2d, offset2coords_map, coords2offset_map = _read_text_and_coordinate_maps(pdf)
+        
+        # text は2D配列形式で出力
+        if text_2d is None:
+            text_2d = _blocks_plain_text(pdf)
+        
+        detect_list: List[Dict[str, Any]] = []
+        if with_highlights:
+            highlights = _read_highlight_raw(pdf, cfg)
+            # ハイライト位置推定は 2Dテキスト配列を用いて行う
+            detect_list = _convert_highlights_to_spec_format(highlights, {"text": text_2d})
         
         # 仕様書の形式でJSON出力を構築
         result: Dict[str, Any] = {
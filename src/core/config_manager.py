@@ -84,6 +84,7 @@ class ConfigManager:
                     "ja_core_news_sm",
                 ],
                 "auto_download": True,
+                "use_gpu": False,  # TrueならspaCyをGPUで実行（利用不可ならCPU）
                 "chunk_delimiter": "。",
                 "chunk_max_chars": 15000,
             },
@@ -618,6 +619,10 @@ class ConfigManager:
         """モデル自動ダウンロードが有効かどうかを返す"""
         return self._safe_get_config("nlp.auto_download", True)
 
+    def is_gpu_enabled(self) -> bool:
+        """spaCyのGPU実行が有効かどうかを返す"""
+        return bool(self._safe_get_config("nlp.use_gpu", False))
+
     # 重複除去設定メソッド
     def is_deduplication_enabled(self) -> bool:
         """重複除去が有効かどうかを返す"""
@@ -140,20 +140,22 @@ def _choose_kept(
         return idxs[0]
     if keep == "last":
         return idxs[-1]
+    # group position of each index (avoids O(n) idxs.index() inside key functions)
+    order = {i: pos for pos, i in enumerate(idxs)}
     if keep == "entity-order":
         def prio(i):
             ent = str(items[i].get("entity", ""))
             return pri_map.get(ent, 10**9)
 
-        return min(idxs, key=lambda i: (prio(i), idxs.index(i)))
+        return min(idxs, key=lambda i: (prio(i), order[i]))
     # widest
     if kind == "plain":
-        return max(idxs, key=lambda i: (_interval_len(items[i]), -idxs.index(i)))
+        return max(idxs, key=lambda i: (_interval_len(items[i]), -order[i]))
     else:
         def total_area(i):
             return sum(_rect_area(q) for q in (items[i].get("quads", []) or []))
 
-        return max(idxs, key=lambda i: (total_area(i), -idxs.index(i)))
+        return max(idxs, key=lambda i: (total_area(i), -order[i]))
 
 
 def _origin_bucket(entry: Dict[str, Any]) -> str:
@@ -188,6 +190,7 @@ def _choose_with_tie_break(
             op.append(x)
     origin_rank = {name: i for i, name in enumerate(op)}
     ent_rank = {name: i for i, name in enumerate(entity_priority or [])}
+    order = {i: pos for pos, i in enumerate(idxs)}
 
     def length_key(i: int) -> int:
         if kind == "plain":
@@ -199,7 +202,7 @@ def _choose_with_tie_break(
 
     def position_key(i: int) -> int:
         # input order as proxy; smaller is earlier
-        pos = idxs.index(i)
+        pos = order[i]
         return pos if (position_pref or "first").lower() == "first" else -pos
 
     def origin_key(i: int) -> int:
@@ -220,7 +223,7 @@ def _choose_with_tie_break(
                 parts.append(entity_key(i))
             elif k == "position":
                 parts.append(position_key(i))
-        parts.append(idxs.index(i))  # final stable tie-breaker
+        parts.append(order[i])  # final stable tie-breaker
         return tuple(parts)
 
     return min(idxs, key=key_tuple)
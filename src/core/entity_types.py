@@ -60,6 +60,16 @@ ANNOTATION_COLORS: Dict[str, List[float]] = {
 }
 ANNOTATION_COLOR_DEFAULT: List[float] = [0.0, 0.0, 0.0]
 
+# --- 注釈の塗り色（注釈色を0.3倍に暗くしたもの。注釈ごとに計算しないよう事前計算） ---
+ANNOTATION_FILL_RATIO = 0.3
+ANNOTATION_FILL_COLORS: Dict[str, List[float]] = {
+    entity_type: [c * ANNOTATION_FILL_RATIO for c in color]
+    for entity_type, color in ANNOTATION_COLORS.items()
+}
+ANNOTATION_FILL_COLOR_DEFAULT: List[float] = [
+    c * ANNOTATION_FILL_RATIO for c in ANNOTATION_COLOR_DEFAULT
+]
+
 # --- ハイライト用色 RGB [0.0-1.0] ---
 HIGHLIGHT_COLORS: Dict[str, List[float]] = {
     "PERSON": [1.0, 0.8, 0.8],
@@ -78,6 +88,11 @@ def get_annotation_color(entity_type: str) -> List[float]:
     return ANNOTATION_COLORS.get(entity_type, ANNOTATION_COLOR_DEFAULT)
 
 
+def get_annotation_fill_color(entity_type: str) -> List[float]:
+    """エンティティタイプに対応する注釈の塗り色を返す"""
+    return ANNOTATION_FILL_COLORS.get(entity_type, ANNOTATION_FILL_COLOR_DEFAULT)
+
+
 def get_highlight_color(entity_type: str) -> List[float]:
     """エンティティタイプに対応するハイライト色を返す"""
     return HIGHLIGHT_COLORS.get(entity_type, HIGHLIGHT_COLOR_DEFAULT)
@@ -11,6 +11,7 @@ Phase 5: エラーハンドリング強化
 - ロギングの追加
 """
 
+import bisect
 import json
 import shutil
 import sys
@@ -29,7 +30,7 @@ from src.cli.read_main import (
     _get_pdf_metadata,
     _structured_from_pdf,
     _blocks_plain_text,
-    _generate_coordinate_maps,
+    _read_text_and_coordinate_maps,
 )
 from src.core.config_manager import ConfigManager
 from src.core.regex_match_utils import resolve_mark_span
@@ -157,6 +158,27 @@ class PipelineService:
 
         return "".join(target_chars), target_spans, base_offset
 
+    @staticmethod
+    def _build_offset2coords_block_index(offset2coords_map: Any) -> Dict[Any, List[int]]:
+        """offset2coordsMapのページキーごとに、数値ブロックIDを昇順で一度だけ求める"""
+        block_ids_by_page: Dict[Any, List[int]] = {}
+        if not isinstance(offset2coords_map, dict):
+            return block_ids_by_page
+        for page_key, page_dict in offset2coords_map.items():
+            if not isinstance(page_dict, dict) or not page_dict:
+                continue
+            block_ids = sorted(int(k) for k in page_dict.keys() if str(k).isdigit())
+            if block_ids:
+                block_ids_by_page[page_key] = block_ids
+        return block_ids_by_page
+
+    @staticmethod
+    def _block_ids_in_range(block_ids: List[int], b_start: int, b_end: int) -> List[int]:
+        """昇順のブロックIDからb_start以上b_end以下の範囲を二分探索で切り出す"""
+        return block_ids[
+            bisect.bisect_left(block_ids, b_start) : bisect.bisect_right(block_ids, b_end)
+        ]
+
     @staticmethod
     def _map_target_span_to_base_offsets(
         start_offset: int,
@@ -282,21 +304,17 @@ class PipelineService:
         # 構造化データ取得（将来の参照用、現在は使用しない）
         # structured = _structured_from_pdf(pdf_str)
 
-        # プレーンテキスト取得（2D配列）
-        text_2d = _blocks_plain_text(pdf_str)
-
-        # 座標マップの生成（オプション）
+        # プレーンテキスト（2D配列）と座標マップ（オプション）の取得
+        # 座標マップを作る場合は同じページ解析結果からテキストも得る
         offset2coords_map = {}
         coords2offset_map = {}
         if include_coordinate_map:
-            try:
-                offset2coords_map, coords2offset_map = _generate_coordinate_maps(
-                    pdf_str
-                )
-                logger.debug("座標マップの生成完了")
-            except Exception as e:
-                logger.warning(f"座標マップの生成に失敗: {e}")
-                # 座標マップなしで継続
+            text_2d, offset2coords_map, coords2offset_map = (
+                _read_text_and_coordinate_maps(pdf_str)
+            )
+            logger.debug("座標マップの生成完了")
+        else:
+            text_2d = _blocks_plain_text(pdf_str)
 
         # 結果の組み立て（CLI互換形式）
         result = {
@@ -628,7 +646,10 @@ class PipelineService:
         from src.analysis.analyzer import Analyzer
         import fitz
         from src.pdf.pdf_locator import PDFTextLocator
-        from src.cli.detect_main import _convert_offsets_to_position
+        from src.cli.detect_main import (
+            _build_block_offset_index,
+            _convert_offsets_to_position,
+        )
 
         # 入力検証
         if not isinstance(read_result, dict):
@@ -712,6 +733,7 @@ class PipelineService:
 
             # モデル検出
             model_results = analyzer.analyze_text(target_text, entities)
+            block_index = _build_block_offset_index(text_2d)
 
             for r in model_results:
                 ent = r.get("entity_type") or r.get("entity")
@@ -729,7 +751,7 @@ class PipelineService:
                     base_text_length,
                 )
                 start_pos, end_pos = _convert_offsets_to_position(
-                    base_s, base_e, text_2d
+                    base_s, base_e, text_2d, block_index
                 )
                 if (
                     target_pages is not None
@@ -773,7 +795,7 @@ class PipelineService:
                                 )
                             )
                             start_pos, end_pos = _convert_offsets_to_position(
-                                base_s, base_e, text_2d
+                                base_s, base_e, text_2d, block_index
                             )
                             if (
                                 target_pages is not None
@@ -1013,6 +1035,9 @@ class PipelineService:
         # 座標・テキスト情報の取得
         offset2coords_map = detect_result.get("offset2coordsMap", {})
         text_2d = detect_result.get("text", [])
+        block_ids_by_page = PipelineService._build_offset2coords_block_index(
+            offset2coords_map
+        )
 
         # グローバルオフセットマップの準備
         block_start_global = {}
@@ -1313,19 +1338,15 @@ class PipelineService:
 
                         page_rects = {}
                         for p in range(ps, pe + 1):
-                            page_dict = offset2coords_map.get(str(p), {})
-                            if not isinstance(page_dict, dict) or not page_dict:
-                                continue
-                            block_ids = sorted(
-                                [int(k) for k in page_dict.keys() if str(k).isdigit()]
-                            )
+                            block_ids = block_ids_by_page.get(str(p))
                             if not block_ids:
                                 continue
+                            page_dict = offset2coords_map[str(p)]
                             b_start = bs if p == ps else block_ids[0]
                             b_end = be if p == pe else block_ids[-1]
-                            for b in block_ids:
-                                if b < b_start or b > b_end:
-                                    continue
+                            for b in PipelineService._block_ids_in_range(
+                                block_ids, b_start, b_end
+                            ):
                                 block_list = page_dict.get(str(b), [])
                                 if not isinstance(block_list, list) or not block_list:
                                     continue
@@ -1564,6 +1585,9 @@ class PipelineService:
 
         offset2coords_map = detect_result.get("offset2coordsMap", {})
         text_2d = detect_result.get("text", [])
+        block_ids_by_page = PipelineService._build_offset2coords_block_index(
+            offset2coords_map
+        )
 
         block_start_global: Dict[Tuple[int, int], int] = {}
         global_cursor = 0
@@ -1838,19 +1862,15 @@ class PipelineService:
             page_rects: Dict[int, List[List[float]]] = {}
             try:
                 for p in range(page_num, end_page_num + 1):
-                    page_dict = offset2coords_map.get(str(p), {})
-                    if not isinstance(page_dict, dict) or not page_dict:
-                        continue
-                    block_ids = sorted(
-                        [int(k) for k in page_dict.keys() if str(k).isdigit()]
-                    )
+                    block_ids = block_ids_by_page.get(str(p))
                     if not block_ids:
                         continue
+                    page_dict = offset2coords_map[str(p)]
                     b_start = block_num if p == page_num else block_ids[0]
                     b_end = end_block_num if p == end_page_num else block_ids[-1]
-                    for b in block_ids:
-                        if b < b_start or b > b_end:
-                            continue
+                    for b in PipelineService._block_ids_in_range(
+                        block_ids, b_start, b_end
+                    ):
                         block_list = page_dict.get(str(b), [])
                         if not isinstance(block_list, list) or not block_list:
                             continue
@@ -2067,6 +2087,9 @@ class PipelineService:
             detect_list = []
         offset2coords_map = detect_result.get("offset2coordsMap", {})
         text_2d = detect_result.get("text", [])
+        block_ids_by_page = PipelineService._build_offset2coords_block_index(
+            offset2coords_map
+        )
 
         block_start_global: Dict[Tuple[int, int], int] = {}
         global_cursor = 0
@@ -2364,19 +2387,15 @@ class PipelineService:
             page_rects: Dict[int, List[List[float]]] = {}
             try:
                 for p in range(page_num, end_page_num + 1):
-                    page_dict = offset2coords_map.get(str(p), {})
-                    if not isinstance(page_dict, dict) or not page_dict:
-                        continue
-                    block_ids = sorted(
-                        [int(k) for k in page_dict.keys() if str(k).isdigit()]
-                    )
+                    block_ids = block_ids_by_page.get(str(p))
                     if not block_ids:
                         continue
+                    page_dict = offset2coords_map[str(p)]
                     b_start = block_num if p == page_num else block_ids[0]
                     b_end = end_block_num if p == end_page_num else block_ids[-1]
-                    for b in block_ids:
-                        if b < b_start or b > b_end:
-                            continue
+                    for b in PipelineService._block_ids_in_range(
+                        block_ids, b_start, b_end
+                    ):
                         block_list = page_dict.get(str(b), [])
                         if not isinstance(block_list, list) or not block_list:
                             continue
@@ -20,6 +20,7 @@ import csv
 import re
 import shutil
 import fitz
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from PyQt6.QtWidgets import (
@@ -85,6 +86,8 @@ class MainWindow(QMainWindow):
 
         # 全プレビューエンティティを保持（選択状態管理用）
         self._all_preview_entities: List[Dict] = []
+        # 結果の一括クリア中は一覧・プレビューの再構築を保留する
+        self._result_refresh_suspended = False
 
         # GUI検出設定（$HOME/.presidio/config.json）
         self.detect_config_service = DetectConfigService(Path.home())
@@ -768,16 +771,15 @@ class MainWindow(QMainWindow):
 
     def _go_to_first_page(self):
         """先頭ページへ移動"""
-        if not self.pdf_preview.pdf_document:
+        if self.pdf_preview.pdf_document is None:
             return
         self.pdf_preview.go_to_page(0)
 
     def _go_to_last_page(self):
         """最終ページへ移動"""
-        pdf_document = self.pdf_preview.pdf_document
-        if not pdf_document:
+        if self.pdf_preview.pdf_document is None:
             return
-        self.pdf_preview.go_to_page(len(pdf_document) - 1)
+        self.pdf_preview.go_to_page(self.pdf_preview.page_count - 1)
 
     # =========================================================================
     # アクションハンドラー（Phase 1: スタブ実装）
@@ -816,7 +818,8 @@ class MainWindow(QMainWindow):
             return
 
         closed_pdf = self.app_state.pdf_path
-        self.app_state.clear()
+        with self._deferred_result_refresh():
+            self.app_state.clear()
         self._reset_detect_scope_context()
         self._reset_duplicate_scope_context()
         self._set_dirty(False)
@@ -851,12 +854,13 @@ class MainWindow(QMainWindow):
 
     def _open_pdf_path(self, pdf_path: Path):
         """指定パスのPDFを読み込む"""
-        self.app_state.pdf_path = pdf_path
-        # PDF切り替え時は前回結果をクリア
-        self.app_state.read_result = None
-        self.app_state.detect_result = None
-        self.app_state.duplicate_result = None
-        self.app_state.ocr_result = None
+        with self._deferred_result_refresh():
+            self.app_state.pdf_path = pdf_path
+            # PDF切り替え時は前回結果をクリア
+            self.app_state.read_result = None
+            self.app_state.detect_result = None
+            self.app_state.duplicate_result = None
+            self.app_state.ocr_result = None
         self.log_message(f"PDFファイルを選択: {pdf_path}")
         self._set_dirty(False)
         self.update_action_states()
@@ -922,6 +926,8 @@ class MainWindow(QMainWindow):
         if not self._maybe_proceed_with_unsaved():
             event.ignore()
             return
+        # プレビューの描画ワーカーを止める
+        self.pdf_preview.close()
         event.accept()
 
     def _auto_read(self):
@@ -1890,8 +1896,20 @@ class MainWindow(QMainWindow):
         """ステータスメッセージが変更された"""
         self.statusBar().showMessage(message)
 
+    @contextmanager
+    def _deferred_result_refresh(self):
+        """複数の結果変更をまとめ、一覧・プレビューの再構築を最後の1回にする"""
+        self._result_refresh_suspended = True
+        try:
+            yield
+        finally:
+            self._result_refresh_suspended = False
+            self._refresh_result_view_from_state()
+
     def _refresh_result_view_from_state(self):
         """現在の状態から結果一覧とプレビューハイライトを再構築する"""
+        if self._result_refresh_suspended:
+            return
         current_result = self.app_state.duplicate_result or self.app_state.detect_result
         self.result_panel.load_entities(current_result)
         if current_result:
@@ -2310,7 +2328,12 @@ class MainWindow(QMainWindow):
         if not target_text:
             return []
 
-        from src.cli.detect_main import _convert_offsets_to_position
+        from src.cli.detect_main import (
+            _build_block_offset_index,
+            _convert_offsets_to_position,
+        )
+
+        block_index = _build_block_offset_index(text_2d)
 
         matches: List[Dict[str, Any]] = []
         offset2coords = self._get_offset2coords_map()
@@ -2323,6 +2346,7 @@ class MainWindow(QMainWindow):
                 start_offset,
                 end_offset_exclusive,
                 text_2d,
+                block_index,
             )
             span_key = self._build_span_key_from_positions(start_pos, end_pos)
             if span_key in seen_spans:
@@ -2483,7 +2507,12 @@ class MainWindow(QMainWindow):
             span_key = self._build_span_key_from_positions(start_pos, end_pos)
             existing_entity_spans.add((normalized_entity_name, span_key))
 
-        from src.cli.detect_main import _convert_offsets_to_position
+        from src.cli.detect_main import (
+            _build_block_offset_index,
+            _convert_offsets_to_position,
+        )
+
+        block_index = _build_block_offset_index(text_2d)
 
         added_entity_spans = set()
         new_entities: List[Dict[str, Any]] = []
@@ -2505,6 +2534,7 @@ class MainWindow(QMainWindow):
                     start_offset,
                     end_offset_exclusive,
                     text_2d,
+                    block_index,
                 )
                 span_key = self._build_span_key_from_positions(start_pos, end_pos)
                 entity_span_key = (entity_name, span_key)
@@ -7,7 +7,11 @@ Phase 4: 編集UI
 - マウス操作によるページナビゲーション
 """
 
-from typing import Optional, List, Dict, Tuple
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Set, Tuple
 import fitz  # PyMuPDF
 from PyQt6.QtWidgets import (
     QWidget,
@@ -19,11 +23,55 @@ from PyQt6.QtWidgets import (
     QRadioButton,
     QButtonGroup,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QDragEnterEvent, QDropEvent
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QCloseEvent,
+    QColor,
+    QDragEnterEvent,
+    QDropEvent,
+    QImage,
+    QPainter,
+    QPen,
+    QPixmap,
+)
 
 from src.pdf.text_visibility import build_invisible_char_keys, is_invisible_char
 
+logger = logging.getLogger(__name__)
+
+# PyMuPDFはスレッドセーフではない（Documentを分けてもMuPDFのコンテキストは共有される）。
+# プレビューのfitz呼び出しは、GUIスレッド・描画ワーカーともにこのロック内で行う
+_FITZ_LOCK = threading.RLock()
+
+
+def _pixmap_to_qimage(pix: fitz.Pixmap) -> QImage:
+    """PyMuPDF Pixmapをデータを所有するQImageへ変換"""
+    # samples_mvはPixmapのバッファを直接参照するため、bytes化のコピーが発生しない
+    samples = pix.samples_mv
+    qimage = QImage(
+        samples,
+        pix.width,
+        pix.height,
+        pix.stride,
+        QImage.Format.Format_RGB888,
+    )
+    # Pixmapの寿命に依存しないよう、ここで一度だけ複製する
+    return qimage.copy()
+
+
+def _rasterize_page(pdf_path: str, page_num: int, scale: float) -> QImage:
+    """ワーカースレッドでページをラスタライズする
+
+    fitzの呼び出し（Pixmap・Documentの解放を含む）は_FITZ_LOCK内で直列化する。
+    QPixmapはGUIスレッド専用のため、ここではQImageまでを生成する。
+    """
+    with _FITZ_LOCK:
+        with fitz.open(pdf_path) as doc:
+            pix = doc[page_num].get_pixmap(matrix=fitz.Matrix(scale, scale))
+        qimage = _pixmap_to_qimage(pix)
+        del pix
+    return qimage
+
 
 class PDFPreviewWidget(QWidget):
     """PDFプレビュー表示ウィジェット"""
@@ -34,13 +82,21 @@ class PDFPreviewWidget(QWidget):
     text_selected = pyqtSignal(dict)  # テキストが選択された（手動PII追記用）
     pdf_file_dropped = pyqtSignal(str)  # ドロップされたPDFファイルパス
     preview_activated = pyqtSignal()  # プレビューがアクティブになった
+    # ワーカーからの描画完了通知（世代, ページ番号, 拡大率, QImage or None）
+    _page_rendered = pyqtSignal(int, int, float, object)
     SELECTION_MODE_TEXT = "text_drag"
     SELECTION_MODE_RECT = "rect_drag"
     SELECTION_MODE_CIRCLE = "circle_drag"
+    PAGE_PIXMAP_CACHE_SIZE = 8  # レンダリング済みページの保持数
+    PAGE_CHARS_CACHE_SIZE = 8  # 文字情報を保持するページ数
+    PREFETCH_MAX_PENDING = 2  # 先読みを追加する描画待ちの上限（連続ページ送りで溜めない）
+    ZOOM_RENDER_DELAY_MS = 120  # 連続ズーム操作をまとめる待機時間
+    RENDER_OVERSAMPLE = 2  # 表示倍率に対するレンダリング倍率（2倍で高解像度）
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.pdf_document: Optional[fitz.Document] = None
+        self._page_count: int = 0  # ページ数（判定のたびにfitzを呼ばないよう読み込み時に確定）
         self.current_page_num: int = 0
         self.highlighted_entities: List[Dict] = []  # ハイライト表示するエンティティ
         self.zoom_level: float = 0.75
@@ -50,9 +106,33 @@ class PDFPreviewWidget(QWidget):
         self.drag_start_pos: Optional[tuple] = None
         self.drag_current_pos: Optional[tuple] = None
         self.drag_start_char_index: Optional[int] = None
-        self._page_chars_cache: Dict[int, List[Dict]] = {}
+        # ページ番号 -> 文字情報（LRU、閲覧した全ページ分を保持し続けない）
+        self._page_chars_cache: "OrderedDict[int, List[Dict]]" = OrderedDict()
         self.selection_mode: str = self.SELECTION_MODE_TEXT
         self.search_highlight: Optional[Dict] = None
+        # (ページ番号, 拡大率) -> ハイライト描画前のページ画像（LRU）
+        self._page_pixmap_cache: "OrderedDict[Tuple[int, float], QPixmap]" = OrderedDict()
+        # 現在表示中のハイライト描画済み画像（ドラッグ中のオーバーレイ描画の下地）
+        self._composited_pixmap: Optional[QPixmap] = None
+        # ズーム連打時は最後の拡大率だけをレンダリングする
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.ZOOM_RENDER_DELAY_MS)
+        self._render_timer.timeout.connect(self.update_preview)
+        # ページのラスタライズはワーカースレッドで行う
+        self._render_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pdf-preview-render"
+        )
+        self._render_executor_closed: bool = False
+        # ウィジェット破棄時は待機中の描画を取り消す（破棄後のselfは参照しない）
+        executor = self._render_executor
+        self.destroyed.connect(
+            lambda _obj=None: executor.shutdown(wait=False, cancel_futures=True)
+        )
+        self._pdf_path: Optional[str] = None
+        self._render_generation: int = 0  # PDF切替で古い描画結果を破棄するための世代
+        self._pending_render_keys: Set[Tuple[int, float]] = set()
+        self._page_rendered.connect(self._on_page_rendered)
 
         self.init_ui()
 
@@ -188,14 +268,22 @@ class PDFPreviewWidget(QWidget):
     def load_pdf(self, pdf_path: str):
         """PDFファイルを読み込む"""
         try:
-            if self.pdf_document:
-                self.pdf_document.close()
-
-            self.pdf_document = fitz.open(pdf_path)
+            with _FITZ_LOCK:
+                if self.pdf_document is not None:
+                    self.pdf_document.close()
+                self.pdf_document = None
+                self._page_count = 0
+                self.pdf_document = fitz.open(pdf_path)
+                self._page_count = len(self.pdf_document)
+            self._pdf_path = str(pdf_path)
+            self._render_generation += 1
+            self._pending_render_keys.clear()
             self.current_page_num = 0
             self.highlighted_entities = []
             self.search_highlight = None
-            self._page_chars_cache = {}
+            self._page_chars_cache.clear()
+            self._page_pixmap_cache.clear()
+            self._composited_pixmap = None
             self.drag_start_char_index = None
             self.drag_start_pos = None
             self.drag_current_pos = None
@@ -206,50 +294,199 @@ class PDFPreviewWidget(QWidget):
         except Exception as e:
             self.preview_label.setText(f"PDFの読み込みに失敗: {str(e)}")
             self.pdf_document = None
+            self._page_count = 0
 
     def update_preview(self):
         """現在のページをプレビュー表示"""
-        if not self.pdf_document or self.current_page_num >= len(self.pdf_document):
+        self._render_timer.stop()
+        if self.pdf_document is None or self.current_page_num >= self._page_count:
             return
 
         try:
-            # ページを取得
-            page = self.pdf_document[self.current_page_num]
-
-            # ページをPixmapとしてレンダリング（拡大率適用）
-            mat = fitz.Matrix(self.zoom_level * 2, self.zoom_level * 2)  # 2倍で高解像度
-            pix = page.get_pixmap(matrix=mat)
-
-            # PyMuPDF PixmapをQImageに変換
-            img_format = QImage.Format.Format_RGB888
-            qimage = QImage(
-                pix.samples,
-                pix.width,
-                pix.height,
-                pix.stride,
-                img_format
-            )
-
-            # QPixmapに変換してラベルに設定
-            pixmap = QPixmap.fromImage(qimage)
+            key = self._page_cache_key(self.current_page_num)
+            pixmap = self._get_cached_page_pixmap(key)
+            if pixmap is None:
+                if self._request_page_render(self.current_page_num):
+                    # 描画完了までは直前の画像（別倍率があれば粗い拡縮版）を表示する
+                    self._composited_pixmap = None
+                    self._show_scaled_placeholder()
+                    self.update_page_label()
+                    return
+                pixmap = self._render_page_pixmap(self.current_page_num)
+                self._store_page_pixmap(key, pixmap)
 
             # ハイライト描画（該当ページのエンティティのみ）
+            # キャッシュ済みの元画像を汚さないよう複製へ描画する
             if self.highlighted_entities or self.search_highlight:
-                pixmap = self.draw_highlights(pixmap, page)
+                pixmap = self.draw_highlights(pixmap.copy(), None)
 
+            self._composited_pixmap = pixmap
             self.preview_label.setPixmap(pixmap)
             self.update_page_label()
+            self._prefetch_neighbor_pages()
 
         except Exception as e:
+            self._composited_pixmap = None
             self.preview_label.setText(f"プレビュー表示エラー: {str(e)}")
 
-    def draw_highlights(self, pixmap: QPixmap, page: fitz.Page) -> QPixmap:
-        """エンティティのハイライトを描画"""
+    @property
+    def page_count(self) -> int:
+        """読み込み中のPDFのページ数（未読み込みなら0）"""
+        return self._page_count
+
+    @property
+    def zoom_level(self) -> float:
+        """表示倍率"""
+        return self._zoom_level
+
+    @zoom_level.setter
+    def zoom_level(self, value: float):
+        # 座標変換のホットパスで毎回計算しないよう、スケールと逆数を倍率変更時に確定する
+        self._zoom_level = value
+        self._render_scale = value * self.RENDER_OVERSAMPLE
+        self._inv_render_scale = 1.0 / max(self._render_scale, 1e-6)
+        self._render_matrix = fitz.Matrix(self._render_scale, self._render_scale)
+
+    def _page_cache_key(self, page_num: int) -> Tuple[int, float]:
+        """ページ画像キャッシュのキー（ページ番号, 拡大率）"""
+        return page_num, round(self.zoom_level, 4)
+
+    def _get_cached_page_pixmap(self, key: Tuple[int, float]) -> Optional[QPixmap]:
+        """キャッシュ済みのページ画像を返す（ハイライトは含まない）"""
+        cached = self._page_pixmap_cache.get(key)
+        if cached is not None:
+            self._page_pixmap_cache.move_to_end(key)
+        return cached
+
+    def _store_page_pixmap(self, key: Tuple[int, float], pixmap: QPixmap):
+        """ページ画像をLRUキャッシュへ登録"""
+        self._page_pixmap_cache[key] = pixmap
+        self._page_pixmap_cache.move_to_end(key)
+        while len(self._page_pixmap_cache) > self.PAGE_PIXMAP_CACHE_SIZE:
+            self._page_pixmap_cache.popitem(last=False)
+
+    def _render_page_pixmap(self, page_num: int) -> QPixmap:
+        """GUIスレッドでページをレンダリング（非同期描画できない場合のフォールバック）"""
+        # ページをPixmapとしてレンダリング（拡大率適用）
+        with _FITZ_LOCK:
+            pix = self.pdf_document[page_num].get_pixmap(matrix=self._render_matrix)
+            qimage = _pixmap_to_qimage(pix)
+            del pix
+        return QPixmap.fromImage(qimage)
+
+    def _request_page_render(self, page_num: int) -> bool:
+        """ワーカーへページ描画を依頼する。依頼できない場合はFalse"""
+        if not self._pdf_path or self._render_executor_closed:
+            return False
+
+        key = self._page_cache_key(page_num)
+        if key in self._pending_render_keys:
+            return True
+
+        generation = self._render_generation
+        self._pending_render_keys.add(key)
+        future = self._render_executor.submit(
+            _rasterize_page, self._pdf_path, page_num, self._render_scale
+        )
+
+        def _notify(done_future):
+            if done_future.cancelled():
+                # ウィジェットを閉じたときに取り消された描画
+                qimage = None
+            else:
+                try:
+                    qimage = done_future.result()
+                except Exception as e:
+                    logger.warning(f"ページ描画エラー (ページ{page_num + 1}): {e}")
+                    qimage = None
+            try:
+                self._page_rendered.emit(generation, key[0], key[1], qimage)
+            except RuntimeError:
+                # ウィジェット破棄後の通知は無視
+                pass
+
+        future.add_done_callback(_notify)
+        return True
+
+    def _show_scaled_placeholder(self):
+        """同じページの別倍率キャッシュを高速拡縮し、描画完了までの仮表示にする"""
+        cached = None
+        for (page_num, _zoom_key), pixmap in reversed(self._page_pixmap_cache.items()):
+            if page_num == self.current_page_num:
+                cached = pixmap
+                break
+        if cached is None:
+            return
+
+        with _FITZ_LOCK:
+            page_rect = self.pdf_document[self.current_page_num].rect
+        target = (page_rect * self._render_matrix).irect
+        placeholder = cached.scaled(
+            target.width,
+            target.height,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+        if self.highlighted_entities or self.search_highlight:
+            placeholder = self.draw_highlights(placeholder, None)
+        self.preview_label.setPixmap(placeholder)
+
+    def _prefetch_neighbor_pages(self):
+        """前後のページをワーカーで先読みしてキャッシュへ載せる
+
+        ドラッグ中はGUIスレッドが文字情報の取得でfitzを使うため、
+        ワーカーとのロック待ちを増やさないよう先読みしない。
+        """
+        if self.is_dragging:
+            return
+        for page_num in (self.current_page_num + 1, self.current_page_num - 1):
+            if len(self._pending_render_keys) >= self.PREFETCH_MAX_PENDING:
+                return
+            if not 0 <= page_num < self._page_count:
+                continue
+            if self._page_cache_key(page_num) in self._page_pixmap_cache:
+                continue
+            if not self._request_page_render(page_num):
+                return
+
+    def _on_page_rendered(
+        self,
+        generation: int,
+        page_num: int,
+        zoom_key: float,
+        qimage: Optional[QImage],
+    ):
+        """ワーカーの描画結果をGUIスレッドで受け取りキャッシュへ反映"""
+        if generation != self._render_generation:
+            return
+
+        key = (page_num, zoom_key)
+        self._pending_render_keys.discard(key)
+        if qimage is None:
+            # 非同期描画に失敗した文書は以降GUIスレッドで描画する
+            self._pdf_path = None
+        else:
+            self._store_page_pixmap(key, QPixmap.fromImage(qimage))
+
+        if key == self._page_cache_key(self.current_page_num):
+            self.update_preview()
+
+    def _schedule_preview_update(self):
+        """プレビュー更新を遅延実行する（待機中の更新は置き換える）"""
+        self._render_timer.start()
+
+    def _flush_pending_preview_update(self):
+        """遅延中のプレビュー更新があれば即時に反映する"""
+        if self._render_timer.isActive():
+            self.update_preview()
+
+    def draw_highlights(self, pixmap: QPixmap, page: Optional[fitz.Page] = None) -> QPixmap:
+        """エンティティのハイライトを描画（pageは未使用、互換のため引数のみ残す）"""
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # スケール係数（レンダリング時の拡大率に合わせる）
-        scale = self.zoom_level * 2
+        scale = self._render_scale
 
         # エンティティタイプごとの色設定
         color_map = {
@@ -438,10 +675,10 @@ class PDFPreviewWidget(QWidget):
 
     def go_to_page(self, page_num: int):
         """指定ページに移動"""
-        if not self.pdf_document:
+        if self.pdf_document is None:
             return
 
-        if 0 <= page_num < len(self.pdf_document):
+        if 0 <= page_num < self._page_count:
             self.current_page_num = page_num
             self.update_preview()
             self.update_navigation_buttons()
@@ -454,25 +691,25 @@ class PDFPreviewWidget(QWidget):
 
     def next_page(self):
         """次のページに移動"""
-        if self.pdf_document and self.current_page_num < len(self.pdf_document) - 1:
+        if self.pdf_document is not None and self.current_page_num < self._page_count - 1:
             self.go_to_page(self.current_page_num + 1)
 
     def update_navigation_buttons(self):
         """ナビゲーションボタンの有効/無効を更新"""
-        if not self.pdf_document:
+        if self.pdf_document is None:
             self.prev_button.setEnabled(False)
             self.next_button.setEnabled(False)
             return
 
         self.prev_button.setEnabled(self.current_page_num > 0)
-        self.next_button.setEnabled(self.current_page_num < len(self.pdf_document) - 1)
+        self.next_button.setEnabled(self.current_page_num < self._page_count - 1)
 
     def update_page_label(self):
         """ページ番号ラベルを更新"""
-        if not self.pdf_document:
+        if self.pdf_document is None:
             self.page_label.setText("ページ: -/-")
         else:
-            total = len(self.pdf_document)
+            total = self._page_count
             current = self.current_page_num + 1
             self.page_label.setText(f"ページ: {current}/{total}")
 
@@ -483,18 +720,17 @@ class PDFPreviewWidget(QWidget):
 
     def _view_to_pdf(self, view_x: float, view_y: float) -> Tuple[float, float]:
         """ビュー座標をPDF座標へ変換"""
-        scale = max(self.zoom_level * 2, 1e-6)
-        return view_x / scale, view_y / scale
+        inv_scale = self._inv_render_scale
+        return view_x * inv_scale, view_y * inv_scale
 
     def _pdf_to_view(self, pdf_x: float, pdf_y: float) -> Tuple[float, float]:
         """PDF座標をビュー座標へ変換"""
-        scale = max(self.zoom_level * 2, 1e-6)
+        scale = self._render_scale
         return pdf_x * scale, pdf_y * scale
 
     def _get_hit_tolerance_pdf(self, tolerance_px: float = 14.0) -> float:
         """ヒット判定用の許容距離（PDF座標系）"""
-        scale = max(self.zoom_level * 2, 1e-6)
-        return tolerance_px / scale
+        return tolerance_px * self._inv_render_scale
 
     def _get_drag_clip_rect_pdf(self) -> Optional[fitz.Rect]:
         """現在ドラッグ中の範囲をPDF座標の矩形で返す"""
@@ -549,14 +785,17 @@ class PDFPreviewWidget(QWidget):
     def _get_page_chars(self, page_num: int) -> List[Dict]:
         """ページの文字情報（rawdict）をキャッシュ付きで取得"""
         if page_num in self._page_chars_cache:
+            self._page_chars_cache.move_to_end(page_num)
             return self._page_chars_cache[page_num]
 
-        if not self.pdf_document or page_num < 0 or page_num >= len(self.pdf_document):
+        if self.pdf_document is None or page_num < 0 or page_num >= self._page_count:
             return []
 
-        page = self.pdf_document[page_num]
-        rawdict = page.get_text("rawdict")
-        invisible_char_keys = build_invisible_char_keys(page)
+        with _FITZ_LOCK:
+            page = self.pdf_document[page_num]
+            rawdict = page.get_text("rawdict")
+            invisible_char_keys = build_invisible_char_keys(page)
+            del page
 
         chars: List[Dict] = []
         text_block_id = 0
@@ -590,6 +829,8 @@ class PDFPreviewWidget(QWidget):
             text_block_id += 1
 
         self._page_chars_cache[page_num] = chars
+        while len(self._page_chars_cache) > self.PAGE_CHARS_CACHE_SIZE:
+            self._page_chars_cache.popitem(last=False)
         return chars
 
     def _distance_sq_to_rect(self, x: float, y: float, rect: fitz.Rect) -> float:
@@ -646,7 +887,7 @@ class PDFPreviewWidget(QWidget):
         snap_nearest: bool = False,
     ) -> Optional[int]:
         """ドラッグ座標に対応する文字インデックスを返す"""
-        if not view_pos or not self.pdf_document:
+        if not view_pos or self.pdf_document is None:
             return None
 
         page_chars = self._get_page_chars(self.current_page_num)
@@ -893,6 +1134,9 @@ class PDFPreviewWidget(QWidget):
 
     def _on_preview_mouse_press(self, event):
         """プレビュー画像上のマウス押下（ドラッグ開始またはエンティティクリック）"""
+        # 座標変換が表示中の画像と一致するよう、保留中のズームを反映
+        self._flush_pending_preview_update()
+
         # ラベル内のPixmapオフセットを計算（中央揃えによるずれを補正）
         pixmap = self.preview_label.pixmap()
         if pixmap is None or pixmap.isNull():
@@ -1029,7 +1273,7 @@ class PDFPreviewWidget(QWidget):
 
         self.preview_label.setFocus(Qt.FocusReason.MouseFocusReason)
         self.preview_activated.emit()
-        scale = self.zoom_level * 2
+        scale = self._render_scale
 
         for i, entity in enumerate(self.highlighted_entities):
             entity_page = entity.get("page_num", entity.get("page", 0))
@@ -1056,17 +1300,16 @@ class PDFPreviewWidget(QWidget):
         if not self.drag_start_pos or not self.drag_current_pos:
             return
 
-        # 現在のプレビューを再描画
-        self.update_preview()
-
-        # 選択矩形を追加描画
-        pixmap = self.preview_label.pixmap()
-        if pixmap is None or pixmap.isNull():
+        # ハイライト描画済みの下地を再利用し、選択矩形のみを重ねる
+        if self._composited_pixmap is None:
+            self.update_preview()
+        if self._composited_pixmap is None or self._composited_pixmap.isNull():
             return
+        pixmap = self._composited_pixmap.copy()
 
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        scale = self.zoom_level * 2
+        scale = self._render_scale
         overlay_pen = QPen(QColor(0, 120, 215), 2, Qt.PenStyle.SolidLine)
         overlay_brush = QColor(0, 120, 215, 50)
 
@@ -1159,7 +1402,7 @@ class PDFPreviewWidget(QWidget):
 
     def _extract_selected_text(self):
         """選択範囲からテキストを抽出してシグナル発行"""
-        if not self.pdf_document or not self.drag_start_pos or not self.drag_current_pos:
+        if self.pdf_document is None or not self.drag_start_pos or not self.drag_current_pos:
             return
 
         try:
@@ -1252,12 +1495,11 @@ class PDFPreviewWidget(QWidget):
                 return
 
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"テキスト抽出エラー: {e}")
+            logger.warning(f"テキスト抽出エラー: {e}")
 
     def _is_text_hit(self, view_x: float, view_y: float) -> bool:
         """ビュー座標がテキスト領域上かを判定"""
-        if not self.pdf_document:
+        if self.pdf_document is None:
             return False
 
         try:
@@ -1289,7 +1531,7 @@ class PDFPreviewWidget(QWidget):
         else:
             next_percent = ((current_percent // 10) + 1) * 10
         self._set_zoom_percent(next_percent)
-        self.update_preview()
+        self._schedule_preview_update()
 
     def zoom_out(self):
         """ズームアウト"""
@@ -1299,31 +1541,45 @@ class PDFPreviewWidget(QWidget):
         else:
             next_percent = (current_percent // 10) * 10
         self._set_zoom_percent(next_percent)
-        self.update_preview()
+        self._schedule_preview_update()
 
     def zoom_fit(self):
         """ウィンドウ幅にフィット"""
-        if not self.pdf_document or self.current_page_num >= len(self.pdf_document):
+        if self.pdf_document is None or self.current_page_num >= self._page_count:
             return
-        page = self.pdf_document[self.current_page_num]
-        page_width = page.rect.width
+        with _FITZ_LOCK:
+            page_width = self.pdf_document[self.current_page_num].rect.width
         # scroll_areaの幅に合わせる（マージン分引く）
         available_width = self.scroll_area.viewport().width() - 20
         if page_width > 0 and available_width > 0:
             # 2倍レンダリングを考慮
-            self.zoom_level = available_width / (page_width * 2)
+            self.zoom_level = available_width / (page_width * self.RENDER_OVERSAMPLE)
             self.zoom_level = max(0.25, min(self.zoom_level, 4.0))
         else:
             self.zoom_level = 0.5
         self.zoom_label.setText(f"{self._current_zoom_percent()}%")
-        self.update_preview()
+        self._schedule_preview_update()
+
+    def closeEvent(self, event: QCloseEvent):
+        """ウィジェットを閉じたら待機中の先読み描画を取り消す（以降の描画はGUIスレッドで行う）"""
+        self._render_executor_closed = True
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
 
     def close_pdf(self):
         """PDFドキュメントを閉じる"""
-        if self.pdf_document:
-            self.pdf_document.close()
-            self.pdf_document = None
-            self._page_chars_cache = {}
+        self._render_timer.stop()
+        self._pdf_path = None
+        self._render_generation += 1
+        self._pending_render_keys.clear()
+        if self.pdf_document is not None:
+            with _FITZ_LOCK:
+                self.pdf_document.close()
+                self.pdf_document = None
+                self._page_count = 0
+            self._page_chars_cache.clear()
+            self._page_pixmap_cache.clear()
+            self._composited_pixmap = None
             self.drag_start_char_index = None
             self.drag_start_pos = None
             self.drag_current_pos = None
@@ -395,21 +395,22 @@ class ResultPanel(QWidget):
         """テーブル表示を更新（1始まりで表示）"""
         self._apply_sort()
         self._rebuild_visible_entities()
+        previous_row_count = self.results_table.rowCount()
         self.results_table.setRowCount(len(self._visible_entities) + 1)
 
         for i, entity in enumerate(self._visible_entities):
             # ページ番号（1始まりで表示）
             start_pos = entity.get("start", {})
             page_num = start_pos.get("page_num", 0) if isinstance(start_pos, dict) else 0
-            self.results_table.setItem(i + 1, 0, QTableWidgetItem(str(page_num + 1)))
+            self._set_cell_text(i + 1, 0, str(page_num + 1))
 
             # エンティティタイプ（日本語表示）
             entity_type = entity.get("entity", "")
-            self.results_table.setItem(i + 1, 1, QTableWidgetItem(get_entity_type_name_ja(entity_type)))
+            self._set_cell_text(i + 1, 1, get_entity_type_name_ja(entity_type))
 
             # テキスト
             text = entity.get("word", "")
-            self.results_table.setItem(i + 1, 2, QTableWidgetItem(text))
+            self._set_cell_text(i + 1, 2, text)
 
             # 位置情報（1始まりで表示）
             end_pos = entity.get("end", {})
@@ -419,15 +420,16 @@ class ResultPanel(QWidget):
                 position_str = f"p{page_num + 1}:b{block_num + 1}:{offset + 1}"
             else:
                 position_str = ""
-            self.results_table.setItem(i + 1, 3, QTableWidgetItem(position_str))
+            self._set_cell_text(i + 1, 3, position_str)
 
             # 検出元ラベル（手動／追加／自動）
             origin_label = self._get_origin_label(entity)
-            self.results_table.setItem(i + 1, 4, QTableWidgetItem(origin_label))
+            self._set_cell_text(i + 1, 4, origin_label)
 
-        # 垂直ヘッダー: row 0（フィルター行）は空、以降は 1, 2, 3...
-        v_labels = [""] + [str(i + 1) for i in range(len(self._visible_entities))]
-        self.results_table.setVerticalHeaderLabels(v_labels)
+        # 垂直ヘッダー: row 0（フィルター行）は空、以降は 1, 2, 3...（行数が変わった時だけ再設定）
+        if self.results_table.rowCount() != previous_row_count:
+            v_labels = [""] + [str(i + 1) for i in range(len(self._visible_entities))]
+            self.results_table.setVerticalHeaderLabels(v_labels)
 
         # カウント更新
         visible_count = len(self._visible_entities)
@@ -450,6 +452,14 @@ class ResultPanel(QWidget):
             )
             header.setSortIndicator(self._sort_column, order)
 
+    def _set_cell_text(self, row: int, column: int, text: str):
+        """セルの表示文字列が変わった場合のみ更新する（既存アイテムは再利用）"""
+        item = self.results_table.item(row, column)
+        if item is None:
+            self.results_table.setItem(row, column, QTableWidgetItem(text))
+        elif item.text() != text:
+            item.setText(text)
+
     def on_header_clicked(self, column: int):
         """ヘッダークリックでソート順を切り替える"""
         if self._sort_column == column:
@@ -6,6 +6,7 @@ PDFからの注釈読み取りと復元
 import logging
 import json
 import fitz  # PyMuPDF
+from collections import Counter
 from typing import List, Dict, Optional
 from datetime import datetime
 from pathlib import Path
@@ -13,9 +14,30 @@ from pathlib import Path
 from src.core.config_manager import ConfigManager
 from src.pdf.annotation_utils import parse_annotation_content
 
+try:
+    import orjson
+except ImportError:  # orjsonは任意依存（未導入なら標準のjsonで書き出す）
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_report(data: Dict) -> str:
+    """レポートをインデント付きJSON文字列に変換（orjsonがあれば高速に生成）
+
+    orjsonの出力は標準のjsonと文字列としては一致しない（1e-05は0.00001、NaN/Infinityはnull）。
+    orjsonが扱えない値（64bitを超える整数など）を含む場合は標準のjsonで書き出す。
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeErrorはTypeErrorのサブクラス
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 class PDFAnnotator:
     """PDFの注釈読み取りと復元を担当するクラス"""
 
@@ -142,9 +164,7 @@ class PDFAnnotator:
                     rects = [r for r in rects if r]
                     if rects:
                         # 複数クアッドの結合矩形
-                        union = rects[0]
-                        for r in rects[1:]:
-                            union = union | r
+                        union = self._union_rects(rects)
                         covered_text = self._extract_covered_text(union, page)
                 else:
                     # フォールバック：annot.rect（出力には含めない）
@@ -202,12 +222,12 @@ class PDFAnnotator:
         try:
             text_instances = page.get_text("words", clip=rect)
             if text_instances:
-                return " ".join([word[4] for word in text_instances])
+                return " ".join(word[4] for word in text_instances)
 
             expanded_rect = rect + (-5, -5, 5, 5)
             text_instances = page.get_text("words", clip=expanded_rect)
             return (
-                " ".join([word[4] for word in text_instances]) if text_instances else ""
+                " ".join(word[4] for word in text_instances) if text_instances else ""
             )
 
         except Exception as e:
@@ -296,9 +316,7 @@ class PDFAnnotator:
             rects = [self._rect_from_quad_list(q) for q in quads if isinstance(q, (list, tuple)) and len(q) == 8]
             rects = [r for r in rects if r]
             if rects:
-                rect = rects[0]
-                for r in rects[1:]:
-                    rect = rect | r
+                rect = self._union_rects(rects)
         if not rect:
             return False
 
@@ -333,6 +351,19 @@ class PDFAnnotator:
             logger.debug(f"クアッド矩形化エラー: {e}")
             return None
 
+    @staticmethod
+    def _union_rects(rects: List[fitz.Rect]) -> fitz.Rect:
+        """矩形群の外接矩形を1回の生成で求める（空矩形は `|` と同様に無視）"""
+        non_empty = [r for r in rects if not r.is_empty]
+        if not non_empty:
+            return rects[0]
+        return fitz.Rect(
+            min(r.x0 for r in non_empty),
+            min(r.y0 for r in non_empty),
+            max(r.x1 for r in non_empty),
+            max(r.y1 for r in non_empty),
+        )
+
     def _extract_color_from_report(
         self, color_info: Dict, color_type: str
     ) -> Optional[List[float]]:
@@ -363,20 +394,18 @@ class PDFAnnotator:
                 "pdf_file": pdf_path,
                 "scan_date": datetime.now().isoformat(),
                 "total_annotations": len(annotations),
-                "annotations_by_type": {},
-                "annotations_by_page": {},
+                "annotations_by_type": dict(
+                    Counter(a.get("annotation_type", "Unknown") for a in annotations)
+                ),
+                "annotations_by_page": dict(
+                    Counter(a.get("page_number", 1) for a in annotations)
+                ),
                 "annotations": annotations,
             }
 
-            for annot in annotations:
-                annot_type = annot.get("annotation_type", "Unknown")
-                report_data["annotations_by_type"][annot_type] = report_data["annotations_by_type"].get(annot_type, 0) + 1
-
-                page_num = annot.get("page_number", 1)
-                report_data["annotations_by_page"][page_num] = report_data["annotations_by_page"].get(page_num, 0) + 1
-
+            text = _dumps_report(report_data)
             with open(report_filename, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
+                f.write(text)
 
             logger.info(f"注釈レポートを生成: {report_filename}")
             return report_filename
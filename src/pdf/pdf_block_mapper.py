@@ -59,13 +59,12 @@ class PDFBlockTextMapper:
         # ページベースデータ構造
         self.page_blocks: List[List[BlockInfo]] = []  # page_num → [BlockInfo]
         self.page_block_texts: List[List[str]] = []  # page_num → [block_text]
-        self.char_positions: List[CharPosition] = []  # 全文字位置（インデックス用のみ）
+        self._page_block_char_bboxes: List[List[List[Optional[Tuple[float, float, float, float]]]]] = []  # page_num → page_block_id → [文字bbox]
         
-        # 高速検索用マッピング
-        self.page_block_offset_mapping: Dict[int, Dict[int, Dict[int, int]]] = {}  # page_num → page_block_id → {block_offset: char_positions index}
-        
-        # 空間インデックス（座標逆引き用）
-        self.spatial_grids: Dict[int, Dict[Tuple[int, int], List[int]]] = {}  # page_num → {(grid_x, grid_y): [char_indices]}
+        # 文字単位の構造（初回アクセス時に遅延構築）
+        self._char_positions: Optional[List[CharPosition]] = None  # 全文字位置（インデックス用のみ）
+        self._page_block_offset_mapping: Dict[int, Dict[int, Dict[int, int]]] = {}  # page_num → page_block_id → {block_offset: char_positions index}
+        self._spatial_grids: Dict[int, Dict[Tuple[int, int], List[int]]] = {}  # page_num → {(grid_x, grid_y): [char_indices]}
         self.grid_size = 50  # グリッドサイズ（ピクセル）
         
         # キャッシュ
@@ -93,39 +92,36 @@ class PDFBlockTextMapper:
         try:
             self.page_blocks.clear()
             self.page_block_texts.clear()
-            self.char_positions.clear()
-            
-            char_index = 0
+            self._page_block_char_bboxes.clear()
+            self._char_positions = None
             
             for page_num in range(len(self.pdf_document)):
                 page = self.pdf_document[page_num]
-                page_blocks_data = self._extract_page_blocks(page, page_num, char_index)
+                page_blocks_data = self._extract_page_blocks(page, page_num)
                 
                 # ページ別データ構築
                 page_block_infos = []
                 page_block_text_list = []
+                page_block_bbox_list = []
                 
-                for block_info, block_chars in page_blocks_data:
+                for block_info, block_char_bboxes in page_blocks_data:
                     page_block_infos.append(block_info)
                     page_block_text_list.append(block_info.text)
-                    self.char_positions.extend(block_chars)
-                    char_index += len(block_chars)
+                    page_block_bbox_list.append(block_char_bboxes)
                 
                 self.page_blocks.append(page_block_infos)
                 self.page_block_texts.append(page_block_text_list)
+                self._page_block_char_bboxes.append(page_block_bbox_list)
             
-            # マッピング構築
-            self._build_mappings()
-            
-            # 空間インデックス構築
-            if self.enable_spatial_index:
-                self._build_spatial_index()
+            # 文字位置・マッピング・空間インデックスは座標系APIの初回利用時に構築する
             
             # 統計更新
             total_blocks = sum(len(page_blocks) for page_blocks in self.page_blocks)
             self.stats.update({
                 "total_blocks": total_blocks,
-                "total_chars": len(self.char_positions),
+                "total_chars": sum(
+                    block.char_count for page_blocks in self.page_blocks for block in page_blocks
+                ),
                 "total_pages": len(self.pdf_document),
                 "processing_time": time.time() - start_time
             })
@@ -142,14 +138,13 @@ class PDFBlockTextMapper:
     def _extract_page_blocks(
         self, 
         page: fitz.Page, 
-        page_num: int, 
-        start_char_index: int
-    ) -> List[Tuple[BlockInfo, List[CharPosition]]]:
+        page_num: int
+    ) -> List[Tuple[BlockInfo, List[Optional[Tuple[float, float, float, float]]]]]:
         """
         単一ページからブロック情報を抽出
         
         Returns:
-            List[Tuple[BlockInfo, List[CharPosition]]]: (ブロック情報, 文字位置リスト) のペア
+            List[Tuple[BlockInfo, List[Optional[Tuple]]]]: (ブロック情報, 文字bboxリスト) のペア
         """
         page_blocks = []
         
@@ -157,16 +152,14 @@ class PDFBlockTextMapper:
             rawdict = page.get_text("rawdict")
             invisible_char_keys = build_invisible_char_keys(page)
             page_block_id = 0  # ページ内ブロックID（0から開始）
-            char_index = start_char_index
             
             for block_data in rawdict.get("blocks", []):
                 if "lines" not in block_data:
                     continue  # 画像ブロックなどをスキップ
                 
-                # ブロック内のテキストと文字位置を抽出
+                # ブロック内のテキストと文字bboxを抽出（CharPositionは必要になるまで作らない）
                 block_text_chars = []
-                block_char_positions = []
-                block_offset = 0
+                block_char_bboxes = []
                 
                 for line in block_data["lines"]:
                     for span in line.get("spans", []):
@@ -175,29 +168,13 @@ class PDFBlockTextMapper:
                         for char_info in chars:
                             if is_invisible_char(char_info, invisible_char_keys):
                                 continue
-                            char = char_info.get("c", "")
                             bbox = char_info.get("bbox")
-                            
-                            # 文字位置情報を作成
-                            char_pos = CharPosition(
-                                page_block_id=page_block_id,
-                                block_offset=block_offset,
-                                page_num=page_num,
-                                bbox=tuple(bbox) if bbox else None,
-                                character=char
-                            )
-                            
-                            block_text_chars.append(char)
-                            block_char_positions.append(char_pos)
-                            
-                            block_offset += 1
-                            char_index += 1
+                            block_text_chars.append(char_info.get("c", ""))
+                            block_char_bboxes.append(tuple(bbox) if bbox else None)
                 
                 block_text = "".join(block_text_chars)
                 if block_text and block_text.strip():
-                    visible_bboxes = [
-                        char_pos.bbox for char_pos in block_char_positions if char_pos.bbox
-                    ]
+                    visible_bboxes = [bbox for bbox in block_char_bboxes if bbox]
                     if visible_bboxes:
                         x0 = min(bbox[0] for bbox in visible_bboxes)
                         y0 = min(bbox[1] for bbox in visible_bboxes)
@@ -217,7 +194,7 @@ class PDFBlockTextMapper:
                         char_count=len(block_text_chars)
                     )
                     
-                    page_blocks.append((block_info, block_char_positions))
+                    page_blocks.append((block_info, block_char_bboxes))
                     page_block_id += 1
             
             return page_blocks
@@ -226,24 +203,71 @@ class PDFBlockTextMapper:
             logger.error(f"ページ{page_num}ブロック抽出エラー: {e}")
             return []
 
+    @property
+    def char_positions(self) -> List[CharPosition]:
+        """全文字位置（初回アクセス時に構築）"""
+        self._ensure_char_index()
+        return self._char_positions
+
+    @property
+    def page_block_offset_mapping(self) -> Dict[int, Dict[int, Dict[int, int]]]:
+        """page_num → page_block_id → {block_offset: char_positions index}（初回アクセス時に構築）"""
+        self._ensure_char_index()
+        return self._page_block_offset_mapping
+
+    @property
+    def spatial_grids(self) -> Dict[int, Dict[Tuple[int, int], List[int]]]:
+        """page_num → {(grid_x, grid_y): [char_indices]}（初回アクセス時に構築）"""
+        self._ensure_char_index()
+        return self._spatial_grids
+
+    def _ensure_char_index(self):
+        """文字位置・マッピング・空間インデックスを未構築なら構築"""
+        if self._char_positions is not None:
+            return
+        
+        char_positions: List[CharPosition] = []
+        for page_num, page_block_list in enumerate(self.page_blocks):
+            for block_info, block_char_bboxes in zip(
+                page_block_list, self._page_block_char_bboxes[page_num]
+            ):
+                for block_offset, (character, bbox) in enumerate(
+                    zip(block_info.text, block_char_bboxes)
+                ):
+                    char_positions.append(CharPosition(
+                        page_block_id=block_info.page_block_id,
+                        block_offset=block_offset,
+                        page_num=page_num,
+                        bbox=bbox,
+                        character=character
+                    ))
+        self._char_positions = char_positions
+        
+        # マッピング構築
+        self._build_mappings()
+        
+        # 空間インデックス構築
+        if self.enable_spatial_index:
+            self._build_spatial_index()
+
     def _build_mappings(self):
         """高速検索用マッピングを構築"""
         try:
-            self.page_block_offset_mapping.clear()
+            self._page_block_offset_mapping.clear()
             
-            for i, char_pos in enumerate(self.char_positions):
+            for i, char_pos in enumerate(self._char_positions):
                 page_num = char_pos.page_num
                 page_block_id = char_pos.page_block_id
                 
-                if page_num not in self.page_block_offset_mapping:
-                    self.page_block_offset_mapping[page_num] = {}
+                if page_num not in self._page_block_offset_mapping:
+                    self._page_block_offset_mapping[page_num] = {}
                 
-                if page_block_id not in self.page_block_offset_mapping[page_num]:
-                    self.page_block_offset_mapping[page_num][page_block_id] = {}
+                if page_block_id not in self._page_block_offset_mapping[page_num]:
+                    self._page_block_offset_mapping[page_num][page_block_id] = {}
                 
-                self.page_block_offset_mapping[page_num][page_block_id][char_pos.block_offset] = i
+                self._page_block_offset_mapping[page_num][page_block_id][char_pos.block_offset] = i
             
-            logger.debug(f"マッピング構築完了: {len(self.char_positions)}文字位置")
+            logger.debug(f"マッピング構築完了: {len(self._char_positions)}文字位置")
             
         except Exception as e:
             logger.error(f"マッピング構築エラー: {e}")
@@ -254,13 +278,13 @@ class PDFBlockTextMapper:
             logger.debug("空間インデックス構築開始")
             start_time = __import__('time').time()
             
-            self.spatial_grids.clear()
+            self._spatial_grids.clear()
             
             for page_num in range(len(self.page_blocks)):
-                self.spatial_grids[page_num] = {}
+                self._spatial_grids[page_num] = {}
                 
                 # ページ内の全文字を処理
-                for char_idx, char_pos in enumerate(self.char_positions):
+                for char_idx, char_pos in enumerate(self._char_positions):
                     if char_pos.page_num == page_num and char_pos.bbox:
                         bbox = char_pos.bbox
                         
@@ -268,9 +292,9 @@ class PDFBlockTextMapper:
                         grid_cells = self._get_grid_cells(bbox)
                         
                         for grid_cell in grid_cells:
-                            if grid_cell not in self.spatial_grids[page_num]:
-                                self.spatial_grids[page_num][grid_cell] = []
-                            self.spatial_grids[page_num][grid_cell].append(char_idx)
+                            if grid_cell not in self._spatial_grids[page_num]:
+                                self._spatial_grids[page_num][grid_cell] = []
+                            self._spatial_grids[page_num][grid_cell].append(char_idx)
             
             build_time = __import__('time').time() - start_time
             logger.debug(f"空間インデックス構築完了: {build_time:.3f}秒")
@@ -319,6 +343,22 @@ class PDFBlockTextMapper:
         """
         return [page_texts.copy() for page_texts in self.page_block_texts]
 
+    def get_page_block_char_bboxes(
+        self, page_num: int
+    ) -> List[List[Optional[Tuple[float, float, float, float]]]]:
+        """
+        指定ページのブロックごとの文字bboxリストを取得（CharPositionは作らない）
+        
+        Args:
+            page_num: ページ番号
+            
+        Returns:
+            List[List[Optional[Tuple]]]: page_block_id → [文字bbox]（各ブロックのリストは読み取り専用）
+        """
+        if 0 <= page_num < len(self._page_block_char_bboxes):
+            return self._page_block_char_bboxes[page_num].copy()
+        return []
+
     def get_page_block_info(self, page_num: int, page_block_id: int) -> Optional[BlockInfo]:
         """
         指定ページの指定ブロック情報を取得
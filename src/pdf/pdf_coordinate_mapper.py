@@ -192,8 +192,15 @@ class PDFCoordinateMapper:
             # 新しい座標マップを埋め込み
             doc.embfile_add(self.embedded_filename, json_data, filename=self.embedded_filename)
             
-            # PDFを保存
-            doc.save(output_pdf_path, garbage=4, deflate=True)
+            # PDFを保存（同一パスへの上書きは変更分のみ追記する増分保存）
+            if Path(output_pdf_path).resolve() == Path(input_pdf_path).resolve():
+                doc.save(
+                    output_pdf_path,
+                    incremental=True,
+                    encryption=fitz.PDF_ENCRYPT_KEEP,
+                )
+            else:
+                doc.save(output_pdf_path, garbage=4, deflate=True)
             doc.close()
             
             self.logger.info(f"座標マップを埋め込んだPDFを保存しました: {output_pdf_path}")
@@ -6,12 +6,274 @@ rawdictベースの高精度・高速文字座標マッピング
 """
 
 import logging
+import multiprocessing
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple, Union
 import fitz
+import numpy as np
 
 from src.pdf.text_visibility import build_invisible_char_keys, is_invisible_char
 
+try:
+    import numba
+except ImportError:  # numbaは任意依存（未導入ならNumPy実装を使う）
+    numba = None
+
 logger = logging.getLogger(__name__)
+
+# 座標キャッシュの保持件数の上限（古く参照されたものから破棄）
+COORDINATE_CACHE_MAX_ENTRIES = 4096
+# 並列抽出を行う最小ページ数（これ未満はプロセス起動の方が高くつく）
+PARALLEL_EXTRACTION_MIN_PAGES = 32
+
+
+# 文字ごとの情報を蓄積する列（文字ごとのdictは作らない）
+# 抽出時は1文字1タプルで積み、ページ単位でこの順に列へ転置する
+_CHAR_COLUMN_NAMES = (
+    "chars",  # 文字のコードポイント（ページごとにuint32配列へ詰める）
+    "bboxes",
+    "origins",
+    "pages",
+    "blocks",
+    "lines",
+    "spans",
+    "char_idx_in_span",
+    "style_ids",  # span_stylesのインデックス（改行は-1）
+)
+# 整数列はページごとにint32配列へ詰め、全ページ分のPythonオブジェクトを保持しない
+_INT_COLUMN_NAMES = frozenset(
+    ("pages", "blocks", "lines", "spans", "char_idx_in_span", "style_ids")
+)
+# 座標列はページごとにfloat64の2次元配列へ詰める（列名 -> 要素数、座標なしはNaN）
+_FLOAT_COLUMN_WIDTHS = {"bboxes": 4, "origins": 2}
+
+
+def _new_char_columns() -> Dict[str, List[Any]]:
+    """空の文字列データ（列名 -> Pythonリスト）を生成"""
+    return {name: [] for name in _CHAR_COLUMN_NAMES}
+
+
+def _coords_to_array(values: Tuple[Any, ...], width: int) -> np.ndarray:
+    """座標タプルの並びを (N, width) のfloat64配列へ変換（Noneの行はNaN）"""
+    nan_row = (np.nan,) * width
+    return np.array(
+        [nan_row if value is None else value for value in values], dtype=np.float64
+    ).reshape(len(values), width)
+
+
+def _chars_to_codes(chars: Tuple[str, ...]) -> np.ndarray:
+    """1文字ずつの文字列をコードポイント（uint32）配列へ一括変換"""
+    lengths = np.fromiter(map(len, chars), dtype=np.intp, count=len(chars))
+    if (lengths == 1).all():
+        encoded = "".join(chars).encode("utf-32-le", errors="surrogatepass")
+        return np.frombuffer(encoded, dtype=np.uint32)
+    # 空文字や複数コードポイントの文字が混ざる場合、それらは0として扱う
+    return np.fromiter(
+        (ord(char) if len(char) == 1 else 0 for char in chars),
+        dtype=np.uint32,
+        count=len(chars),
+    )
+
+
+def _codes_to_text(codes: np.ndarray) -> str:
+    """コードポイント配列を文字列へ戻す（1要素が1文字に対応）"""
+    return (
+        np.asarray(codes, dtype=np.uint32)
+        .tobytes()
+        .decode("utf-32-le", errors="surrogatepass")
+    )
+
+
+def _utf8_byte_length(codes: np.ndarray) -> int:
+    """コードポイント配列をUTF-8へエンコードした場合のバイト長（エンコードせずに算出）"""
+    return int(
+        len(codes)
+        + np.count_nonzero(codes >= 0x80)
+        + np.count_nonzero(codes >= 0x800)
+        + np.count_nonzero(codes >= 0x10000)
+    )
+
+
+def _array_to_coords(array: np.ndarray) -> List[Optional[Tuple[float, ...]]]:
+    """座標配列を従来形式のタプル（NaNの行はNone）のリストへ戻す"""
+    missing = np.isnan(array[:, 0]).tolist()
+    return [
+        None if is_missing else tuple(row)
+        for row, is_missing in zip(array.tolist(), missing)
+    ]
+
+
+def _sweep_line_bboxes(
+    bboxes: np.ndarray, line_ids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """行IDの並びを1回走査して行ごとの外接矩形へ集約（numba用）
+
+    Returns:
+        (行ごとのbbox配列, 各行の先頭要素インデックス)
+    """
+    count = bboxes.shape[0]
+    out_bboxes = np.empty((count, 4), dtype=np.float64)
+    seg_starts = np.empty(count, dtype=np.intp)
+    k = 0
+    for i in range(count):
+        if i == 0 or line_ids[i] != line_ids[i - 1]:
+            out_bboxes[k, 0] = bboxes[i, 0]
+            out_bboxes[k, 1] = bboxes[i, 1]
+            out_bboxes[k, 2] = bboxes[i, 2]
+            out_bboxes[k, 3] = bboxes[i, 3]
+            seg_starts[k] = i
+            k += 1
+        else:
+            j = k - 1
+            out_bboxes[j, 0] = min(out_bboxes[j, 0], bboxes[i, 0])
+            out_bboxes[j, 1] = min(out_bboxes[j, 1], bboxes[i, 1])
+            out_bboxes[j, 2] = max(out_bboxes[j, 2], bboxes[i, 2])
+            out_bboxes[j, 3] = max(out_bboxes[j, 3], bboxes[i, 3])
+    return out_bboxes[:k], seg_starts[:k]
+
+
+def _reduce_line_bboxes_numpy(
+    bboxes: np.ndarray, line_ids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """行IDの切り替わり位置で区切り、reduceatで行ごとの外接矩形を求める（NumPy実装）"""
+    seg_starts = np.concatenate(([0], np.flatnonzero(np.diff(line_ids)) + 1))
+    out_bboxes = np.empty((len(seg_starts), 4), dtype=np.float64)
+    out_bboxes[:, :2] = np.minimum.reduceat(bboxes[:, :2], seg_starts, axis=0)
+    out_bboxes[:, 2:] = np.maximum.reduceat(bboxes[:, 2:], seg_starts, axis=0)
+    return out_bboxes, seg_starts
+
+
+# numbaがあれば走査ループをJITコンパイルし、なければNumPy実装へフォールバック
+_group_line_bboxes = (
+    numba.njit(cache=True)(_sweep_line_bboxes)
+    if numba is not None
+    else _reduce_line_bboxes_numpy
+)
+
+
+def _extract_page(
+    page: fitz.Page,
+    page_num: int,
+    columns: Dict[str, List[Any]],
+    span_styles: List[Dict[str, Any]],
+    style_ids: Dict[Tuple[Any, ...], int],
+) -> str:
+    """
+    単一ページの処理（文字データは各列へ、未登録の書式はspan_stylesへ追記）
+
+    Returns:
+        ページのテキスト（行間の改行を含む）
+    """
+    span_styles_start = len(span_styles)
+    try:
+        invisible_char_keys = build_invisible_char_keys(page)
+        rawdict = page.get_text("rawdict")
+
+        # 1文字1タプル（_CHAR_COLUMN_NAMESの順）で積み、最後に列へ転置する
+        # ページのテキストは転置後の文字列から一括で組み立てる
+        rows = []
+        append_row = rows.append
+
+        for block_idx, block in enumerate(rawdict.get("blocks", [])):
+            if "lines" not in block:
+                continue  # 画像ブロックなどをスキップ
+
+            for line_idx, line in enumerate(block["lines"]):
+                line_chars_processed = False
+
+                for span_idx, span in enumerate(line.get("spans", [])):
+                    font = span.get("font")
+                    style_key = (
+                        sys.intern(font) if isinstance(font, str) else font,
+                        span.get("size"),
+                        span.get("flags"),
+                        span.get("color"),
+                    )
+                    style_id = style_ids.get(style_key)
+                    if style_id is None:
+                        style_id = style_ids[style_key] = len(span_styles)
+                        span_styles.append(
+                            dict(zip(("font", "size", "flags", "color"), style_key))
+                        )
+
+                    for char_idx_in_span, char_info in enumerate(span.get("chars", [])):
+                        if is_invisible_char(char_info, invisible_char_keys):
+                            continue
+                        char = char_info.get("c", "")
+                        bbox = char_info.get("bbox")
+
+                        append_row(
+                            (
+                                char,
+                                tuple(bbox) if bbox else None,
+                                char_info.get("origin"),
+                                page_num,
+                                block_idx,
+                                line_idx,
+                                span_idx,
+                                char_idx_in_span,
+                                style_id,
+                            )
+                        )
+                        line_chars_processed = True
+
+                # 行末処理（改行追加）
+                if line_chars_processed and line_idx < len(block["lines"]) - 1:
+                    # 行間の改行（最後の行以外、座標・書式情報なし、spanは-1）
+                    append_row(
+                        ("\n", None, None, page_num, block_idx, line_idx, -1, -1, -1)
+                    )
+
+        # ページ単位のrawdict（入れ子の辞書木）は次ページの展開前に解放する
+        del rawdict
+        if not rows:
+            return ""
+        page_text = ""
+        for name, values in zip(_CHAR_COLUMN_NAMES, zip(*rows)):
+            if name == "chars":
+                page_text = "".join(values)
+                columns[name].append(_chars_to_codes(values))
+            elif name in _FLOAT_COLUMN_WIDTHS:
+                columns[name].append(
+                    _coords_to_array(values, _FLOAT_COLUMN_WIDTHS[name])
+                )
+            else:
+                columns[name].append(np.array(values, dtype=np.int32))
+        return page_text
+
+    except Exception as e:
+        logger.error(f"ページ{page_num}処理エラー: {e}")
+        for style_key in [
+            key for key, idx in style_ids.items() if idx >= span_styles_start
+        ]:
+            del style_ids[style_key]
+        del span_styles[span_styles_start:]
+        return ""
+
+
+def _extract_page_range(
+    pdf_path: str, page_nums: List[int]
+) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]], List[str]]:
+    """ワーカープロセスでPDFを開き直し、連続したページ範囲を抽出"""
+    columns = _new_char_columns()
+    span_styles: List[Dict[str, Any]] = []
+    style_ids: Dict[Tuple[Any, ...], int] = {}
+    page_texts = []
+    with fitz.open(pdf_path) as doc:
+        for page_num in page_nums:
+            page_texts.append(
+                _extract_page(
+                    doc[page_num],
+                    page_num,
+                    columns,
+                    span_styles,
+                    style_ids,
+                )
+            )
+    return columns, span_styles, page_texts
 
 
 class PDFTextLocator:
@@ -25,32 +287,57 @@ class PDFTextLocator:
     - 後方互換性維持
     """
 
-    def __init__(self, pdf_document: fitz.Document, enable_cache: bool = True):
+    def __init__(
+        self,
+        pdf_document: fitz.Document,
+        enable_cache: bool = True,
+        max_cache_entries: int = COORDINATE_CACHE_MAX_ENTRIES,
+        extract_workers: Optional[int] = 1,
+    ):
         """
         初期化
 
         Args:
             pdf_document: PyMuPDFドキュメント
             enable_cache: キャッシュ有効化（大容量PDF対応）
+            max_cache_entries: 座標キャッシュの保持件数の上限（LRUで破棄）
+            extract_workers: ページ抽出のプロセス数（Noneならコア数、1なら逐次）
         """
         self.doc = pdf_document  # 後方互換性のため
         self.pdf_document = pdf_document
         self.enable_cache = enable_cache
-
-        # 主要データ構造
-        self.char_data: List[Dict[str, Any]] = []
+        self.max_cache_entries = max_cache_entries
+        self.extract_workers = extract_workers
+
+        # 主要データ構造（文字情報は列ごとに保持し、char_dataは参照時に生成）
+        self._columns: Dict[str, List[Any]] = _new_char_columns()
+        # 書式情報（font/size/flags/color）の重複なし一覧。文字・spanごとには複製しない
+        self._span_styles: List[Dict[str, Any]] = []
+        self._char_data_view: Optional[List[Dict[str, Any]]] = None
         self.full_text: str = ""
         self.full_text_no_newlines: str = ""
-
-        # マッピング構造（高速化用）
-        self.offset_to_char_mapping: Dict[int, int] = {}
-        self.char_to_offset_mapping: Dict[int, int] = {}
-        self.no_newlines_to_original: Dict[int, int] = {}  # 後方互換性
-
-        # キャッシュ
-        self._coordinate_cache: Dict[str, List[fitz.Rect]] = (
-            {} if enable_cache else None
-        )
+        # 改行なしテキストのUTF-8バイト長（解析時のチャンク判定で再エンコードを省く）
+        self.full_text_no_newlines_bytes: int = 0
+
+        # 座標検索用の列指向配列（文字列データと同じ並び）
+        self._bboxes: np.ndarray = np.empty((0, 4), dtype=np.float64)
+        self._has_bbox: np.ndarray = np.empty(0, dtype=bool)
+        self._pages: np.ndarray = np.empty(0, dtype=np.int32)
+        # 行ID（ページ・ブロック・行の組ごとに読み順で増える連番）
+        self._line_ids: np.ndarray = np.empty(0, dtype=np.int32)
+
+        # マッピング構造（連続整数の対応なのでdictではなく配列で保持）
+        # 改行なしオフセット -> 文字インデックス
+        self.no_newlines_to_original: np.ndarray = np.empty(0, dtype=np.intp)
+        # 文字インデックス -> 改行なしオフセット（改行は-1）
+        self._char_to_offset: np.ndarray = np.empty(0, dtype=np.intp)
+        self._offset_to_char_view: Optional[Dict[int, int]] = None
+        self._char_to_offset_view: Optional[Dict[int, int]] = None
+
+        # キャッシュ（LRU。参照されたエントリを末尾へ移す）
+        self._coordinate_cache: Optional[
+            "OrderedDict[Tuple[int, int], List[Dict]]"
+        ] = (OrderedDict() if enable_cache else None)
 
         # 統計情報
         self.stats = {"total_chars": 0, "total_pages": 0, "processing_time": 0.0}
@@ -58,6 +345,71 @@ class PDFTextLocator:
         # 初期化実行
         self._initialize()
 
+    @property
+    def char_data(self) -> List[Dict[str, Any]]:
+        """文字ごとの詳細情報（後方互換用、初回参照時に列データから生成）"""
+        if self._char_data_view is None:
+            self._char_data_view = self._build_char_data_view()
+        return self._char_data_view
+
+    @property
+    def offset_to_char_mapping(self) -> Dict[int, int]:
+        """改行なしオフセット -> 文字インデックス（後方互換用、参照時に配列から生成）"""
+        if self._offset_to_char_view is None:
+            self._offset_to_char_view = dict(
+                enumerate(self.no_newlines_to_original.tolist())
+            )
+        return self._offset_to_char_view
+
+    @property
+    def char_to_offset_mapping(self) -> Dict[int, int]:
+        """文字インデックス -> 改行なしオフセット（後方互換用、参照時に配列から生成）"""
+        if self._char_to_offset_view is None:
+            char_indices = self.no_newlines_to_original.tolist()
+            self._char_to_offset_view = dict(
+                zip(char_indices, range(len(char_indices)))
+            )
+        return self._char_to_offset_view
+
+    def _build_char_data_view(self) -> List[Dict[str, Any]]:
+        """列データから従来形式のchar_data（文字ごとのdict）を組み立てる"""
+        columns = self._columns
+        span_styles = self._span_styles
+        no_meta = {"font": None, "size": None, "flags": None, "color": None}
+        column_values = [
+            _codes_to_text(columns[name])
+            if name == "chars"
+            else _array_to_coords(columns[name])
+            if name in _FLOAT_COLUMN_WIDTHS
+            else columns[name].tolist()
+            for name in _CHAR_COLUMN_NAMES
+        ]
+        char_data = []
+        for idx, row in enumerate(zip(*column_values)):
+            char, bbox, origin, page, block, line, span, char_idx_in_span, style_id = row
+            meta = span_styles[style_id] if style_id >= 0 else no_meta
+            entry = {
+                "char": char,
+                "page_num": page,
+                "line_num": line,
+                "block_num": block,
+                "page": page,
+                "block": block,
+                "line": line,
+                "span": span,
+                "char_idx_in_span": char_idx_in_span,
+                "global_char_idx": idx,
+                "bbox": bbox,
+                "origin": origin,
+                "font": meta["font"],
+                "size": meta["size"],
+                "flags": meta["flags"],
+            }
+            if span != -1:  # 改行エントリには色情報を持たせない
+                entry["color"] = meta["color"]
+            char_data.append(entry)
+        return char_data
+
     def _initialize(self):
         """システム初期化：全ページの文字座標とテキストを同期構築"""
         import time
@@ -67,40 +419,19 @@ class PDFTextLocator:
         logger.debug("PDFTextLocator初期化開始")
 
         try:
-            self.char_data.clear()
-            full_text_parts = []
-            no_newlines_parts = []
-            char_index = 0
-
-            for page_num in range(len(self.pdf_document)):
-                page = self.pdf_document[page_num]
-                page_char_data, page_full_text, page_no_newlines = self._process_page(
-                    page, page_num, char_index
-                )
-
-                # 全体データに追加
-                self.char_data.extend(page_char_data)
-                full_text_parts.append(page_full_text)
-                no_newlines_parts.append(page_no_newlines)
+            page_count = len(self.pdf_document)
+            self._extract_text_and_chars()
 
-                char_index += len(page_char_data)
-
-                # ページ区切り（最後のページ以外）
-                if page_num < len(self.pdf_document) - 1:
-                    full_text_parts.append("\n")  # ページ改行
-
-            # 完全テキスト構築
-            self.full_text = "".join(full_text_parts)
-            self.full_text_no_newlines = "".join(no_newlines_parts)
-
-            # マッピング構築
+            # 座標配列・マッピング構築（改行なしテキストはページ区切りを含む改行を除くだけ）
+            self._build_coordinate_arrays()
+            self.full_text_no_newlines = self.full_text.replace("\n", "")
             self._build_offset_mappings()
 
             # 統計更新
             self.stats.update(
                 {
-                    "total_chars": len(self.char_data),
-                    "total_pages": len(self.pdf_document),
+                    "total_chars": len(self._columns["chars"]),
+                    "total_pages": page_count,
                     "processing_time": time.time() - start_time,
                 }
             )
@@ -113,128 +444,163 @@ class PDFTextLocator:
             logger.error(f"初期化エラー: {e}")
             raise
 
-    def _process_page(
-        self, page: fitz.Page, page_num: int, start_char_index: int
-    ) -> Tuple[List[Dict], str, str]:
-        """
-        単一ページの処理
-
-        Returns:
-            (char_data, full_text, no_newlines_text)
-        """
-        try:
-            rawdict = page.get_text("rawdict")
-            invisible_char_keys = build_invisible_char_keys(page)
-
-            page_char_data = []
-            full_text_chars = []
-            no_newlines_chars = []
+    def _extract_text_and_chars(self):
+        """全ページから文字列データと完全テキストを抽出"""
+        self._columns = _new_char_columns()
+        self._span_styles = []
+        self._char_data_view = None
+        page_count = len(self.pdf_document)
+        # 書式の組 -> span_stylesのインデックス（同じ書式のspanは1エントリを共有）
+        style_ids: Dict[Tuple[Any, ...], int] = {}
+
+        page_texts = None
+        workers = self._resolve_extract_workers(page_count)
+        if workers > 1:
+            try:
+                page_texts = self._extract_pages_in_processes(
+                    page_count, workers, style_ids
+                )
+            except Exception as e:
+                logger.warning(f"並列抽出に失敗したため逐次抽出します: {e}")
+                self._columns = _new_char_columns()
+                self._span_styles = []
+                style_ids.clear()
+
+        if page_texts is None:
+            # 1ページずつrawdictを展開し、文字データは直接列へ追記する
+            page_texts = [
+                self._process_page(
+                    page, page_num, self._columns, self._span_styles, style_ids
+                )
+                for page_num, page in enumerate(self.pdf_document)
+            ]
 
-            for block_idx, block in enumerate(rawdict.get("blocks", [])):
-                if "lines" not in block:
-                    continue  # 画像ブロックなどをスキップ
+        # ページごとの文字コード列・整数列・座標列を連結
+        chunks = self._columns["chars"]
+        self._columns["chars"] = (
+            np.concatenate(chunks) if chunks else np.empty(0, dtype=np.uint32)
+        )
+        for name in _INT_COLUMN_NAMES:
+            chunks = self._columns[name]
+            self._columns[name] = (
+                np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32)
+            )
+        for name, width in _FLOAT_COLUMN_WIDTHS.items():
+            chunks = self._columns[name]
+            self._columns[name] = (
+                np.concatenate(chunks)
+                if chunks
+                else np.empty((0, width), dtype=np.float64)
+            )
 
-                for line_idx, line in enumerate(block["lines"]):
-                    line_chars_processed = False
-
-                    for span_idx, span in enumerate(line.get("spans", [])):
-                        chars = span.get("chars", [])
-
-                        for char_idx_in_span, char_info in enumerate(chars):
-                            if is_invisible_char(char_info, invisible_char_keys):
-                                continue
-                            char = char_info.get("c", "")
-                            bbox = char_info.get("bbox")
-                            origin = char_info.get("origin")
-
-                            # 文字データ構築（後方互換性を考慮）
-                            char_data_entry = {
-                                "char": char,
-                                "rect": fitz.Rect(bbox) if bbox else None,
-                                "page_num": page_num,
-                                "line_num": line_idx,
-                                "block_num": block_idx,
-                                # 新しい詳細情報
-                                "page": page_num,
-                                "block": block_idx,
-                                "line": line_idx,
-                                "span": span_idx,
-                                "char_idx_in_span": char_idx_in_span,
-                                "global_char_idx": start_char_index
-                                + len(page_char_data),
-                                "bbox": bbox,
-                                "origin": origin,
-                                "font": span.get("font"),
-                                "size": span.get("size"),
-                                "flags": span.get("flags"),
-                                "color": span.get("color"),
-                            }
-
-                            page_char_data.append(char_data_entry)
-                            full_text_chars.append(char)
-
-                            # 改行なしテキスト用（改行・空白以外を追加）
-                            if char != "\n":
-                                no_newlines_chars.append(char)
-
-                            line_chars_processed = True
-
-                    # 行末処理（改行追加）
-                    if line_chars_processed and line_idx < len(block["lines"]) - 1:
-                        # 行間の改行（最後の行以外）
-                        newline_entry = {
-                            "char": "\n",
-                            "rect": None,
-                            "page_num": page_num,
-                            "line_num": line_idx,
-                            "block_num": block_idx,
-                            # 新しい詳細情報
-                            "page": page_num,
-                            "block": block_idx,
-                            "line": line_idx,
-                            "span": -1,  # 改行は特別なspan
-                            "char_idx_in_span": -1,
-                            "global_char_idx": start_char_index + len(page_char_data),
-                            "bbox": None,
-                            "origin": None,
-                            "font": None,
-                            "size": None,
-                            "flags": None,
-                        }
+        # 完全テキスト構築（ページ間は改行で区切る）
+        self.full_text = "\n".join(page_texts)
+
+    def _resolve_extract_workers(self, page_count: int) -> int:
+        """並列抽出のプロセス数を決定（ファイルから開き直せない場合は逐次）"""
+        workers = self.extract_workers or os.cpu_count() or 1
+        pdf_path = self.pdf_document.name
+        if (
+            workers <= 1
+            or page_count < PARALLEL_EXTRACTION_MIN_PAGES
+            or not pdf_path
+            or not os.path.isfile(pdf_path)
+            or self.pdf_document.is_dirty
+            or self.pdf_document.needs_pass
+        ):
+            return 1
+        return min(workers, page_count)
+
+    def _extract_pages_in_processes(
+        self, page_count: int, workers: int, style_ids: Dict[Tuple[Any, ...], int]
+    ) -> List[str]:
+        """
+        ページ範囲ごとに別プロセスで抽出し、ページ順に列データへ統合
 
-                        page_char_data.append(newline_entry)
-                        full_text_chars.append("\n")
-                        # no_newlines_charsには改行を追加しない
+        PyMuPDFは1プロセス内のスレッド並列に対応しないため、各ワーカーが
+        ファイルを開き直して処理する
+        """
+        page_ranges = [
+            chunk.tolist() for chunk in np.array_split(np.arange(page_count), workers)
+        ]
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = list(
+                executor.map(
+                    _extract_page_range,
+                    [self.pdf_document.name] * workers,
+                    page_ranges,
+                )
+            )
 
-            return page_char_data, "".join(full_text_chars), "".join(no_newlines_chars)
+        page_texts: List[str] = []
+        for columns, span_styles, range_texts in results:
+            # ワーカー内の書式インデックスを全体の書式表へ付け替える（末尾は改行の-1用）
+            remap = []
+            for style in span_styles:
+                style_key = tuple(style.values())
+                style_id = style_ids.get(style_key)
+                if style_id is None:
+                    style_id = style_ids[style_key] = len(self._span_styles)
+                    self._span_styles.append(style)
+                remap.append(style_id)
+            remap_array = np.array(remap + [-1], dtype=np.int32)
+            columns["style_ids"] = [remap_array[ids] for ids in columns["style_ids"]]
+            for name in _CHAR_COLUMN_NAMES:
+                self._columns[name].extend(columns[name])
+            page_texts.extend(range_texts)
+        return page_texts
 
-        except Exception as e:
-            logger.error(f"ページ{page_num}処理エラー: {e}")
-            return [], "", ""
+    def _process_page(
+        self,
+        page: fitz.Page,
+        page_num: int,
+        columns: Dict[str, List[Any]],
+        span_styles: List[Dict[str, Any]],
+        style_ids: Dict[Tuple[Any, ...], int],
+    ) -> str:
+        """単一ページの処理"""
+        return _extract_page(page, page_num, columns, span_styles, style_ids)
+
+    def _build_coordinate_arrays(self):
+        """文字列データから座標検索用のNumPy配列を構築"""
+        columns = self._columns
+        count = len(columns["chars"])
+        self._bboxes = columns["bboxes"]
+        self._has_bbox = ~np.isnan(self._bboxes[:, 0])
+        self._pages = np.asarray(columns["pages"], dtype=np.int32)
+
+        # 文字は読み順に並ぶため、同一行の文字は連続する。切り替わりごとにIDを進める
+        blocks = np.asarray(columns["blocks"], dtype=np.int32)
+        lines = np.asarray(columns["lines"], dtype=np.int32)
+        line_changed = (
+            (np.diff(self._pages) != 0) | (np.diff(blocks) != 0) | (np.diff(lines) != 0)
+        )
+        self._line_ids = np.zeros(count, dtype=np.int32)
+        np.cumsum(line_changed, out=self._line_ids[1:])
 
     def _build_offset_mappings(self):
         """オフセット間マッピングの構築"""
         try:
-            self.offset_to_char_mapping.clear()
-            self.char_to_offset_mapping.clear()
-            self.no_newlines_to_original.clear()
-
-            no_newlines_offset = 0
-
-            for char_data_idx, char_info in enumerate(self.char_data):
-                char = char_info["char"]
-
-                # 改行なしテキストのオフセットとchar_dataのマッピング
-                if char != "\n":
-                    self.offset_to_char_mapping[no_newlines_offset] = char_data_idx
-                    self.char_to_offset_mapping[char_data_idx] = no_newlines_offset
-                    self.no_newlines_to_original[no_newlines_offset] = (
-                        char_data_idx  # 後方互換性
-                    )
-                    no_newlines_offset += 1
+            # 改行以外の文字位置をコードポイントの比較で求め、両方向の対応を導く
+            is_text_char = self._columns["chars"] != ord("\n")
+            self.no_newlines_to_original = np.flatnonzero(is_text_char)
+            self._char_to_offset = np.where(
+                is_text_char, np.cumsum(is_text_char) - 1, -1
+            ).astype(np.intp, copy=False)
+            self._offset_to_char_view = None
+            self._char_to_offset_view = None
+            text_codes = self._columns["chars"][self.no_newlines_to_original]
+            if len(text_codes) == len(self.full_text_no_newlines) and text_codes.all():
+                self.full_text_no_newlines_bytes = _utf8_byte_length(text_codes)
+            else:
+                # 1行が1コードポイントに対応しない文字を含む場合は実際にエンコードする
+                self.full_text_no_newlines_bytes = len(
+                    self.full_text_no_newlines.encode("utf-8", errors="surrogatepass")
+                )
 
             logger.debug(
-                f"オフセットマッピング構築完了: {len(self.offset_to_char_mapping)}件"
+                f"オフセットマッピング構築完了: {len(self.no_newlines_to_original)}件"
             )
 
         except Exception as e:
@@ -255,10 +621,13 @@ class PDFTextLocator:
                        [{'rect': fitz.Rect, 'page_num': int}, ...]
         """
         try:
-            # キャッシュチェック
-            cache_key = f"{start_offset}_{end_offset}"
-            if self._coordinate_cache and cache_key in self._coordinate_cache:
-                return self._coordinate_cache[cache_key]
+            # キャッシュチェック（空辞書でも有効なため None と区別する）
+            cache_key = (start_offset, end_offset)
+            if self._coordinate_cache is not None:
+                cached = self._coordinate_cache.get(cache_key)
+                if cached is not None:
+                    self._coordinate_cache.move_to_end(cache_key)
+                    return cached
 
             # オフセット範囲の検証
             if start_offset < 0 or end_offset > len(self.full_text_no_newlines):
@@ -272,64 +641,58 @@ class PDFTextLocator:
                 return []
 
             # char_dataインデックス範囲を特定
-            start_char_idx = self.offset_to_char_mapping.get(start_offset)
-            end_char_idx = self.offset_to_char_mapping.get(
-                end_offset - 1
-            )  # 末尾は含まない
-
-            if start_char_idx is None or end_char_idx is None:
+            if end_offset > len(self.no_newlines_to_original):
                 logger.warning(
-                    f"char_dataマッピング失敗: start={start_char_idx}, end={end_char_idx}"
+                    f"char_dataマッピング失敗: オフセット{start_offset}-{end_offset}"
                 )
                 return []
+            start_char_idx = int(self.no_newlines_to_original[start_offset])
+            end_char_idx = int(
+                self.no_newlines_to_original[end_offset - 1]
+            )  # 末尾は含まない
 
-            # 対象文字の座標を収集
-            char_coords = []
-            for char_idx in range(start_char_idx, end_char_idx + 1):
-                if char_idx < len(self.char_data):
-                    char_info = self.char_data[char_idx]
-                    bbox = char_info.get("bbox")
-                    if bbox:
-                        char_coords.append(
-                            {
-                                "bbox": bbox,
-                                "page": char_info["page"],
-                                "block": char_info["block"],
-                                "line": char_info["line"],
-                                "char": char_info["char"],
-                            }
-                        )
-
-            if not char_coords:
+            # 座標を持つ文字だけを対象に、行の切り替わり位置で区切って矩形化
+            char_slice = slice(start_char_idx, end_char_idx + 1)
+            has_bbox = self._has_bbox[char_slice]
+            if not has_bbox.any():
                 logger.warning(f"座標取得失敗: オフセット{start_offset}-{end_offset}")
                 return []
 
-            # 行別にグループ化して矩形を作成
-            line_groups = {}
-            for coord in char_coords:
-                page = coord["page"]
-                block = coord["block"]
-                line = coord["line"]
-                key = (page, block, line)
-                if key not in line_groups:
-                    line_groups[key] = []
-                line_groups[key].append(coord["bbox"])
-
-            # 各行の境界矩形を計算
-            rects = []
-            for (page, _block, _line), bboxes in line_groups.items():
-                if bboxes:
-                    # 行内の全文字を囲む矩形を計算
-                    x0 = min(bbox[0] for bbox in bboxes)
-                    y0 = min(bbox[1] for bbox in bboxes)
-                    x1 = max(bbox[2] for bbox in bboxes)
-                    y1 = max(bbox[3] for bbox in bboxes)
-
-                    rects.append({"rect": fitz.Rect(x0, y0, x1, y1), "page_num": page})
+            bboxes = self._bboxes[char_slice]
+            pages = self._pages[char_slice]
+            line_ids = self._line_ids[char_slice]
+            # 改行（座標なし）を含む範囲だけ抽出コピーし、1行内のPIIはスライスのまま扱う
+            if not has_bbox.all():
+                bboxes = bboxes[has_bbox]
+                pages = pages[has_bbox]
+                line_ids = line_ids[has_bbox]
+
+            # 大半のPIIは1行に収まる。行IDは単調増加なので両端の比較だけで判定できる
+            if line_ids[0] == line_ids[-1]:
+                mins = bboxes[:, :2].min(axis=0)
+                maxs = bboxes[:, 2:].max(axis=0)
+                rects = [
+                    {
+                        "rect": fitz.Rect(*mins.tolist(), *maxs.tolist()),
+                        "page_num": int(pages[0]),
+                    }
+                ]
+            else:
+                line_bboxes, seg_starts = _group_line_bboxes(
+                    np.ascontiguousarray(bboxes), np.ascontiguousarray(line_ids)
+                )
+                rects = [
+                    {"rect": fitz.Rect(*line_bbox), "page_num": int(line_page)}
+                    for line_bbox, line_page in zip(
+                        line_bboxes.tolist(), pages[seg_starts].tolist()
+                    )
+                ]
 
             # キャッシュに保存
-            if self._coordinate_cache:
+            if self._coordinate_cache is not None:
                 self._coordinate_cache[cache_key] = rects
+                while len(self._coordinate_cache) > self.max_cache_entries:
+                    self._coordinate_cache.popitem(last=False)
 
             logger.debug(
                 f"座標特定成功: オフセット{start_offset}-{end_offset} -> {len(rects)}矩形"
@@ -342,6 +705,84 @@ class PDFTextLocator:
             )
             return []
 
+    def locate_pii_by_offset_no_newlines_batch(
+        self, ranges: Union[np.ndarray, List[Tuple[int, int]]]
+    ) -> List[List[Dict]]:
+        """
+        複数の改行なしオフセット範囲をまとめて座標矩形へ変換
+
+        Args:
+            ranges: (開始オフセット, 終了オフセット) の列（形状 [N, 2]）
+
+        Returns:
+            List[List[Dict]]: 範囲ごとの locate_pii_by_offset_no_newlines と同じ結果
+        """
+        ranges = np.asarray(ranges, dtype=np.intp).reshape(-1, 2)
+        results: List[List[Dict]] = [[] for _ in range(len(ranges))]
+        max_end = min(len(self.full_text_no_newlines), len(self.no_newlines_to_original))
+        starts, ends = ranges[:, 0], ranges[:, 1]
+        valid = (starts >= 0) & (ends <= max_end) & (starts < ends)
+        if not valid.all():
+            logger.warning(f"無効なオフセット範囲をスキップ: {int((~valid).sum())}件")
+
+        # キャッシュ済みの範囲を除き、残りを1回の配列処理で矩形化する
+        cache = self._coordinate_cache
+        pending = []
+        for range_idx in np.flatnonzero(valid).tolist():
+            cache_key = (int(starts[range_idx]), int(ends[range_idx]))
+            cached = cache.get(cache_key) if cache is not None else None
+            if cached is not None:
+                cache.move_to_end(cache_key)
+                results[range_idx] = cached
+            else:
+                pending.append(range_idx)
+        if not pending:
+            return results
+
+        pending_array = np.array(pending, dtype=np.intp)
+        char_starts = self.no_newlines_to_original[starts[pending_array]]
+        char_ends = self.no_newlines_to_original[ends[pending_array] - 1] + 1
+        lengths = char_ends - char_starts
+        # 各範囲の文字インデックスを連結し、範囲番号を並走させる
+        range_ids = np.repeat(np.arange(len(pending_array)), lengths)
+        char_indices = np.arange(int(lengths.sum())) + np.repeat(
+            char_starts - (np.cumsum(lengths) - lengths), lengths
+        )
+        has_bbox = self._has_bbox[char_indices]
+        char_indices = char_indices[has_bbox]
+        range_ids = range_ids[has_bbox]
+
+        if len(char_indices):
+            # 範囲または行が切り替わるたびに増えるグループIDを振り、行矩形の集約
+            # カーネル（numbaがあればJIT版）へ全範囲まとめて渡す
+            line_ids = self._line_ids[char_indices]
+            group_ids = np.zeros(len(char_indices), dtype=np.int32)
+            np.cumsum(
+                (np.diff(range_ids) != 0) | (np.diff(line_ids) != 0),
+                out=group_ids[1:],
+            )
+            line_bboxes, seg_starts = _group_line_bboxes(
+                np.ascontiguousarray(self._bboxes[char_indices]), group_ids
+            )
+            for range_id, (x0, y0, x1, y1), page in zip(
+                range_ids[seg_starts].tolist(),
+                line_bboxes.tolist(),
+                self._pages[char_indices[seg_starts]].tolist(),
+            ):
+                results[pending[range_id]].append(
+                    {"rect": fitz.Rect(x0, y0, x1, y1), "page_num": page}
+                )
+
+        if cache is not None:
+            for range_idx in pending:
+                if results[range_idx]:
+                    cache[(int(starts[range_idx]), int(ends[range_idx]))] = results[
+                        range_idx
+                    ]
+            while len(cache) > self.max_cache_entries:
+                cache.popitem(last=False)
+        return results
+
     def get_pii_line_rects(
         self, start_offset: int, end_offset: int
     ) -> List[Dict[str, Any]]:
@@ -398,57 +839,75 @@ class PDFTextLocator:
             List[Dict]: 各文字の詳細情報
         """
         try:
-            char_details = []
-
-            for offset in range(start_offset, end_offset):
-                char_data_idx = self.offset_to_char_mapping.get(offset)
-
-                if char_data_idx is not None and char_data_idx < len(self.char_data):
-                    char_info = self.char_data[char_data_idx]
-                    bbox = char_info.get("bbox")
-
-                    detail = {
-                        "char_index": offset - start_offset,
-                        "global_offset": offset,
-                        "char_data_offset": char_data_idx,
-                        "character": char_info["char"],
-                        "has_coordinates": bbox is not None,
-                        "bbox": bbox,
-                    }
+            columns = self._columns
+            text = self.full_text_no_newlines
+            offset_to_char = self.no_newlines_to_original
+            # マッピング可能なオフセット範囲は配列スライスで一括取得する
+            mapped_start = min(max(start_offset, 0), end_offset)
+            mapped_end = max(min(end_offset, len(offset_to_char)), mapped_start)
+            char_indices = offset_to_char[mapped_start:mapped_end]
+            bbox_array = self._bboxes[char_indices]
+            mapped_columns = zip(
+                range(mapped_start, mapped_end),
+                char_indices.tolist(),
+                _codes_to_text(columns["chars"][char_indices]),
+                self._has_bbox[char_indices].tolist(),
+                bbox_array.tolist(),
+                (bbox_array[:, 2] - bbox_array[:, 0]).tolist(),
+                (bbox_array[:, 3] - bbox_array[:, 1]).tolist(),
+                columns["pages"][char_indices].tolist(),
+                columns["lines"][char_indices].tolist(),
+                columns["blocks"][char_indices].tolist(),
+            )
 
-                    if bbox:
-                        detail.update(
-                            {
-                                "x0": float(bbox[0]),
-                                "y0": float(bbox[1]),
-                                "x1": float(bbox[2]),
-                                "y1": float(bbox[3]),
-                                "width": float(bbox[2] - bbox[0]),
-                                "height": float(bbox[3] - bbox[1]),
-                                "page": char_info.get("page", 0),
-                                "line": char_info.get("line", 0),
-                                "block": char_info.get("block", 0),
-                            }
-                        )
+            def _fallback(offset: int) -> Dict[str, Any]:
+                # マッピング失敗時のフォールバック
+                return {
+                    "char_index": offset - start_offset,
+                    "global_offset": offset,
+                    "char_data_offset": None,
+                    "character": text[offset] if offset < len(text) else "?",
+                    "has_coordinates": False,
+                    "bbox": None,
+                }
 
-                    char_details.append(detail)
-                else:
-                    # マッピング失敗時のフォールバック
-                    char = (
-                        self.full_text_no_newlines[offset]
-                        if offset < len(self.full_text_no_newlines)
-                        else "?"
-                    )
-                    char_details.append(
+            char_details = [_fallback(o) for o in range(start_offset, mapped_start)]
+            for (
+                offset,
+                char_idx,
+                character,
+                has_bbox,
+                coords,
+                width,
+                height,
+                page,
+                line,
+                block,
+            ) in mapped_columns:
+                detail = {
+                    "char_index": offset - start_offset,
+                    "global_offset": offset,
+                    "char_data_offset": char_idx,
+                    "character": character,
+                    "has_coordinates": has_bbox,
+                    "bbox": tuple(coords) if has_bbox else None,
+                }
+                if has_bbox:
+                    detail.update(
                         {
-                            "char_index": offset - start_offset,
-                            "global_offset": offset,
-                            "char_data_offset": None,
-                            "character": char,
-                            "has_coordinates": False,
-                            "bbox": None,
+                            "x0": coords[0],
+                            "y0": coords[1],
+                            "x1": coords[2],
+                            "y1": coords[3],
+                            "width": width,
+                            "height": height,
+                            "page": page,
+                            "line": line,
+                            "block": block,
                         }
                     )
+                char_details.append(detail)
+            char_details.extend(_fallback(o) for o in range(mapped_end, end_offset))
 
             return char_details
 
@@ -458,52 +917,55 @@ class PDFTextLocator:
 
     def clear_cache(self):
         """キャッシュクリア"""
-        if self._coordinate_cache:
+        if self._coordinate_cache is not None:
             self._coordinate_cache.clear()
             logger.debug("座標キャッシュをクリアしました")
 
     def get_stats(self) -> Dict[str, Any]:
         """統計情報取得"""
-        cache_size = len(self._coordinate_cache) if self._coordinate_cache else 0
+        cache_size = (
+            len(self._coordinate_cache) if self._coordinate_cache is not None else 0
+        )
 
         return {
             **self.stats,
             "cache_entries": cache_size,
             "full_text_length": len(self.full_text),
             "no_newlines_text_length": len(self.full_text_no_newlines),
-            "offset_mappings": len(self.offset_to_char_mapping),
+            "offset_mappings": len(self.no_newlines_to_original),
         }
 
     def validate_integrity(self) -> Dict[str, bool]:
         """データ整合性チェック"""
         try:
+            chars = self._columns["chars"]
             checks = {
-                "char_data_not_empty": len(self.char_data) > 0,
+                "char_data_not_empty": len(chars) > 0,
                 "full_text_not_empty": len(self.full_text) > 0,
                 "no_newlines_text_not_empty": len(self.full_text_no_newlines) > 0,
-                "offset_mapping_consistent": len(self.offset_to_char_mapping)
+                "offset_mapping_consistent": len(self.no_newlines_to_original)
                 == len(self.full_text_no_newlines),
-                "reverse_mapping_consistent": len(self.char_to_offset_mapping)
-                <= len(self.char_data),
+                "reverse_mapping_consistent": int((self._char_to_offset >= 0).sum())
+                <= len(chars),
             }
 
             # 詳細整合性チェック
             offset_check_passed = True
-            for offset, char_idx in list(self.offset_to_char_mapping.items())[
-                :10
-            ]:  # サンプルチェック
-                if char_idx >= len(self.char_data):
+            for offset, char_idx in enumerate(
+                self.no_newlines_to_original[:10].tolist()
+            ):  # サンプルチェック
+                if char_idx >= len(chars):
                     offset_check_passed = False
                     break
 
-                expected_char = (
-                    self.full_text_no_newlines[offset]
+                expected_code = (
+                    ord(self.full_text_no_newlines[offset])
                     if offset < len(self.full_text_no_newlines)
                     else None
                 )
-                actual_char = self.char_data[char_idx]["char"]
+                actual_code = int(chars[char_idx])
 
-                if expected_char != actual_char:
+                if expected_code != actual_code:
                     offset_check_passed = False
                     break
 
@@ -3,15 +3,20 @@
 """
 PDFへのマスキング（注釈・ハイライト）適用
 """
+import functools
 import logging
+import math
+import os
 import shutil
 import fitz  # PyMuPDF
-from typing import List, Dict, Optional
+import numpy as np
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 from src.core.config_manager import ConfigManager
 from src.core.entity_types import (
     get_annotation_color,
+    get_annotation_fill_color,
     get_highlight_color,
     get_entity_type_name_ja,
 )
@@ -19,6 +24,46 @@ from src.pdf.annotation_utils import parse_annotation_content
 
 logger = logging.getLogger(__name__)
 
+def _copy_pdf_file(src: str, dst: str) -> None:
+    """PDFを複製（メタデータは複製しない）
+
+    os.copy_file_rangeが使えればカーネル内でコピーする（CoWファイルシステムではreflink）。
+    使えない・失敗した場合はshutil.copyfileで複製する。
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError as e:
+            logger.debug(f"copy_file_rangeでの複製に失敗したためcopyfileで複製: {e}")
+    shutil.copyfile(src, dst)
+
+
+@functools.lru_cache(maxsize=64)
+def _annotation_content_for(entity_type: str, text_display_mode: str) -> str:
+    """エンティティタイプと表示モードだけで決まる注釈内容（テキスト併記分を除く）"""
+    if text_display_mode == "silent":
+        return ""
+    type_name = get_entity_type_name_ja(entity_type)
+    if text_display_mode == "minimal":
+        return type_name
+    return f"【個人情報】{type_name}"
+
+
+# 既存注釈の重複判定用グリッド: ページ番号 -> (x0セル, y0セル) -> 注釈/ハイライト
+DuplicateIndex = Dict[int, Dict[Tuple[int, int], List[Dict]]]
+
 
 class PDFMasker:
     """PDFへのマスキング処理を担当するクラス"""
@@ -38,7 +83,7 @@ class PDFMasker:
         try:
             operation_mode = self.config_manager.get_operation_mode()
 
-            shutil.copy2(pdf_path, output_path)
+            _copy_pdf_file(pdf_path, output_path)
 
             if masking_method == "annotation":
                 return self._apply_annotation_masking_with_mode(
@@ -49,18 +94,15 @@ class PDFMasker:
                     output_path, entities, operation_mode
                 )
             elif masking_method == "both":
-                self._apply_highlight_masking_with_mode(
+                return self._apply_combined_masking_with_mode(
                     output_path, entities, operation_mode
                 )
-                return self._apply_annotation_masking_with_mode(
-                    output_path, entities, "append"
-                )
             else:
                 raise ValueError(f"未対応のマスキング方式: {masking_method}")
 
         except Exception as e:
             logger.error(f"マスキング適用エラー: {e}")
-            shutil.copy2(pdf_path, output_path)
+            _copy_pdf_file(pdf_path, output_path)
             logger.warning(
                 "マスキング処理に失敗しました。元のファイルをコピーしました。"
             )
@@ -87,63 +129,7 @@ class PDFMasker:
 
         try:
             doc = fitz.open(pdf_path)
-
-            if operation_mode == "clear_all":
-                self._clear_all_annotations(doc)
-                logger.info("既存の全注釈を削除しました")
-            elif operation_mode == "reset_and_append":
-                self._clear_all_annotations(doc)
-                logger.info("既存の全注釈を削除しました（リセット後追加モード）")
-
-            existing_annotations = []
-            if self.config_manager.should_remove_identical_annotations():
-                existing_annotations = self._get_existing_annotations(doc)
-
-            annotations_added = 0
-
-            for entity in entities:
-                # 複数行に対応するため、line_rectsを優先的に使用
-                rects_to_annotate = entity.get("line_rects", [])
-                if not rects_to_annotate:
-                    # line_rectsがない場合は従来のcoordinatesを使用
-                    coords = entity.get("coordinates", {})
-                    page_num = coords.get("page_number", 1) - 1
-                    if page_num >= len(doc):
-                        continue
-
-                    x0, y0, x1, y1 = (
-                        float(coords.get("x0", 0)),
-                        float(coords.get("y0", 0)),
-                        float(coords.get("x1", 0)),
-                        float(coords.get("y1", 0)),
-                    )
-                    if x0 >= x1 or y0 >= y1:
-                        continue
-                    rect = fitz.Rect(x0, y0, x1, y1)
-                    if rect.is_empty or rect.is_infinite:
-                        continue
-                    rects_to_annotate = [{"rect": rect, "page_num": page_num}]
-
-                for rect_info in rects_to_annotate:
-                    rect = rect_info.get("rect")
-                    page_num = rect_info.get("page_num")
-                    if not isinstance(
-                        rect, fitz.Rect
-                    ):  # 辞書からRectオブジェクトへ変換
-                        rect = fitz.Rect(rect["x0"], rect["y0"], rect["x1"], rect["y1"])
-
-                    if self._is_duplicate_rect(
-                        rect, entity, existing_annotations, page_num,
-                        check_entity_type=True,
-                    ):
-                        logger.debug(
-                            f"重複注釈をスキップ: {entity['text']} ({entity['entity_type']})"
-                        )
-                        continue
-
-                    page = doc[page_num]
-                    self._add_single_annotation(page, rect, entity)
-                    annotations_added += 1
+            annotations_added = self._add_annotations(doc, entities, operation_mode)
 
             doc.save(pdf_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
             doc.close()
@@ -167,113 +153,306 @@ class PDFMasker:
 
         try:
             doc = fitz.open(pdf_path)
+            highlights_added = self._add_highlights(doc, entities, operation_mode)
 
-            if operation_mode == "clear_all":
-                self._clear_all_highlights(doc)
-                logger.info("既存の全ハイライトを削除しました")
-            elif operation_mode == "reset_and_append":
-                self._clear_all_highlights(doc)
-                logger.info("既存の全ハイライトを削除しました（リセット後追加モード）")
+            doc.save(pdf_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            doc.close()
 
-            existing_highlights = []
-            if self.config_manager.should_remove_identical_annotations():
-                existing_highlights = self._get_existing_highlights(doc)
+            logger.info(
+                f"ハイライトマスキング完了: {pdf_path} ({highlights_added}件のハイライトを追加)"
+            )
+            return pdf_path
 
-            highlights_added = 0
+        except Exception as e:
+            logger.error(f"ハイライトマスキングエラー: {e}")
+            raise
 
-            for entity in entities:
-                rects_to_highlight = entity.get("line_rects", [])
-                join_as_quads = bool(entity.get("join_as_quads"))
-                if not rects_to_highlight:
-                    coords = entity.get("coordinates", {})
-                    page_num = coords.get("page_number", 1) - 1
-                    if page_num >= len(doc):
-                        continue
+    def _apply_combined_masking_with_mode(
+        self, pdf_path: str, entities: List[Dict], operation_mode: str
+    ) -> str:
+        """ハイライトと注釈を1回の読み込み・保存で適用（操作モードはハイライトに適用し、注釈は追加）"""
+        logger.info(
+            f"ハイライト・注釈マスキング適用中: {pdf_path} (モード: {operation_mode})"
+        )
 
-                    x0, y0, x1, y1 = (
-                        float(coords.get("x0", 0)),
-                        float(coords.get("y0", 0)),
-                        float(coords.get("x1", 0)),
-                        float(coords.get("y1", 0)),
-                    )
-                    if x0 >= x1 or y0 >= y1:
-                        continue
-                    rect = fitz.Rect(x0, y0, x1, y1)
-                    if rect.is_empty or rect.is_infinite:
-                        continue
-                    rects_to_highlight = [{"rect": rect, "page_num": page_num}]
-
-                if join_as_quads and rects_to_highlight:
-                    # ページごとにまとめてクアッド注釈を1つ作成
-                    page_groups: Dict[int, List[fitz.Quad]] = {}
-                    for rect_info in rects_to_highlight:
-                        pnum = int(rect_info.get("page_num"))
-                        page = doc[pnum]
-                        rdict = rect_info.get("rect") or {}
-                        try:
-                            x0 = float(rdict["x0"]); y0 = float(rdict["y0"])
-                            x1 = float(rdict["x1"]); y1 = float(rdict["y1"])
-                        except Exception:
-                            continue
-                        r = fitz.Rect(x0, y0, x1, y1) & page.rect
-                        if (not r) or r.width <= 0 or r.height <= 0:
-                            continue
-                        q = fitz.Quad(fitz.Point(r.x0, r.y0), fitz.Point(r.x1, r.y0), fitz.Point(r.x0, r.y1), fitz.Point(r.x1, r.y1))
-                        page_groups.setdefault(pnum, []).append(q)
-
-                    for pnum, quads in page_groups.items():
-                        if not quads:
-                            continue
-                        page = doc[pnum]
-                        # join_as_quads指定時は既存重複チェックをスキップ（マルチクアッドで一体表示のため）
-                        self._add_single_highlight(page, quads, entity)
-                        highlights_added += 1
-                else:
-                    # 既存ロジック：1行=1注釈
-                    for rect_info in rects_to_highlight:
-                        page_num = int(rect_info.get("page_num"))
-                        page = doc[page_num]
-                        space = rect_info.get("coord_space") or rect_info.get("space") or "fitz"
-                        rdict = rect_info.get("rect") or {}
-                        try:
-                            x0 = float(rdict["x0"]); y0 = float(rdict["y0"])
-                            x1 = float(rdict["x1"]); y1 = float(rdict["y1"])
-                        except Exception:
-                            continue  # 値が欠けている / 数値化できない
-                        r = fitz.Rect(x0, y0, x1, y1)
-                        if space == "pdf":
-                            ph = page.rect.height
-                            r = fitz.Rect(r.x0, ph - r.y1, r.x1, ph - r.y0)  # Y反転
-                        r = r & page.rect
-                        if (not r) or r.width <= 0 or r.height <= 0:
-                            continue
-                        if self._is_duplicate_rect(r, entity, existing_highlights, page_num):
-                            continue
-                        self._add_single_highlight(page, r, entity)
-                        highlights_added += 1
+        try:
+            doc = fitz.open(pdf_path)
+            # ハイライトを操作モードに従って削除した後、既存の注釈・ハイライトを1回の走査で収集
+            self._clear_for_mode(doc, operation_mode, highlight=True)
+            existing_highlights: List[Dict] = []
+            existing_annotations: List[Dict] = []
+            if self.config_manager.should_remove_identical_annotations():
+                existing_highlights, existing_annotations = self._scan_existing_items(doc)
+            highlights_added = self._add_highlights(
+                doc, entities, "append", existing_items=existing_highlights
+            )
+            annotations_added = self._add_annotations(
+                doc, entities, "append", existing_items=existing_annotations
+            )
 
             doc.save(pdf_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
             doc.close()
 
             logger.info(
-                f"ハイライトマスキング完了: {pdf_path} ({highlights_added}件のハイライトを追加)"
+                f"ハイライト・注釈マスキング完了: {pdf_path} "
+                f"({highlights_added}件のハイライト、{annotations_added}件の注釈を追加)"
             )
             return pdf_path
 
         except Exception as e:
-            logger.error(f"ハイライトマスキングエラー: {e}")
+            logger.error(f"ハイライト・注釈マスキングエラー: {e}")
             raise
 
-    def _add_single_annotation(self, page: fitz.Page, rect: fitz.Rect, entity: Dict):
+    def _add_annotations(
+        self,
+        doc: fitz.Document,
+        entities: List[Dict],
+        operation_mode: str,
+        existing_items: Optional[List[Dict]] = None,
+    ) -> int:
+        """開いているドキュメントへ注釈を追加し、追加件数を返す
+
+        existing_itemsを渡した場合は既存注釈の再走査を省略する
+        """
+        self._clear_for_mode(doc, operation_mode, highlight=False)
+
+        # 重複除去が無効なら既存注釈の収集も重複判定も行わない
+        dedup_enabled = self.config_manager.should_remove_identical_annotations()
+        existing_annotations = existing_items
+        if existing_annotations is None:
+            existing_annotations = (
+                self._get_existing_annotations(doc) if dedup_enabled else []
+            )
+        # 設定値は注釈ごとに引かず、実行単位で一度だけ読み込む
+        tolerance = self.config_manager.get_annotation_comparison_tolerance()
+        cell_size = self._duplicate_cell_size(tolerance)
+        existing_index = self._build_duplicate_index(existing_annotations, cell_size)
+        text_display_mode = self.config_manager.get_masking_text_display_mode()
+        include_text = bool(
+            self.config_manager.get_pdf_annotation_settings().get("include_text", False)
+        )
+
+        annotations_added = 0
+        fallback_rects = self._coordinate_fallback_rects(entities, len(doc))
+
+        for entity, fallback_rect in zip(entities, fallback_rects):
+            # 複数行に対応するため、line_rectsを優先的に使用
+            rects_to_annotate = entity.get("line_rects", [])
+            if not rects_to_annotate:
+                # line_rectsがない場合は従来のcoordinatesを使用
+                if fallback_rect is None:
+                    continue
+                rects_to_annotate = [fallback_rect]
+
+            for rect_info in rects_to_annotate:
+                rect = rect_info.get("rect")
+                page_num = rect_info.get("page_num")
+                if not isinstance(
+                    rect, fitz.Rect
+                ):  # 辞書からRectオブジェクトへ変換
+                    rect = fitz.Rect(rect["x0"], rect["y0"], rect["x1"], rect["y1"])
+
+                if dedup_enabled and self._is_duplicate_rect(
+                    rect, entity,
+                    self._duplicate_candidates(
+                        existing_index, page_num, rect, cell_size
+                    ),
+                    page_num,
+                    check_entity_type=True,
+                    tolerance=tolerance,
+                ):
+                    logger.debug(
+                        f"重複注釈をスキップ: {entity['text']} ({entity['entity_type']})"
+                    )
+                    continue
+
+                page = doc[page_num]
+                self._add_single_annotation(
+                    page, rect, entity, text_display_mode, include_text
+                )
+                annotations_added += 1
+
+        return annotations_added
+
+    def _add_highlights(
+        self,
+        doc: fitz.Document,
+        entities: List[Dict],
+        operation_mode: str,
+        existing_items: Optional[List[Dict]] = None,
+    ) -> int:
+        """開いているドキュメントへハイライトを追加し、追加件数を返す
+
+        existing_itemsを渡した場合は既存ハイライトの再走査を省略する
+        """
+        self._clear_for_mode(doc, operation_mode, highlight=True)
+
+        dedup_enabled = self.config_manager.should_remove_identical_annotations()
+        existing_highlights = existing_items
+        if existing_highlights is None:
+            existing_highlights = (
+                self._get_existing_highlights(doc) if dedup_enabled else []
+            )
+        tolerance = self.config_manager.get_annotation_comparison_tolerance()
+        cell_size = self._duplicate_cell_size(tolerance)
+        existing_index = self._build_duplicate_index(existing_highlights, cell_size)
+
+        highlights_added = 0
+        fallback_rects = self._coordinate_fallback_rects(entities, len(doc))
+
+        for entity, fallback_rect in zip(entities, fallback_rects):
+            rects_to_highlight = entity.get("line_rects", [])
+            join_as_quads = bool(entity.get("join_as_quads"))
+            if not rects_to_highlight:
+                if fallback_rect is None:
+                    continue
+                rects_to_highlight = [fallback_rect]
+
+            if join_as_quads and rects_to_highlight:
+                # ページごとにまとめてクアッド注釈を1つ作成
+                page_groups: Dict[int, List[fitz.Quad]] = {}
+                for rect_info in rects_to_highlight:
+                    pnum = int(rect_info.get("page_num"))
+                    page = doc[pnum]
+                    rdict = rect_info.get("rect") or {}
+                    try:
+                        x0 = float(rdict["x0"]); y0 = float(rdict["y0"])
+                        x1 = float(rdict["x1"]); y1 = float(rdict["y1"])
+                    except Exception:
+                        continue
+                    r = fitz.Rect(x0, y0, x1, y1) & page.rect
+                    if (not r) or r.width <= 0 or r.height <= 0:
+                        continue
+                    q = fitz.Quad(fitz.Point(r.x0, r.y0), fitz.Point(r.x1, r.y0), fitz.Point(r.x0, r.y1), fitz.Point(r.x1, r.y1))
+                    page_groups.setdefault(pnum, []).append(q)
+
+                for pnum, quads in page_groups.items():
+                    if not quads:
+                        continue
+                    page = doc[pnum]
+                    # join_as_quads指定時は既存重複チェックをスキップ（マルチクアッドで一体表示のため）
+                    self._add_single_highlight(page, quads, entity)
+                    highlights_added += 1
+            else:
+                # 既存ロジック：1行=1注釈
+                for rect_info in rects_to_highlight:
+                    page_num = int(rect_info.get("page_num"))
+                    page = doc[page_num]
+                    space = rect_info.get("coord_space") or rect_info.get("space") or "fitz"
+                    rdict = rect_info.get("rect") or {}
+                    try:
+                        x0 = float(rdict["x0"]); y0 = float(rdict["y0"])
+                        x1 = float(rdict["x1"]); y1 = float(rdict["y1"])
+                    except Exception:
+                        continue  # 値が欠けている / 数値化できない
+                    r = fitz.Rect(x0, y0, x1, y1)
+                    if space == "pdf":
+                        ph = page.rect.height
+                        r = fitz.Rect(r.x0, ph - r.y1, r.x1, ph - r.y0)  # Y反転
+                    r = r & page.rect
+                    if (not r) or r.width <= 0 or r.height <= 0:
+                        continue
+                    if dedup_enabled and self._is_duplicate_rect(
+                        r, entity,
+                        self._duplicate_candidates(
+                            existing_index, page_num, r, cell_size
+                        ),
+                        page_num,
+                        tolerance=tolerance,
+                    ):
+                        continue
+                    self._add_single_highlight(page, r, entity)
+                    highlights_added += 1
+
+        return highlights_added
+
+    @staticmethod
+    def _coordinate_fallback_rects(
+        entities: List[Dict], page_count: int
+    ) -> List[Optional[Dict]]:
+        """line_rectsを持たないエンティティのcoordinatesを一括検証して矩形情報へ変換
+
+        entitiesと同じ並びで返す。line_rectsを持つもの・無効な座標
+        （ページ範囲外、幅/高さが0以下、有限値でない）はNone。
+        """
+        fallback_rects: List[Optional[Dict]] = [None] * len(entities)
+        targets = [i for i, entity in enumerate(entities) if not entity.get("line_rects")]
+        if not targets:
+            return fallback_rects
+
+        coords_list = [entities[i].get("coordinates", {}) for i in targets]
+        page_nums = [coords.get("page_number", 1) - 1 for coords in coords_list]
+        boxes = np.array(
+            [
+                [float(coords.get(key, 0)) for key in ("x0", "y0", "x1", "y1")]
+                for coords in coords_list
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        valid = (
+            np.isfinite(boxes).all(axis=1)
+            & (boxes[:, 0] < boxes[:, 2])
+            & (boxes[:, 1] < boxes[:, 3])
+            & (np.array(page_nums) < page_count)
+        )
+        for k in np.flatnonzero(valid).tolist():
+            rect = fitz.Rect(boxes[k].tolist())
+            if rect.is_empty or rect.is_infinite:
+                continue
+            fallback_rects[targets[k]] = {"rect": rect, "page_num": page_nums[k]}
+        return fallback_rects
+
+    @staticmethod
+    def _duplicate_cell_size(tolerance: float) -> float:
+        """重複判定グリッドのセル幅（許容誤差以上なら近傍セルだけで判定できる）"""
+        return max(float(tolerance), 1.0)
+
+    @staticmethod
+    def _build_duplicate_index(items: List[Dict], cell_size: float) -> DuplicateIndex:
+        """既存の注釈/ハイライトを、ページと左上座標のセルごとにまとめる"""
+        index: DuplicateIndex = {}
+        for item in items:
+            rect = item["rect"]
+            if not (math.isfinite(rect.x0) and math.isfinite(rect.y0)):
+                continue
+            cell = (int(rect.x0 // cell_size), int(rect.y0 // cell_size))
+            index.setdefault(item["page_num"], {}).setdefault(cell, []).append(item)
+        return index
+
+    @staticmethod
+    def _duplicate_candidates(
+        index: DuplicateIndex, page_num: int, rect: fitz.Rect, cell_size: float
+    ) -> List[Dict]:
+        """重複し得る既存アイテム（同じページで左上座標が隣接セル内にあるもの）"""
+        cells = index.get(page_num)
+        if not cells or not (math.isfinite(rect.x0) and math.isfinite(rect.y0)):
+            return []
+        cx, cy = int(rect.x0 // cell_size), int(rect.y0 // cell_size)
+        return [
+            item
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            for item in cells.get((cx + dx, cy + dy), ())
+        ]
+
+    def _add_single_annotation(
+        self,
+        page: fitz.Page,
+        rect: fitz.Rect,
+        entity: Dict,
+        text_display_mode: str,
+        include_text: bool,
+    ):
         """単一の注釈を追加"""
         try:
             color = self._get_annotation_color_pymupdf(entity["entity_type"])
-            content = self._generate_annotation_content(entity)
-            text_display_mode = self.config_manager.get_masking_text_display_mode()
-
+            fill_color = get_annotation_fill_color(entity["entity_type"])
+            content = self._generate_annotation_content(
+                entity, text_display_mode, include_text
+            )
             if text_display_mode == "silent":
                 annot = page.add_square_annot(rect)
-                annot.set_colors(stroke=color, fill=[c * 0.3 for c in color])
+                annot.set_colors(stroke=color, fill=fill_color)
                 annot.set_info(title="", content="")
             else:
                 annot = page.add_freetext_annot(
@@ -281,7 +460,7 @@ class PDFMasker:
                     content,
                     fontsize=8,
                     text_color=color,
-                    fill_color=[c * 0.3 for c in color],
+                    fill_color=fill_color,
                 )
                 title = "個人情報検出" if text_display_mode == "verbose" else ""
                 annot.set_info(title=title, content=content)
@@ -363,31 +542,20 @@ class PDFMasker:
         """エンティティタイプに応じたPyMuPDF用ハイライト色を取得"""
         return get_highlight_color(entity_type)
 
-    def _generate_annotation_content(self, entity: Dict) -> str:
-        """注釈内容を生成"""
-        text_display_mode = self.config_manager.get_masking_text_display_mode()
-
-        if text_display_mode == "silent":
-            return ""
-
-        entity_type = entity["entity_type"]
-        text = entity.get("text", "")
-
-        type_name = get_entity_type_name_ja(entity_type)
-
-        if text_display_mode == "minimal":
-            return type_name
-        elif text_display_mode == "verbose":
-            content = f"【個人情報】{type_name}"
-            annotation_settings = self.config_manager.get_pdf_annotation_settings()
-            if annotation_settings.get("include_text", False):
-                content += f"\nテキスト: {text[:20]}..."
-            return content
-        else:
+    def _generate_annotation_content(
+        self, entity: Dict, text_display_mode: str, include_text: bool
+    ) -> str:
+        """注釈内容を生成（表示モード・テキスト併記の有無は呼び出し側で一度だけ取得）"""
+        # テキスト併記以外はタイプと表示モードだけで決まるため、組み合わせごとにキャッシュ
+        content = _annotation_content_for(entity["entity_type"], text_display_mode)
+        if text_display_mode == "verbose":
+            if include_text:
+                content += f"\nテキスト: {entity.get('text', '')[:20]}..."
+        elif text_display_mode not in ("silent", "minimal"):
             logger.warning(
                 f"未知の文字表示モード: {text_display_mode}. verboseとして扱います。"
             )
-            return f"【個人情報】{type_name}"
+        return content
 
     def _clear_annotations_by_type(self, doc, *, highlight: bool):
         """PDFから注釈をタイプ別に削除
@@ -406,6 +574,15 @@ class PDFMasker:
             label = "ハイライト" if highlight else "注釈"
             logger.error(f"{label}削除エラー: {e}")
 
+    def _clear_for_mode(self, doc, operation_mode: str, *, highlight: bool):
+        """操作モードがclear_all/reset_and_appendなら既存の注釈またはハイライトを削除"""
+        if operation_mode not in ("clear_all", "reset_and_append"):
+            return
+        self._clear_annotations_by_type(doc, highlight=highlight)
+        label = "ハイライト" if highlight else "注釈"
+        suffix = "（リセット後追加モード）" if operation_mode == "reset_and_append" else ""
+        logger.info(f"既存の全{label}を削除しました{suffix}")
+
     def _clear_all_annotations(self, doc):
         """PDFから全ての注釈を削除（ハイライト以外）"""
         self._clear_annotations_by_type(doc, highlight=False)
@@ -414,44 +591,65 @@ class PDFMasker:
         """PDFから全てのハイライトを削除"""
         self._clear_annotations_by_type(doc, highlight=True)
 
-    def _get_existing_items(self, doc, *, highlight: bool) -> List[Dict]:
-        """既存の注釈/ハイライト情報を取得
+    def _scan_existing_items(
+        self, doc, *, highlights: bool = True, annotations: bool = True
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """既存のハイライトとそれ以外の注釈を1回の走査で分類して取得
 
         Args:
             doc: PyMuPDFドキュメント
-            highlight: Trueならハイライト、Falseならハイライト以外
+            highlights: Falseならハイライトの情報は収集しない
+            annotations: Falseならハイライト以外の情報は収集しない
+
+        Returns:
+            (ハイライトのリスト, ハイライト以外の注釈のリスト)
         """
-        existing = []
+        existing_highlights: List[Dict] = []
+        existing_annotations: List[Dict] = []
         try:
             for page_num, page in enumerate(doc):
                 for annot in page.annots():
                     is_highlight = annot.type[1] == "Highlight"
-                    if is_highlight != highlight:
+                    if not (highlights if is_highlight else annotations):
                         continue
 
-                    content = annot.info.get("content", "")
+                    # annot.infoはアクセスのたびに辞書を組み立てるため1回だけ取得
+                    info = annot.info
+                    content = info.get("content", "")
                     item = {
                         "rect": annot.rect,
                         "page_num": page_num,
                         "content": content,
-                        "title": annot.info.get("title", ""),
+                        "title": info.get("title", ""),
                     }
 
-                    if highlight:
+                    if is_highlight:
                         item["creator"] = (
                             getattr(annot, 'name', None)
-                            or getattr(annot.info, 'name', None)
+                            or getattr(info, 'name', None)
                             or ""
                         )
                         parsed_data = parse_annotation_content(content)
                         if parsed_data:
                             item.update(parsed_data)
-
-                    existing.append(item)
+                        existing_highlights.append(item)
+                    else:
+                        existing_annotations.append(item)
         except Exception as e:
-            label = "ハイライト" if highlight else "注釈"
-            logger.debug(f"既存{label}取得エラー: {e}")
-        return existing
+            logger.debug(f"既存注釈・ハイライト取得エラー: {e}")
+        return existing_highlights, existing_annotations
+
+    def _get_existing_items(self, doc, *, highlight: bool) -> List[Dict]:
+        """既存の注釈/ハイライト情報を取得
+
+        Args:
+            doc: PyMuPDFドキュメント
+            highlight: Trueならハイライト、Falseならハイライト以外
+        """
+        existing_highlights, existing_annotations = self._scan_existing_items(
+            doc, highlights=highlight, annotations=not highlight
+        )
+        return existing_highlights if highlight else existing_annotations
 
     def _get_existing_annotations(self, doc) -> List[Dict]:
         """既存の注釈情報を取得（ハイライト以外）"""
@@ -468,6 +666,7 @@ class PDFMasker:
         existing_items: List[Dict],
         page_num: int,
         check_entity_type: bool = False,
+        tolerance: Optional[float] = None,
     ) -> bool:
         """注釈/ハイライトが重複しているかをチェック
 
@@ -477,11 +676,13 @@ class PDFMasker:
             existing_items: 既存の注釈/ハイライトリスト
             page_num: ページ番号
             check_entity_type: Trueの場合、entity_typeも比較する（注釈用）
+            tolerance: 座標比較の許容誤差（未指定なら設定から取得）
         """
-        if not self.config_manager.should_remove_identical_annotations():
+        if not existing_items or not self.config_manager.should_remove_identical_annotations():
             return False
 
-        tolerance = self.config_manager.get_annotation_comparison_tolerance()
+        if tolerance is None:
+            tolerance = self.config_manager.get_annotation_comparison_tolerance()
         entity_text = entity.get("text", "")
         entity_type = entity.get("entity_type", "")
 
@@ -10,6 +10,13 @@ import logging
 import json
 import shutil
 import fnmatch
+import logging.handlers
+import multiprocessing
+import re
+import stat
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Any
@@ -23,30 +30,108 @@ from pdf.pdf_annotator import PDFAnnotator
 
 logger = logging.getLogger(__name__)
 
+# ファイル単位の並列処理で同時に動かすプロセス数の上限
+MAX_FILE_WORKERS = 4
+
+# ファイル並列処理のワーカープロセス内で使い回すプロセッサー（モデル読み込みは1回のみ）
+_worker_processor: Optional["PDFProcessor"] = None
+
+
+def _init_file_worker(config_manager: ConfigManager, log_queue, log_level: int):
+    """ワーカープロセスの初期化（プロセッサーを1度だけ構築）"""
+    global _worker_processor
+    # ログは親プロセスへ転送する（ワーカーごとにログファイルを開かない）
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+    _worker_processor = PDFProcessor(config_manager, setup_logging=False)
+    # ファイル単位で既に分散しているため、ページ抽出はワーカー内で逐次に行う
+    _worker_processor.page_extract_workers = 1
+
+
+def _process_file_in_worker(
+    file_path: str, masking_method: Optional[str], embed_coordinates: bool
+) -> Dict:
+    """ワーカープロセスで1ファイルを処理してサマリーを返す"""
+    return _worker_processor.process_pdf_file(file_path, masking_method, embed_coordinates)
+
+
+# 読み取りモードのワーカープロセス内で使い回す注釈リーダー（解析モデルは読み込まない）
+_worker_annotator: Optional[PDFAnnotator] = None
+
+
+def _init_read_worker(config_manager: ConfigManager):
+    """読み取りモードのワーカープロセスの初期化"""
+    global _worker_annotator
+    _worker_annotator = PDFAnnotator(config_manager)
+
+
+def _read_file_in_worker(pdf_path: str) -> Dict:
+    """ワーカープロセスで1ファイルの注釈を読み取る"""
+    return PDFProcessor._read_annotations(_worker_annotator, pdf_path)
+
+
+@contextmanager
+def _worker_log_queue(context):
+    """ワーカーのログを受け取り、親プロセスのハンドラーへ流すキュー"""
+    log_queue = context.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        listener.stop()
+
 
 class PDFProcessor:
     """PDFのPII処理ワークフローを管理するクラス"""
 
-    def __init__(self, config_manager: Optional[ConfigManager] = None):
+    def __init__(
+        self, config_manager: Optional[ConfigManager] = None, setup_logging: bool = True
+    ):
         """
         Args:
             config_manager: 設定管理インスタンス
+            setup_logging: ログ設定を行うか（ワーカープロセスでは親へ転送するためFalse）
         """
         self.config_manager = config_manager or ConfigManager()
-        self._setup_logging()
+        if setup_logging:
+            self._setup_logging()
 
-        self.analyzer = Analyzer(self.config_manager)
+        # 解析エンジン（Presidio・spaCy）は初回の解析時に構築する
+        self._analyzer: Optional[Analyzer] = None
         self.masker = PDFMasker(self.config_manager)
         self.annotator = PDFAnnotator(self.config_manager)
 
+        # ファイル除外パターンは1つの正規表現にまとめて一度だけコンパイル
+        self._exclusion_regex = self._compile_exclusion_regex(
+            self.config_manager.get_pdf_file_exclusions()
+        )
+
+        # 並列処理が有効ならページ抽出を複数プロセスへ分散（ワーカーはPDFを開き直す）
+        self.page_extract_workers = (
+            min(os.cpu_count() or 1, 4)
+            if self.config_manager.is_pdf_parallel_processing_enabled()
+            else 1
+        )
+
         self.processing_stats = {
             "files_processed": 0,
             "files_failed": 0,
             "total_entities_found": 0,
-            "entities_by_type": {},
+            "entities_by_type": Counter(),
             "start_time": datetime.now().isoformat(),
         }
 
+    @property
+    def analyzer(self) -> Analyzer:
+        """解析エンジン（ファイル並列処理では親プロセスでモデルを読み込まない）"""
+        if self._analyzer is None:
+            self._analyzer = Analyzer(self.config_manager)
+        return self._analyzer
+
     def _setup_logging(self):
         """ログ設定を初期化"""
         log_config = self.config_manager.get_logging_config()
@@ -66,19 +151,23 @@ class PDFProcessor:
         logger.info(f"PDF解析開始: {pdf_path}")
 
         doc = fitz.open(pdf_path)
-        locator = PDFTextLocator(doc)
+        locator = PDFTextLocator(doc, extract_workers=self.page_extract_workers)
 
         # 改行なしテキストで解析して改行を跨ぐ単語も検出
         full_text_no_newlines = locator.full_text_no_newlines
 
         enabled_entities = self.config_manager.get_enabled_entities()
-        results = self.analyzer.analyze_text(full_text_no_newlines, enabled_entities)
+        results = self.analyzer.analyze_text(
+            full_text_no_newlines,
+            enabled_entities,
+            text_bytes=locator.full_text_no_newlines_bytes,
+        )
 
-        for result in results:
-            start, end = result["start"], result["end"]
-            precise_rects_with_pages = locator.locate_pii_by_offset_no_newlines(
-                start, end
-            )
+        # 全エンティティの座標をまとめて特定
+        located_rects = locator.locate_pii_by_offset_no_newlines_batch(
+            [(result["start"], result["end"]) for result in results]
+        )
+        for result, precise_rects_with_pages in zip(results, located_rects):
 
             # エンティティ情報を更新（ページ番号はPDFTextLocatorから直接取得）
             result["line_rects"] = []
@@ -116,16 +205,16 @@ class PDFProcessor:
 
     def process_pdf_file(self, input_path: str, masking_method: str = None, embed_coordinates: bool = False) -> Dict:
         """単一PDFファイルを処理"""
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"ファイルが見つかりません: {input_path}")
+        try:
+            os.stat(input_path)
+        except (OSError, ValueError):  # os.path.existsと同じく参照できないパスは未検出として扱う
+            # 並列処理と同じく失敗件数に数える
+            self.processing_stats["files_failed"] += 1
+            raise FileNotFoundError(f"ファイルが見つかりません: {input_path}") from None
 
         if self._should_skip_file(input_path):
             logger.info(f"ファイルをスキップ: {input_path}")
-            return {
-                "input_file": input_path,
-                "skipped": True,
-                "reason": "除外パターンにマッチ",
-            }
+            return self._skipped_result(input_path)
 
         logger.info(f"PDF処理開始: {input_path}")
         backup_path = self._create_backup(input_path)
@@ -161,6 +250,16 @@ class PDFProcessor:
             return self._process_files_read_mode(path)
 
         files_to_process = self._get_files_from_path(path)
+        if (
+            len(files_to_process) > 1
+            and self.config_manager.is_pdf_parallel_processing_enabled()
+        ):
+            results = self._process_files_in_processes(
+                files_to_process, masking_method, embed_coordinates
+            )
+            self._generate_report(results)
+            return results
+
         results = []
         for file_path in files_to_process:
             try:
@@ -173,9 +272,61 @@ class PDFProcessor:
         self._generate_report(results)
         return results
 
+    def _process_files_in_processes(
+        self,
+        files_to_process: List[str],
+        masking_method: Optional[str],
+        embed_coordinates: bool,
+    ) -> List[Dict]:
+        """
+        ファイルごとに別プロセスで処理し、入力順に結果と統計を集約
+
+        各ワーカーは初期化時にプロセッサーを1度だけ構築し、Presidio・spaCyは
+        最初のファイルの解析時に読み込む（親プロセスでは読み込まない）
+        """
+        workers = min(os.cpu_count() or 1, MAX_FILE_WORKERS, len(files_to_process))
+        logger.info(f"ファイル並列処理: {len(files_to_process)}件 / {workers}プロセス")
+        context = multiprocessing.get_context("spawn")
+        results = []
+        with _worker_log_queue(context) as log_queue, ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_file_worker,
+            initargs=(
+                self.config_manager,
+                log_queue,
+                logging.getLogger().getEffectiveLevel(),
+            ),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _process_file_in_worker, file_path, masking_method, embed_coordinates
+                )
+                for file_path in files_to_process
+            ]
+            for file_path, future in zip(files_to_process, futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"ファイル処理エラー ({file_path}): {e}")
+                    self.processing_stats["files_failed"] += 1
+                    results.append({"input_file": file_path, "error": str(e)})
+                    continue
+                # ワーカー側の統計は親プロセスへ戻らないため、サマリーから集計する
+                if not result.get("skipped"):
+                    self._update_stats(result)
+                results.append(result)
+        return results
+
     def _process_files_read_mode(self, path: str) -> List[Dict]:
         """読み取りモードでファイルを処理"""
         files_to_read = self._get_files_from_path(path)
+        if (
+            len(files_to_read) > 1
+            and self.config_manager.is_pdf_parallel_processing_enabled()
+        ):
+            return self._read_files_in_processes(files_to_read)
+
         results = []
         for file_path in files_to_read:
             try:
@@ -186,21 +337,68 @@ class PDFProcessor:
                 results.append({"input_file": file_path, "error": str(e)})
         return results
 
+    def _read_files_in_processes(self, files_to_read: List[str]) -> List[Dict]:
+        """
+        ファイルごとに別プロセスで注釈を読み取り、入力順に結果を返す
+
+        除外判定は親プロセスで行い、ワーカーにはパス文字列のみを渡す
+        （PDFはワーカー内で開く）
+        """
+        results: List[Optional[Dict]] = [None] * len(files_to_read)
+        pending = []
+        for i, file_path in enumerate(files_to_read):
+            if self._should_skip_file(file_path):
+                results[i] = self._skipped_result(file_path)
+            else:
+                pending.append(i)
+
+        if pending:
+            workers = min(os.cpu_count() or 1, MAX_FILE_WORKERS, len(pending))
+            logger.info(f"注釈読み取りの並列処理: {len(pending)}件 / {workers}プロセス")
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_read_worker,
+                initargs=(self.config_manager,),
+            ) as executor:
+                futures = [
+                    executor.submit(_read_file_in_worker, files_to_read[i])
+                    for i in pending
+                ]
+                for i, future in zip(pending, futures):
+                    file_path = files_to_read[i]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        logger.error(f"ファイル読み取りエラー ({file_path}): {e}")
+                        results[i] = {"input_file": file_path, "error": str(e)}
+        return results
+
+    @staticmethod
+    def _skipped_result(file_path: str) -> Dict:
+        """除外パターンにマッチしたファイルの結果"""
+        return {
+            "input_file": file_path,
+            "skipped": True,
+            "reason": "除外パターンにマッチ",
+        }
+
     def _read_pdf_file(self, pdf_path: str) -> Dict:
         """単一PDFファイルから注釈を読み取り"""
         if self._should_skip_file(pdf_path):
-            return {
-                "input_file": pdf_path,
-                "skipped": True,
-                "reason": "除外パターンにマッチ",
-            }
+            return self._skipped_result(pdf_path)
+        return self._read_annotations(self.annotator, pdf_path)
 
+    @staticmethod
+    def _read_annotations(annotator: PDFAnnotator, pdf_path: str) -> Dict:
+        """注釈を読み取り、必要に応じてレポートを出力して結果をまとめる"""
         logger.info(f"PDF注釈読み取り開始: {pdf_path}")
         try:
-            annotations = self.annotator.read_pdf_annotations(pdf_path)
+            annotations = annotator.read_pdf_annotations(pdf_path)
             report_file = None
-            if self.config_manager.should_generate_read_report():
-                report_file = self.annotator.generate_annotations_report(
+            if annotator.config_manager.should_generate_read_report():
+                report_file = annotator.generate_annotations_report(
                     annotations, pdf_path
                 )
 
@@ -217,9 +415,13 @@ class PDFProcessor:
 
     def _get_files_from_path(self, path: str) -> List[str]:
         """指定されたパスから処理対象のPDFファイルリストを取得"""
-        if os.path.isfile(path):
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            return []
+        if stat.S_ISREG(mode):
             return [path] if path.lower().endswith(".pdf") else []
-        elif os.path.isdir(path):
+        elif stat.S_ISDIR(mode):
             import glob
 
             if self.config_manager.should_search_recursively():
@@ -235,7 +437,7 @@ class PDFProcessor:
             "output_file": out_path,
             "backup_file": back_path,
             "total_entities_found": len(entities),
-            "entities_by_type": {},
+            "entities_by_type": dict(Counter(e["entity_type"] for e in entities)),
         }
 
         # 詳細なエンティティ情報を含める場合
@@ -250,21 +452,13 @@ class PDFProcessor:
                 }
                 summary["detected_entities"].append(entity_detail)
 
-        for entity in entities:
-            e_type = entity["entity_type"]
-            summary["entities_by_type"][e_type] = (
-                summary["entities_by_type"].get(e_type, 0) + 1
-            )
         return summary
 
     def _update_stats(self, summary: Dict):
         """統計情報を更新"""
         self.processing_stats["files_processed"] += 1
         self.processing_stats["total_entities_found"] += summary["total_entities_found"]
-        for e_type, count in summary["entities_by_type"].items():
-            self.processing_stats["entities_by_type"][e_type] = (
-                self.processing_stats["entities_by_type"].get(e_type, 0) + count
-            )
+        self.processing_stats["entities_by_type"].update(summary["entities_by_type"])
 
     def _generate_report(self, results: List[Dict]):
         """処理結果のレポートを生成"""
@@ -283,7 +477,12 @@ class PDFProcessor:
         try:
             if fmt == "json":
                 report_data = {
-                    "processing_stats": self.processing_stats,
+                    "processing_stats": {
+                        **self.processing_stats,
+                        "entities_by_type": dict(
+                            self.processing_stats["entities_by_type"]
+                        ),
+                    },
                     "file_results": results,
                 }
                 with open(report_filename, "w", encoding="utf-8") as f:
@@ -332,12 +531,21 @@ class PDFProcessor:
         """ファイルのバックアップ出力は廃止（常にNone）"""
         return None
 
+    @staticmethod
+    def _compile_exclusion_regex(patterns: List[str]) -> Optional[re.Pattern]:
+        """fnmatch形式の除外パターン群を1つの正規表現に変換（fnmatch同様にnormcaseで比較）"""
+        if not patterns:
+            return None
+        return re.compile(
+            "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+        )
+
     def _should_skip_file(self, file_path: str) -> bool:
         """ファイルをスキップすべきか判定"""
-        patterns = self.config_manager.get_pdf_file_exclusions()
-        file_name = os.path.basename(file_path)
-        for pattern in patterns:
-            if fnmatch.fnmatch(file_name, pattern):
-                logger.debug(f"ファイル除外パターンにマッチ: {file_path}")
-                return True
+        if self._exclusion_regex is None:
+            return False
+        file_name = os.path.normcase(os.path.basename(file_path))
+        if self._exclusion_regex.match(file_name):
+            logger.debug(f"ファイル除外パターンにマッチ: {file_path}")
+            return True
         return False
@@ -0,0 +1,207 @@
+import re
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from presidio_analyzer import RecognizerResult
+
+from src.analysis.analyzer import Analyzer, _literal_of
+
+
+class _FakeConfigManager:
+    def __init__(self, additional_patterns=None, exclusions=None):
+        self.additional_patterns = additional_patterns or {}
+        self.config = {"exclusions": exclusions or {}}
+
+    def get_additional_patterns_mapping(self):
+        return self.additional_patterns
+
+    def is_entity_excluded(self, entity_type, text):
+        excluded = self.config["exclusions"].get(entity_type, [])
+        return text in excluded
+
+
+class _FakeNlpEngine:
+    """spaCyに渡したテキストを記録するNLPエンジン"""
+
+    def __init__(self):
+        self.processed_texts = []
+        self.batches = []
+
+    def process_text(self, text, language):
+        self.processed_texts.append(text)
+        return SimpleNamespace(tokens=[])
+
+    def process_batch(self, texts, language, batch_size):
+        texts = list(texts)
+        self.batches.append(texts)
+        for text in texts:
+            yield text, SimpleNamespace(tokens=[])
+
+
+class _FakeEngine:
+    """Presidioの代わりに先頭の単語をPERSONとして返すエンジン"""
+
+    def __init__(self):
+        self.analyze_calls = 0
+        self.nlp_engine = _FakeNlpEngine()
+
+    def analyze(self, text, language, entities, nlp_artifacts):
+        self.analyze_calls += 1
+        end = text.find(" ")
+        return [RecognizerResult("PERSON", 0, end, 0.85)]
+
+
+def _make_analyzer(config_manager):
+    analyzer = Analyzer.__new__(Analyzer)
+    analyzer.config_manager = config_manager
+    analyzer._chunk_delimiter = "\n"
+    analyzer._chunk_max_chars = 15000
+    analyzer.analyzer = _FakeEngine()
+    analyzer._literal_automaton_cache = None
+    analyzer._result_cache = OrderedDict()
+    return analyzer
+
+
+def test_result_cache_hit_skips_engine():
+    analyzer = _make_analyzer(_FakeConfigManager())
+
+    first = analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])
+    second = analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])
+
+    assert first == second == [
+        {"start": 0, "end": 5, "entity_type": "PERSON", "text": "Alice"}
+    ]
+    assert analyzer.analyzer.analyze_calls == 1
+
+
+def test_result_cache_misses_when_exclusions_change():
+    config_manager = _FakeConfigManager()
+    analyzer = _make_analyzer(config_manager)
+
+    assert len(analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])) == 1
+
+    config_manager.config["exclusions"] = {"PERSON": ["Alice"]}
+    assert analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"]) == []
+    assert analyzer.analyzer.analyze_calls == 2
+
+
+def test_result_cache_misses_when_additional_patterns_change():
+    config_manager = _FakeConfigManager()
+    analyzer = _make_analyzer(config_manager)
+
+    analyzer.analyze_text("Alice lives in Tokyo", ["PERSON", "LOCATION"])
+
+    config_manager.additional_patterns = {"LOCATION": ["Tokyo"]}
+    results = analyzer.analyze_text("Alice lives in Tokyo", ["PERSON", "LOCATION"])
+
+    assert {"start": 15, "end": 20, "entity_type": "LOCATION", "text": "Tokyo"} in results
+    assert analyzer.analyzer.analyze_calls == 2
+
+
+def test_result_cache_hit_returns_copies():
+    analyzer = _make_analyzer(_FakeConfigManager())
+
+    first = analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])
+    first[0]["text"] = "changed"
+    first.append({"start": 6, "end": 11, "entity_type": "PERSON", "text": "lives"})
+
+    second = analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])
+    second[0]["entity_type"] = "changed"
+    second.clear()
+
+    third = analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])
+    assert third == [{"start": 0, "end": 5, "entity_type": "PERSON", "text": "Alice"}]
+    assert analyzer.analyzer.analyze_calls == 1
+
+
+def test_result_cache_evicts_oldest_entry_at_limit(monkeypatch):
+    monkeypatch.setattr(Analyzer, "_RESULT_CACHE_MAX_ENTRIES", 3)
+    analyzer = _make_analyzer(_FakeConfigManager())
+
+    for name in ("Alice", "Bob", "Carol"):
+        analyzer.analyze_text(f"{name} lives in Tokyo", ["PERSON"])
+    # Aliceを参照して最近使った側へ移す
+    analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])
+    analyzer.analyze_text("Dave lives in Tokyo", ["PERSON"])
+    assert len(analyzer._result_cache) == 3
+    assert analyzer.analyzer.analyze_calls == 4
+
+    # 最も古いBobが追い出され、AliceとCarolは残る
+    analyzer.analyze_text("Alice lives in Tokyo", ["PERSON"])
+    analyzer.analyze_text("Carol lives in Tokyo", ["PERSON"])
+    assert analyzer.analyzer.analyze_calls == 4
+    analyzer.analyze_text("Bob lives in Tokyo", ["PERSON"])
+    assert analyzer.analyzer.analyze_calls == 5
+
+
+def test_chunked_analysis_sends_only_uncached_word_chunks_to_nlp():
+    analyzer = _make_analyzer(_FakeConfigManager())
+    analyzer._chunk_max_chars = 21
+    text = "Alice lives in Tokyo\n-- ** --\nAlice lives in Tokyo\nBob lives in Osaka"
+
+    results = analyzer.analyze_text(text, ["PERSON"])
+
+    assert [(r["start"], r["text"]) for r in results] == [
+        (0, "Alice"),
+        (30, "Alice"),
+        (51, "Bob"),
+    ]
+    # 記号だけのチャンクと繰り返しのチャンクはnlp.pipeに渡らない
+    nlp_engine = analyzer.analyzer.nlp_engine
+    assert nlp_engine.batches == [["Alice lives in Tokyo\n", "Bob lives in Osaka"]]
+    assert nlp_engine.processed_texts == []
+    assert analyzer.analyzer.analyze_calls == 2
+
+    assert analyzer.analyze_text(text, ["PERSON"]) == results
+    assert len(nlp_engine.batches) == 1
+    assert analyzer.analyzer.analyze_calls == 2
+
+
+def test_literal_of_accepts_only_escaped_literals():
+    assert _literal_of("田中") == "田中"
+    assert _literal_of(r"a\.b") == "a.b"
+    assert _literal_of(r"\(株\)") == "(株)"
+    assert _literal_of("a.b") is None
+    assert _literal_of(r"a\d") is None
+    assert _literal_of("") is None
+
+
+def test_literal_pattern_spans_match_finditer():
+    pytest.importorskip("ahocorasick")
+    analyzer = _make_analyzer(_FakeConfigManager())
+    text = "aaaa (株)山田 a.b axb 佐藤佐藤 03-1234 aaa\n佐藤"
+    patterns = [
+        ("PERSON", "aa"),
+        ("PERSON", re.escape("(株)山田")),
+        ("LOCATION", re.escape("a.b")),
+        ("PERSON", "佐藤"),
+        ("LOCATION", "佐藤"),
+        ("PHONE_NUMBER", re.escape("03-1234")),
+    ]
+    patterns += [
+        ("PERSON", f"filler{i}")
+        for i in range(Analyzer._LITERAL_AUTOMATON_MIN_PATTERNS)
+    ]
+    priority_seq = [(etype, idx, pat) for idx, (etype, pat) in enumerate(patterns)]
+
+    spans = analyzer._find_literal_pattern_spans(text, priority_seq)
+
+    assert set(spans) == set(range(len(priority_seq)))
+    for seq_idx, (_etype, _idx, pat) in enumerate(priority_seq):
+        expected = [m.span() for m in re.finditer(pat, text, re.MULTILINE)]
+        assert spans[seq_idx] == expected, pat
+    assert spans[0] == [(0, 2), (2, 4), (32, 34)]
+    assert spans[3] == spans[4] == [(19, 21), (21, 23), (36, 38)]
+
+
+def test_chunked_analysis_falls_back_without_process_batch():
+    analyzer = _make_analyzer(_FakeConfigManager())
+    analyzer._chunk_max_chars = 21
+    nlp_engine = analyzer.analyzer.nlp_engine
+    analyzer.analyzer.nlp_engine = SimpleNamespace(process_text=nlp_engine.process_text)
+
+    results = analyzer.analyze_text("Alice lives in Tokyo\nBob lives in Osaka", ["PERSON"])
+
+    assert [r["text"] for r in results] == ["Alice", "Bob"]
+    assert nlp_engine.processed_texts == ["Alice lives in Tokyo\n", "Bob lives in Osaka"]
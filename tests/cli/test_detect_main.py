@@ -0,0 +1,25 @@
+from src.cli.detect_main import (
+    _build_block_offset_index,
+    _convert_offsets_to_position,
+)
+
+
+def test_convert_offsets_to_position_skips_empty_blocks():
+    text_2d = [["abc", "", "de"], [], ["", "fgh"]]
+    block_index = _build_block_offset_index(text_2d)
+
+    start_pos, end_pos = _convert_offsets_to_position(2, 6, text_2d, block_index)
+
+    assert start_pos == {"page_num": 0, "block_num": 0, "offset": 2}
+    assert end_pos == {"page_num": 2, "block_num": 1, "offset": 0}
+    assert _convert_offsets_to_position(2, 6, text_2d) == (start_pos, end_pos)
+
+
+def test_convert_offsets_to_position_clamps_out_of_range():
+    text_2d = [["abc"], ["de", ""]]
+    block_index = _build_block_offset_index(text_2d)
+
+    start_pos, end_pos = _convert_offsets_to_position(10, 12, text_2d, block_index)
+
+    assert start_pos == {"page_num": 0, "block_num": 0, "offset": 0}
+    assert end_pos == {"page_num": 1, "block_num": 1, "offset": 0}
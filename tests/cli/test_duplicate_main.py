@@ -0,0 +1,49 @@
+from src.cli.duplicate_main import _dedupe_detections_spec_format
+
+
+def _entry(entity, page, start, end, origin="auto"):
+    return {
+        "start": {"page_num": page, "block_num": 0, "offset": start},
+        "end": {"page_num": page, "block_num": 0, "offset": end},
+        "entity": entity,
+        "origin": origin,
+    }
+
+
+def _dedupe(detect_list, overlap="overlap", entity_overlap_mode="same"):
+    return _dedupe_detections_spec_format(
+        detect_list,
+        overlap=overlap,
+        entity_overlap_mode=entity_overlap_mode,
+        entity_priority=[],
+        tie_break=[],
+        origin_priority=[],
+        length_pref=None,
+        position_pref=None,
+        text_2d=[["x" * 40], ["y" * 40]],
+    )
+
+
+def test_dedupe_groups_chained_overlaps_regardless_of_input_order():
+    detect_list = [
+        _entry("PERSON", 0, 8, 12),
+        _entry("PERSON", 1, 0, 3),
+        _entry("PERSON", 0, 0, 4),
+        _entry("PERSON", 0, 4, 8),
+    ]
+
+    result = _dedupe(detect_list)
+
+    # 0-4, 4-8, 8-12 は端点を共有して連鎖的に重複し、先頭位置のものが残る
+    assert result == [detect_list[2], detect_list[1]]
+
+
+def test_dedupe_same_mode_keeps_partially_overlapping_other_entities():
+    detect_list = [
+        _entry("PERSON", 0, 0, 5),
+        _entry("LOCATION", 0, 3, 9),
+        _entry("PROPER_NOUN", 0, 1, 2),
+    ]
+
+    assert _dedupe(detect_list) == [detect_list[0], detect_list[1]]
+    assert _dedupe(detect_list, entity_overlap_mode="any") == [detect_list[0]]
@@ -0,0 +1,43 @@
+import fitz
+
+from src.cli.read_main import (
+    _blocks_plain_text,
+    _read_text_and_coordinate_maps,
+)
+
+
+def _expected_char_bboxes(pdf_path):
+    """rawdictの文字bboxを page_num → [[x0,y0,x1,y1], ...] で返す（1ページ1ブロック前提）"""
+    expected = {}
+    with fitz.open(str(pdf_path)) as doc:
+        for page_num, page in enumerate(doc):
+            expected[page_num] = [
+                list(char["bbox"])
+                for block in page.get_text("rawdict")["blocks"]
+                for line in block.get("lines", [])
+                for span in line["spans"]
+                for char in span["chars"]
+            ]
+    return expected
+
+
+def test_read_text_and_coordinate_maps(make_sample_pdf):
+    pdf_path = make_sample_pdf("read.pdf")
+
+    text_2d, offset2coords_map, coords2offset_map = _read_text_and_coordinate_maps(
+        str(pdf_path)
+    )
+
+    assert text_2d == _blocks_plain_text(str(pdf_path)) == [["Alice Smith"], ["Bob Jones"]]
+
+    expected = _expected_char_bboxes(pdf_path)
+    assert [len(expected[0]), len(expected[1])] == [len("Alice Smith"), len("Bob Jones")]
+    assert offset2coords_map == {"0": {"0": expected[0]}, "1": {"0": expected[1]}}
+    assert coords2offset_map == {
+        f"({x0},{y0},{x1},{y1})": f"({page_num},0,{offset})"
+        for page_num, bboxes in expected.items()
+        for offset, (x0, y0, x1, y1) in enumerate(bboxes)
+    }
+    # 2ページ目「Bob Jones」の"J"は左から5文字目・テキスト基準線付近にある
+    x0, y0, x1, y1 = offset2coords_map["1"]["0"][4]
+    assert 40 < x0 < x1 < 300 and y0 < 60 < y1
@@ -0,0 +1,23 @@
+import fitz
+import pytest
+
+
+# 既定のサンプルPDF: 1ページ目「Alice Smith」、2ページ目「Bob Jones」
+SAMPLE_PDF_PAGES = (("Alice Smith",), ("Bob Jones",))
+
+
+@pytest.fixture
+def make_sample_pdf(tmp_path):
+    """tmp_path配下にテキストだけのPDFを作るファクトリ（pagesはページごとの行のタプル）"""
+
+    def _make(name="sample.pdf", pages=SAMPLE_PDF_PAGES):
+        pdf_path = tmp_path / name
+        with fitz.open() as doc:
+            for lines in pages:
+                page = doc.new_page(width=300, height=300)
+                for line_idx, text in enumerate(lines):
+                    page.insert_text((40, 60 + 30 * line_idx), text, fontsize=12)
+            doc.save(str(pdf_path))
+        return pdf_path
+
+    return _make
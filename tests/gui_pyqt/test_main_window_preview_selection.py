@@ -89,3 +89,36 @@ def test_preview_click_keeps_clicked_entity_selection(monkeypatch):
     finally:
         window._set_dirty(False)
         window.close()
+
+
+def test_close_pdf_rebuilds_result_view_once(monkeypatch, tmp_path):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(
+        "src.gui_pyqt.views.main_window.DetectConfigService",
+        _FakeDetectConfigService,
+    )
+
+    window = MainWindow(AppState())
+    try:
+        assert app is not None
+        window.app_state._pdf_path = tmp_path / "dummy.pdf"
+        window.app_state.detect_result = {"detect": [_make_entity("Alice", 0, 0, 0)]}
+        window.app_state.duplicate_result = {"detect": [_make_entity("Bob", 0, 0, 0)]}
+        app.processEvents()
+
+        loaded_results = []
+        original = window.result_panel.load_entities
+        monkeypatch.setattr(
+            window.result_panel,
+            "load_entities",
+            lambda result: loaded_results.append(result) or original(result),
+        )
+        monkeypatch.setattr(window, "_maybe_proceed_with_unsaved", lambda: True)
+
+        window.on_close_pdf()
+
+        assert loaded_results == [None]
+        assert window.result_panel.get_entities() == []
+    finally:
+        window._set_dirty(False)
+        window.close()
@@ -0,0 +1,331 @@
+import os
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import fitz
+from PyQt6.QtWidgets import QApplication
+
+from src.gui_pyqt.views import pdf_preview as pdf_preview_module
+from src.gui_pyqt.views.pdf_preview import PDFPreviewWidget
+
+_app = QApplication.instance() or QApplication([])
+
+
+def _create_multi_page_pdf(pdf_path, page_count=3):
+    with fitz.open() as doc:
+        for i in range(page_count):
+            page = doc.new_page(width=200, height=200)
+            page.insert_text((20, 50), f"PAGE {i + 1}", fontsize=14)
+        doc.save(str(pdf_path))
+
+
+def _wait_for_renders(preview, timeout_sec=5.0):
+    deadline = time.monotonic() + timeout_sec
+    while preview._pending_render_keys and time.monotonic() < deadline:
+        _app.processEvents()
+        time.sleep(0.005)
+    _app.processEvents()
+    assert not preview._pending_render_keys
+
+
+def _make_preview(pdf_path):
+    preview = PDFPreviewWidget()
+    preview.load_pdf(str(pdf_path))
+    _wait_for_renders(preview)
+    return preview
+
+
+def test_page_pixmap_cache_reuses_rendered_page(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "pages.pdf"
+    _create_multi_page_pdf(pdf_path)
+    preview = _make_preview(pdf_path)
+    try:
+        render_calls = []
+        original = fitz.Page.get_pixmap
+
+        def _counting_get_pixmap(page, *args, **kwargs):
+            render_calls.append(page.number)
+            return original(page, *args, **kwargs)
+
+        monkeypatch.setattr(fitz.Page, "get_pixmap", _counting_get_pixmap)
+
+        preview.next_page()
+        _wait_for_renders(preview)
+        preview.previous_page()
+        preview.next_page()
+        preview.set_highlighted_entities(
+            [{"page_num": 1, "entity_type": "PERSON", "rects_pdf": [[10, 10, 50, 30]]}]
+        )
+
+        # 2ページ目は先読み済みのため、描画されるのは先読み対象の3ページ目のみ
+        assert render_calls == [2]
+    finally:
+        preview.close_pdf()
+
+
+def test_page_pixmap_cache_is_bounded(tmp_path):
+    pdf_path = tmp_path / "many_pages.pdf"
+    page_count = PDFPreviewWidget.PAGE_PIXMAP_CACHE_SIZE + 3
+    _create_multi_page_pdf(pdf_path, page_count=page_count)
+    preview = _make_preview(pdf_path)
+    try:
+        for _ in range(page_count - 1):
+            preview.next_page()
+            _wait_for_renders(preview)
+
+        assert len(preview._page_pixmap_cache) == PDFPreviewWidget.PAGE_PIXMAP_CACHE_SIZE
+        cached_pages = [key[0] for key in preview._page_pixmap_cache]
+        assert cached_pages[-1] == page_count - 1
+        assert 0 not in cached_pages
+    finally:
+        preview.close_pdf()
+
+
+def test_page_chars_cache_is_bounded(tmp_path):
+    pdf_path = tmp_path / "chars_pages.pdf"
+    page_count = PDFPreviewWidget.PAGE_CHARS_CACHE_SIZE + 2
+    _create_multi_page_pdf(pdf_path, page_count=page_count)
+    preview = _make_preview(pdf_path)
+    try:
+        for page_num in range(page_count):
+            assert preview._get_page_chars(page_num)
+        preview._get_page_chars(2)
+
+        cached_pages = list(preview._page_chars_cache)
+        assert len(cached_pages) == PDFPreviewWidget.PAGE_CHARS_CACHE_SIZE
+        assert cached_pages[-1] == 2
+        assert 0 not in cached_pages
+    finally:
+        preview.close_pdf()
+
+
+def test_drag_overlay_reuses_composited_highlights(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "drag.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=1)
+    preview = _make_preview(pdf_path)
+    try:
+        preview.set_highlighted_entities(
+            [{"page_num": 0, "entity_type": "PERSON", "rects_pdf": [[10, 10, 50, 30]]}]
+        )
+        highlight_calls = []
+        original = preview.draw_highlights
+        monkeypatch.setattr(
+            preview,
+            "draw_highlights",
+            lambda pixmap, page: highlight_calls.append(1) or original(pixmap, page),
+        )
+
+        preview.selection_mode = PDFPreviewWidget.SELECTION_MODE_RECT
+        preview.drag_start_pos = (5.0, 5.0)
+        for x in (20.0, 40.0, 60.0):
+            preview.drag_current_pos = (x, x)
+            preview._draw_selection_overlay()
+
+        assert highlight_calls == []
+        assert not preview.preview_label.pixmap().isNull()
+    finally:
+        preview.close_pdf()
+
+
+def test_zoom_clicks_are_coalesced_into_one_render(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "zoom.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=1)
+    preview = _make_preview(pdf_path)
+    try:
+        render_zooms = []
+        original = fitz.Page.get_pixmap
+
+        def _counting_get_pixmap(page, *args, **kwargs):
+            render_zooms.append(preview.zoom_level)
+            return original(page, *args, **kwargs)
+
+        monkeypatch.setattr(fitz.Page, "get_pixmap", _counting_get_pixmap)
+
+        for _ in range(3):
+            preview.zoom_in()
+
+        assert render_zooms == []
+        assert preview._render_timer.isActive()
+
+        preview._flush_pending_preview_update()
+        _wait_for_renders(preview)
+
+        assert render_zooms == [preview.zoom_level]
+        assert preview.zoom_label.text() == "100%"
+        assert not preview._render_timer.isActive()
+    finally:
+        preview.close_pdf()
+
+
+def test_page_render_runs_off_gui_thread(tmp_path):
+    pdf_path = tmp_path / "async.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=3)
+    preview = _make_preview(pdf_path)
+    try:
+        shown_before = preview.preview_label.pixmap().cacheKey()
+        preview.go_to_page(2)
+
+        # 描画完了までは直前のページ画像を表示し続ける
+        assert preview._pending_render_keys
+        assert preview.preview_label.pixmap().cacheKey() == shown_before
+
+        _wait_for_renders(preview)
+
+        assert (2, round(preview.zoom_level, 4)) in preview._page_pixmap_cache
+        assert preview.preview_label.pixmap().cacheKey() != shown_before
+    finally:
+        preview.close_pdf()
+
+
+def test_neighbor_pages_are_prefetched(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "prefetch.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=3)
+    preview = _make_preview(pdf_path)
+    try:
+        zoom_key = round(preview.zoom_level, 4)
+        assert (1, zoom_key) in preview._page_pixmap_cache
+
+        render_calls = []
+        original = fitz.Page.get_pixmap
+
+        def _counting_get_pixmap(page, *args, **kwargs):
+            render_calls.append(page.number)
+            return original(page, *args, **kwargs)
+
+        monkeypatch.setattr(fitz.Page, "get_pixmap", _counting_get_pixmap)
+
+        preview.next_page()
+
+        # 先読み済みのページは待たずに表示され、その次のページを先読みする
+        assert (1, zoom_key) not in preview._pending_render_keys
+        _wait_for_renders(preview)
+        assert render_calls == [2]
+        assert (2, zoom_key) in preview._page_pixmap_cache
+    finally:
+        preview.close_pdf()
+
+
+def test_zoom_shows_scaled_placeholder_until_render_completes(tmp_path):
+    pdf_path = tmp_path / "placeholder.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=1)
+    preview = _make_preview(pdf_path)
+    try:
+        before = preview.preview_label.pixmap().size()
+
+        preview.zoom_in()
+        preview._flush_pending_preview_update()
+
+        # 再描画待ちの間も、新しい倍率の大きさで仮表示される
+        assert preview._pending_render_keys
+        placeholder = preview.preview_label.pixmap().size()
+        assert placeholder.width() > before.width()
+
+        _wait_for_renders(preview)
+        rendered = preview.preview_label.pixmap().size()
+        assert abs(rendered.width() - placeholder.width()) <= 1
+        assert abs(rendered.height() - placeholder.height()) <= 1
+    finally:
+        preview.close_pdf()
+
+
+def test_stale_render_is_discarded_after_reload(tmp_path):
+    pdf_path = tmp_path / "reload.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=2)
+    preview = _make_preview(pdf_path)
+    try:
+        stale_generation = preview._render_generation
+        preview.load_pdf(str(pdf_path))
+        _wait_for_renders(preview)
+        preview._page_pixmap_cache.clear()
+
+        preview._on_page_rendered(stale_generation, 0, round(preview.zoom_level, 4), None)
+
+        assert not preview._page_pixmap_cache
+        assert preview._pdf_path == str(pdf_path)
+    finally:
+        preview.close_pdf()
+
+
+def test_fitz_calls_are_serialized_between_worker_and_gui(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "locked.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=3)
+    preview = _make_preview(pdf_path)
+    try:
+        lock_owned = []
+        original_pixmap = fitz.Page.get_pixmap
+        original_text = fitz.Page.get_text
+
+        def _checking_get_pixmap(page, *args, **kwargs):
+            lock_owned.append(("pixmap", pdf_preview_module._FITZ_LOCK._is_owned()))
+            return original_pixmap(page, *args, **kwargs)
+
+        def _checking_get_text(page, *args, **kwargs):
+            lock_owned.append(("text", pdf_preview_module._FITZ_LOCK._is_owned()))
+            return original_text(page, *args, **kwargs)
+
+        monkeypatch.setattr(fitz.Page, "get_pixmap", _checking_get_pixmap)
+        monkeypatch.setattr(fitz.Page, "get_text", _checking_get_text)
+
+        preview.go_to_page(2)
+        _wait_for_renders(preview)
+        preview._get_page_chars(2)
+        preview._render_page_pixmap(0)
+
+        kinds = {kind for kind, _owned in lock_owned}
+        assert kinds == {"pixmap", "text"}
+        assert all(owned for _kind, owned in lock_owned)
+    finally:
+        preview.close_pdf()
+
+
+def test_neighbor_pages_are_not_prefetched_while_dragging(tmp_path):
+    pdf_path = tmp_path / "drag_prefetch.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=3)
+    preview = _make_preview(pdf_path)
+    try:
+        zoom_key = round(preview.zoom_level, 4)
+        preview._page_pixmap_cache.pop((1, zoom_key), None)
+
+        preview.is_dragging = True
+        preview.update_preview()
+        assert not preview._pending_render_keys
+
+        preview.is_dragging = False
+        preview.update_preview()
+        assert (1, zoom_key) in preview._pending_render_keys
+        _wait_for_renders(preview)
+    finally:
+        preview.close_pdf()
+
+
+def test_close_cancels_queued_renders(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "pages.pdf"
+    _create_multi_page_pdf(pdf_path, page_count=5)
+    preview = _make_preview(pdf_path)
+    try:
+        release = threading.Event()
+        rasterized = []
+        original = pdf_preview_module._rasterize_page
+
+        def _blocking_rasterize(path, page_num, scale):
+            release.wait(timeout=5.0)
+            rasterized.append(page_num)
+            return original(path, page_num, scale)
+
+        monkeypatch.setattr(pdf_preview_module, "_rasterize_page", _blocking_rasterize)
+        preview._page_pixmap_cache.clear()
+        for page_num in range(1, 5):
+            assert preview._request_page_render(page_num)
+        time.sleep(0.05)
+
+        preview.close()
+        release.set()
+        _wait_for_renders(preview)
+
+        # 実行中だった1ページのみ描画され、待機中の描画は取り消される
+        assert rasterized == [1]
+        assert not preview._request_page_render(2)
+    finally:
+        preview.close_pdf()
@@ -522,3 +522,18 @@ def test_calculate_fitting_fontsize_never_exceeds_bbox():
 
     assert rendered_width <= rect.width
     assert fontsize <= rect.height
+
+
+def test_offset2coords_block_index_selects_block_range():
+    offset2coords_map = {
+        "0": {"10": [[0, 0, 1, 1]], "2": [[0, 0, 1, 1]], "meta": [], "5": []},
+        "1": {},
+    }
+
+    block_ids_by_page = PipelineService._build_offset2coords_block_index(
+        offset2coords_map
+    )
+
+    assert block_ids_by_page == {"0": [2, 5, 10]}
+    assert PipelineService._block_ids_in_range([2, 5, 10], 3, 10) == [5, 10]
+    assert PipelineService._block_ids_in_range([2, 5, 10], 11, 20) == []
@@ -0,0 +1,53 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from src.gui_pyqt.views.result_panel import ResultPanel
+
+_app = QApplication.instance() or QApplication([])
+
+
+def _make_entity(word: str, page_num: int, offset: int) -> dict:
+    return {
+        "word": word,
+        "entity": "PERSON",
+        "start": {"page_num": page_num, "block_num": 0, "offset": offset},
+        "end": {"page_num": page_num, "block_num": 0, "offset": offset + len(word) - 1},
+    }
+
+
+def _column_texts(panel, column):
+    table = panel.results_table
+    return [table.item(row, column).text() for row in range(1, table.rowCount())]
+
+
+def test_update_table_reuses_unchanged_cells():
+    panel = ResultPanel()
+    panel.load_entities(
+        {"detect": [_make_entity("Alice", 0, 0), _make_entity("Bob", 1, 5)]}
+    )
+    first_row_items = [panel.results_table.item(1, col) for col in range(5)]
+    second_text_item = panel.results_table.item(2, 2)
+
+    panel.entities[1]["word"] = "Carol"
+    panel.update_table()
+
+    assert [panel.results_table.item(1, col) for col in range(5)] == first_row_items
+    assert panel.results_table.item(2, 2) is second_text_item
+    assert _column_texts(panel, 2) == ["Alice", "Carol"]
+
+
+def test_update_table_shrinks_and_filters_rows():
+    panel = ResultPanel()
+    panel.load_entities(
+        {"detect": [_make_entity("Alice", 0, 0), _make_entity("Bob", 1, 5)]}
+    )
+
+    panel._filter_inputs[2].setText("^Bob$")
+
+    assert panel.results_table.rowCount() == 2
+    assert _column_texts(panel, 2) == ["Bob"]
+    assert _column_texts(panel, 0) == ["2"]
+    assert panel.results_table.verticalHeaderItem(1).text() == "1"
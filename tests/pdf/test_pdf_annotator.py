@@ -0,0 +1,60 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.pdf import pdf_annotator as pdf_annotator_module
+from src.pdf.pdf_annotator import PDFAnnotator
+
+
+def _annotations():
+    return [
+        {"annotation_type": "Highlight", "page_number": 1, "text": "山田太郎", "opacity": 0.5},
+        {"annotation_type": "Highlight", "page_number": 2, "text": "東京都", "opacity": 1e-05},
+        {"annotation_type": "FreeText", "page_number": 2, "text": "メモ", "opacity": 1.0},
+    ]
+
+
+def _write_report(tmp_path, annotations):
+    config_manager = SimpleNamespace(get_output_dir=lambda: str(tmp_path))
+    report_path = PDFAnnotator(config_manager).generate_annotations_report(
+        annotations, "input.pdf"
+    )
+    assert report_path is not None
+    with open(report_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _assert_report(report, annotations):
+    assert report["pdf_file"] == "input.pdf"
+    assert report["total_annotations"] == len(annotations)
+    assert report["annotations_by_type"] == {"Highlight": 2, "FreeText": 1}
+    # ページ番号（int）のキーはどちらの出力でも文字列になる
+    assert report["annotations_by_page"] == {"1": 1, "2": 2}
+    assert report["annotations"] == annotations
+
+
+def test_annotations_report_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_annotator_module, "orjson", None)
+    annotations = _annotations()
+
+    _assert_report(_write_report(tmp_path, annotations), annotations)
+
+
+def test_annotations_report_with_orjson(tmp_path, monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(pdf_annotator_module, "orjson", orjson)
+    annotations = _annotations()
+
+    _assert_report(_write_report(tmp_path, annotations), annotations)
+
+
+def test_annotations_report_falls_back_to_json_for_values_orjson_rejects(
+    tmp_path, monkeypatch
+):
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(pdf_annotator_module, "orjson", orjson)
+    annotations = _annotations()
+    annotations[0]["xref"] = 2**70
+
+    _assert_report(_write_report(tmp_path, annotations), annotations)
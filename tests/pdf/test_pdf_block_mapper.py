@@ -0,0 +1,34 @@
+import fitz
+
+from src.pdf.pdf_block_mapper import PDFBlockTextMapper
+
+
+def test_char_positions_are_built_on_first_coordinate_access(make_sample_pdf):
+    pdf_path = make_sample_pdf("blocks.pdf")
+    with fitz.open(str(pdf_path)) as doc:
+        mapper = PDFBlockTextMapper(doc)
+
+        assert mapper.get_all_page_block_texts() == [["Alice Smith"], ["Bob Jones"]]
+        assert mapper.stats["total_chars"] == len("Alice Smith") + len("Bob Jones")
+        assert mapper._char_positions is None
+
+        coords = mapper.map_page_block_offset_to_coordinates(1, 0, 4, 9)
+
+        assert coords[0]["text"] == "Jones"
+        assert len(mapper.char_positions) == mapper.stats["total_chars"]
+        assert mapper.page_block_offset_mapping[1][0][0] == len("Alice Smith")
+        char_pos = mapper.char_positions[len("Alice Smith")]
+        assert (char_pos.page_num, char_pos.character) == (1, "B")
+
+
+def test_page_block_char_bboxes_do_not_build_char_positions(make_sample_pdf):
+    pdf_path = make_sample_pdf("blocks.pdf")
+    with fitz.open(str(pdf_path)) as doc:
+        mapper = PDFBlockTextMapper(doc)
+
+        bboxes = mapper.get_page_block_char_bboxes(1)
+
+        assert [len(block) for block in bboxes] == [len("Bob Jones")]
+        assert mapper.get_page_block_char_bboxes(2) == []
+        assert mapper._char_positions is None
+        assert bboxes[0][0] == mapper.char_positions[len("Alice Smith")].bbox
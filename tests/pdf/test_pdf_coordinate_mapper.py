@@ -0,0 +1,44 @@
+import fitz
+
+from src.pdf.pdf_coordinate_mapper import PDFCoordinateMapper
+
+# 1ページ目「Alice Smith」だけのサンプルPDF（conftestのmake_sample_pdf用）
+ONE_PAGE = (("Alice Smith",),)
+
+
+
+def test_save_to_same_path_appends_incremental_update(make_sample_pdf):
+    pdf_path = make_sample_pdf("same.pdf", ONE_PAGE)
+    original = pdf_path.read_bytes()
+    mapper = PDFCoordinateMapper()
+    assert mapper.load_or_create_coordinate_map(str(pdf_path))
+
+    assert mapper.save_pdf_with_coordinate_map(str(pdf_path), str(pdf_path))
+
+    # 増分保存は元のバイト列を書き換えず、末尾に更新分を追記する
+    saved = pdf_path.read_bytes()
+    assert len(saved) > len(original)
+    assert saved.startswith(original)
+    with fitz.open(str(pdf_path)) as doc:
+        assert mapper.embedded_filename in doc.embfile_names()
+        assert doc[0].get_text().strip() == "Alice Smith"
+
+    reloaded = PDFCoordinateMapper()
+    assert reloaded.load_or_create_coordinate_map(str(pdf_path))
+    assert reloaded.metadata.total_mappings == mapper.metadata.total_mappings
+
+
+def test_save_to_new_path_keeps_page_content(tmp_path, make_sample_pdf):
+    pdf_path = make_sample_pdf("source.pdf", ONE_PAGE)
+    out_path = tmp_path / "out.pdf"
+    with fitz.open(str(pdf_path)) as doc:
+        source_stream = doc[0].read_contents()
+    mapper = PDFCoordinateMapper()
+    assert mapper.load_or_create_coordinate_map(str(pdf_path))
+
+    assert mapper.save_pdf_with_coordinate_map(str(pdf_path), str(out_path))
+
+    with fitz.open(str(out_path)) as doc:
+        assert mapper.embedded_filename in doc.embfile_names()
+        # 内容ストリームはclean（サニタイズ）せずそのまま書き出す
+        assert doc[0].read_contents() == source_stream
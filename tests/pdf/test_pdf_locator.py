@@ -0,0 +1,235 @@
+import fitz
+import numpy as np
+import pytest
+
+from src.pdf.pdf_locator import (
+    PDFTextLocator,
+    _reduce_line_bboxes_numpy,
+    _sweep_line_bboxes,
+)
+
+# 既定のサンプルPDFの1ページ目に2行目「Tokyo Japan」を加えたもの
+LOCATOR_PAGES = (("Alice Smith", "Tokyo Japan"), ("Bob Jones",))
+
+
+def _open_locator(pdf_path):
+    doc = fitz.open(str(pdf_path))
+    return doc, PDFTextLocator(doc)
+
+
+def test_locate_single_line_span_returns_one_rect(make_sample_pdf):
+    pdf_path = make_sample_pdf("locator.pdf", LOCATOR_PAGES)
+    doc, locator = _open_locator(pdf_path)
+    try:
+        text = locator.full_text_no_newlines
+        start = text.index("Smith")
+        rects = locator.locate_pii_by_offset_no_newlines(start, start + len("Smith"))
+
+        assert len(rects) == 1
+        assert rects[0]["page_num"] == 0
+        expected = doc[0].search_for("Smith")[0]
+        assert abs(rects[0]["rect"].x0 - expected.x0) < 1.0
+        assert abs(rects[0]["rect"].x1 - expected.x1) < 1.0
+    finally:
+        doc.close()
+
+
+def test_locate_span_across_lines_and_pages_returns_rect_per_line(make_sample_pdf):
+    pdf_path = make_sample_pdf("locator_multi.pdf", LOCATOR_PAGES)
+    doc, locator = _open_locator(pdf_path)
+    try:
+        text = locator.full_text_no_newlines
+        start = text.index("Smith")
+        end = text.index("Bob") + len("Bob")
+        rects = locator.locate_pii_by_offset_no_newlines(start, end)
+
+        assert [r["page_num"] for r in rects] == [0, 0, 1]
+        assert rects[0]["rect"].y1 <= rects[1]["rect"].y0 + 1.0
+    finally:
+        doc.close()
+
+
+def test_locate_rejects_invalid_ranges(make_sample_pdf):
+    pdf_path = make_sample_pdf("locator_invalid.pdf", LOCATOR_PAGES)
+    doc, locator = _open_locator(pdf_path)
+    try:
+        length = len(locator.full_text_no_newlines)
+        assert locator.locate_pii_by_offset_no_newlines(-1, 2) == []
+        assert locator.locate_pii_by_offset_no_newlines(3, 3) == []
+        assert locator.locate_pii_by_offset_no_newlines(0, length + 1) == []
+    finally:
+        doc.close()
+
+
+def test_line_bbox_sweep_matches_numpy_reduction():
+    bboxes = np.array(
+        [
+            [10.0, 20.0, 15.0, 30.0],
+            [15.0, 19.0, 20.0, 31.0],
+            [10.0, 40.0, 14.0, 50.0],
+            [10.0, 20.0, 12.0, 29.0],
+            [12.0, 21.0, 18.0, 28.0],
+        ]
+    )
+    line_ids = np.array([0, 0, 1, 2, 2], dtype=np.int32)
+
+    swept_bboxes, swept_starts = _sweep_line_bboxes(bboxes, line_ids)
+    reduced_bboxes, reduced_starts = _reduce_line_bboxes_numpy(bboxes, line_ids)
+
+    np.testing.assert_array_equal(swept_bboxes, reduced_bboxes)
+    np.testing.assert_array_equal(swept_starts, reduced_starts)
+    assert swept_starts.tolist() == [0, 2, 3]
+    assert swept_bboxes.tolist() == [
+        [10.0, 19.0, 20.0, 31.0],
+        [10.0, 40.0, 14.0, 50.0],
+        [10.0, 20.0, 18.0, 29.0],
+    ]
+
+
+def test_char_data_view_is_built_lazily_from_columns(tmp_path):
+    pdf_path = tmp_path / "locator_view.pdf"
+    with fitz.open() as new_doc:
+        page = new_doc.new_page(width=300, height=300)
+        page.insert_text((40, 60), "Alice\nSmith", fontsize=12)
+        new_doc.save(str(pdf_path))
+    doc, locator = _open_locator(pdf_path)
+    try:
+        assert locator._char_data_view is None
+
+        char_data = locator.char_data
+        text_entries = [entry for entry in char_data if entry["char"] != "\n"]
+        assert "".join(entry["char"] for entry in text_entries) == (
+            locator.full_text_no_newlines
+        )
+        first = text_entries[0]
+        assert first["global_char_idx"] == 0
+        assert "rect" not in first and len(first["bbox"]) == 4
+        assert first["font"] and first["size"] == 12
+        newline = next(entry for entry in char_data if entry["char"] == "\n")
+        assert newline["bbox"] is None and newline["span"] == -1
+        assert locator.char_data is char_data
+    finally:
+        doc.close()
+
+
+def test_repeated_locate_is_served_from_coordinate_cache(make_sample_pdf):
+    pdf_path = make_sample_pdf("locator_coord_cache.pdf", LOCATOR_PAGES)
+    doc, locator = _open_locator(pdf_path)
+    try:
+        start = locator.full_text_no_newlines.index("Tokyo")
+        first = locator.locate_pii_by_offset_no_newlines(start, start + 5)
+
+        assert locator._coordinate_cache == {(start, start + 5): first}
+        assert locator.locate_pii_by_offset_no_newlines(start, start + 5) is first
+        assert locator.get_stats()["cache_entries"] == 1
+
+        locator.clear_cache()
+        assert locator.get_stats()["cache_entries"] == 0
+    finally:
+        doc.close()
+
+
+def test_coordinate_cache_evicts_least_recently_used(make_sample_pdf):
+    pdf_path = make_sample_pdf("locator_coord_lru.pdf", LOCATOR_PAGES)
+    with fitz.open(str(pdf_path)) as doc:
+        locator = PDFTextLocator(doc, max_cache_entries=2)
+        locator.locate_pii_by_offset_no_newlines(0, 1)
+        locator.locate_pii_by_offset_no_newlines(1, 2)
+        locator.locate_pii_by_offset_no_newlines(0, 1)
+        locator.locate_pii_by_offset_no_newlines(2, 3)
+
+        assert list(locator._coordinate_cache) == [(0, 1), (2, 3)]
+
+
+def test_spans_with_same_style_share_one_style_entry(make_sample_pdf):
+    pdf_path = make_sample_pdf("locator_styles.pdf", LOCATOR_PAGES)
+    doc, locator = _open_locator(pdf_path)
+    try:
+        assert len(locator._span_styles) == 1
+        first = locator.char_data[0]
+        assert first["font"] == locator._span_styles[0]["font"]
+        assert first["size"] == 12
+    finally:
+        doc.close()
+
+
+def test_parallel_extraction_matches_serial(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "locator_parallel.pdf"
+    with fitz.open() as new_doc:
+        for i, fontname in enumerate(("helv", "cour", "helv")):
+            page = new_doc.new_page(width=300, height=300)
+            page.insert_text((40, 60), f"Page {i}\nLine two", fontname=fontname)
+        new_doc.save(str(pdf_path))
+    monkeypatch.setattr("src.pdf.pdf_locator.PARALLEL_EXTRACTION_MIN_PAGES", 1)
+
+    with fitz.open(str(pdf_path)) as doc:
+        serial = PDFTextLocator(doc)
+
+        def _fail_process_page(self, *args, **kwargs):
+            raise AssertionError("並列抽出時は親プロセスでページ処理しない")
+
+        monkeypatch.setattr(PDFTextLocator, "_process_page", _fail_process_page)
+        parallel = PDFTextLocator(doc, extract_workers=2)
+
+        assert parallel.full_text == serial.full_text
+        assert parallel.full_text_no_newlines == serial.full_text_no_newlines
+        assert parallel.char_data == serial.char_data
+        assert len(parallel._span_styles) == 2
+
+
+def test_no_newlines_byte_length_matches_utf8_encoding(tmp_path):
+    pdf_path = tmp_path / "locator_bytes.pdf"
+    with fitz.open() as doc:
+        page = doc.new_page(width=300, height=300)
+        page.insert_text((40, 60), "山田太郎 様", fontname="japan", fontsize=12)
+        page.insert_text((40, 90), "café 03-1234", fontsize=12)
+        doc.save(str(pdf_path))
+    doc, locator = _open_locator(pdf_path)
+    try:
+        text = locator.full_text_no_newlines
+        assert not text.isascii()
+        assert locator.full_text_no_newlines_bytes == len(text.encode("utf-8"))
+    finally:
+        doc.close()
+
+
+def test_batch_locate_matches_individual_calls(make_sample_pdf):
+    pdf_path = make_sample_pdf("locator_batch.pdf", LOCATOR_PAGES)
+    with fitz.open(str(pdf_path)) as doc:
+        single = PDFTextLocator(doc, enable_cache=False)
+        batched = PDFTextLocator(doc)
+        text = single.full_text_no_newlines
+        smith = text.index("Smith")
+        ranges = [
+            (smith, text.index("Bob") + 3),
+            (0, 5),
+            (3, 3),
+            (-1, 2),
+            (smith, smith + 5),
+        ]
+
+        results = batched.locate_pii_by_offset_no_newlines_batch(ranges)
+
+        assert results == [
+            single.locate_pii_by_offset_no_newlines(start, end)
+            for start, end in ranges
+        ]
+        assert [len(rects) for rects in results] == [3, 1, 0, 0, 1]
+        assert batched.locate_pii_by_offset_no_newlines_batch(ranges[:1])[0] is results[0]
+
+
+def test_batch_locate_with_sweep_kernel_matches_numpy(
+    monkeypatch, make_sample_pdf
+):
+    pdf_path = make_sample_pdf("locator_batch_kernel.pdf", LOCATOR_PAGES)
+    with fitz.open(str(pdf_path)) as doc:
+        locator = PDFTextLocator(doc, enable_cache=False)
+        length = len(locator.full_text_no_newlines)
+        ranges = [(0, length), (2, 9), (length - 4, length)]
+        expected = locator.locate_pii_by_offset_no_newlines_batch(ranges)
+
+        # numba導入時に使われる走査カーネル（JITなしで同じ処理）でも同じ結果になる
+        monkeypatch.setattr(
+            "src.pdf.pdf_locator._group_line_bboxes", _sweep_line_bboxes
+        )
+        assert locator.locate_pii_by_offset_no_newlines_batch(ranges) == expected
@@ -0,0 +1,129 @@
+import shutil
+
+import fitz
+import pytest
+
+from src.core.config_manager import ConfigManager
+from src.pdf.pdf_masker import PDFMasker, _annotation_content_for, _copy_pdf_file
+
+
+def test_coordinate_fallback_rects_validates_coordinates_in_bulk():
+    entities = [
+        {"coordinates": {"page_number": 1, "x0": 10, "y0": 20, "x1": 50, "y1": 30}},
+        {"line_rects": [{"rect": {"x0": 0, "y0": 0, "x1": 1, "y1": 1}, "page_num": 0}]},
+        {"coordinates": {"page_number": 3, "x0": 10, "y0": 20, "x1": 50, "y1": 30}},
+        {"coordinates": {"page_number": 2, "x0": 50, "y0": 20, "x1": 10, "y1": 30}},
+        {"coordinates": {"page_number": 2, "x0": 0, "y0": 0, "x1": float("inf"), "y1": 5}},
+        {"coordinates": {"page_number": 2, "x0": "1.5", "y0": 2, "x1": 8, "y1": 9}},
+    ]
+
+    rects = PDFMasker._coordinate_fallback_rects(entities, page_count=2)
+
+    assert rects[0] == {"rect": fitz.Rect(10, 20, 50, 30), "page_num": 0}
+    assert rects[1:5] == [None, None, None, None]
+    assert rects[5] == {"rect": fitz.Rect(1.5, 2, 8, 9), "page_num": 1}
+
+
+def test_duplicate_index_only_returns_nearby_items_on_same_page():
+    masker = PDFMasker(ConfigManager())
+    near = {"rect": fitz.Rect(10.05, 20, 50, 30), "page_num": 0, "text": "a"}
+    far = {"rect": fitz.Rect(200, 20, 240, 30), "page_num": 0, "text": "a"}
+    other_page = {"rect": fitz.Rect(10, 20, 50, 30), "page_num": 1, "text": "a"}
+    index = masker._build_duplicate_index([near, far, other_page], 1.0)
+
+    rect = fitz.Rect(10, 20, 50, 30)
+    candidates = masker._duplicate_candidates(index, 0, rect, 1.0)
+
+    assert candidates == [near]
+    assert masker._is_duplicate_rect(rect, {"text": "a"}, candidates, 0)
+    assert masker._duplicate_candidates(index, 2, rect, 1.0) == []
+
+
+def test_annotation_content_is_cached_per_type_and_mode():
+    masker = PDFMasker(ConfigManager())
+    entity = {"entity_type": "PERSON", "text": "山田太郎"}
+    _annotation_content_for.cache_clear()
+
+    minimal = [masker._generate_annotation_content(entity, "minimal", False) for _ in range(3)]
+    verbose = masker._generate_annotation_content(entity, "verbose", True)
+
+    assert len(set(minimal)) == 1
+    assert verbose == f"【個人情報】{minimal[0]}\nテキスト: 山田太郎..."
+    assert masker._generate_annotation_content(entity, "silent", True) == ""
+    info = _annotation_content_for.cache_info()
+    assert (info.hits, info.misses) == (2, 3)
+
+
+def test_copy_pdf_file_copies_content_and_refuses_same_file(tmp_path):
+    src = tmp_path / "src.pdf"
+    src.write_bytes(b"%PDF-1.7\n" + bytes(range(256)) * 1000)
+    dst = tmp_path / "dst.pdf"
+    dst.write_bytes(b"stale content that is longer than nothing")
+
+    _copy_pdf_file(str(src), str(dst))
+
+    assert dst.read_bytes() == src.read_bytes()
+    with pytest.raises(shutil.SameFileError):
+        _copy_pdf_file(str(src), str(src))
+    assert src.stat().st_size > 0
+
+
+# 1ページ目「Alice Smith」だけのサンプルPDF（conftestのmake_sample_pdf用）
+PERSON_PAGES = (("Alice Smith",),)
+
+
+def _person_entities():
+    return [
+        {
+            "entity_type": "PERSON",
+            "text": "Alice Smith",
+            "line_rects": [
+                {"rect": {"x0": 40.0, "y0": 48.0, "x1": 110.0, "y1": 62.0}, "page_num": 0}
+            ],
+        }
+    ]
+
+
+def test_both_masking_adds_highlights_and_annotations_in_one_save(
+    monkeypatch, make_sample_pdf
+):
+    pdf_path = make_sample_pdf("both.pdf", PERSON_PAGES)
+    entities = _person_entities()
+    saves = []
+    original_save = fitz.Document.save
+    monkeypatch.setattr(
+        fitz.Document,
+        "save",
+        lambda doc, *args, **kwargs: saves.append(1) or original_save(doc, *args, **kwargs),
+    )
+
+    output_path = PDFMasker(ConfigManager()).apply_masking(str(pdf_path), entities, "both")
+
+    assert saves == [1]
+    with fitz.open(output_path) as doc:
+        annot_types = sorted(annot.type[1] for annot in doc[0].annots())
+    assert annot_types == ["FreeText", "Highlight"]
+
+
+def test_both_masking_scans_existing_items_once(monkeypatch, make_sample_pdf):
+    pdf_path = make_sample_pdf("rescan.pdf", PERSON_PAGES)
+    entities = _person_entities()
+    masker = PDFMasker(ConfigManager())
+    monkeypatch.setattr(
+        masker.config_manager, "should_remove_identical_annotations", lambda: True
+    )
+    output_path = masker.apply_masking(str(pdf_path), entities, "both")
+    scans = []
+    original_scan = PDFMasker._scan_existing_items
+    monkeypatch.setattr(
+        PDFMasker,
+        "_scan_existing_items",
+        lambda self, doc, **kwargs: scans.append(kwargs) or original_scan(self, doc, **kwargs),
+    )
+
+    masker._apply_combined_masking_with_mode(output_path, entities, "clear_all")
+
+    assert scans == [{}]
+    with fitz.open(output_path) as doc:
+        annot_types = [annot.type[1] for annot in doc[0].annots()]
+    assert annot_types.count("Highlight") == 1
@@ -0,0 +1,141 @@
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+# pdf_processorはsrc直下を基準にimportする
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from core.config_manager import ConfigManager  # noqa: E402
+from pdf import pdf_processor  # noqa: E402
+
+
+class _InlineExecutor:
+    """ProcessPoolExecutorの代わりに同じプロセスで逐次実行する"""
+
+    instances = []
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        self.max_workers = max_workers
+        self.submitted = []
+        initializer(*initargs)
+        _InlineExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        self.submitted.append(args[0])
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def _make_processor(monkeypatch):
+    _InlineExecutor.instances = []
+    monkeypatch.setattr(pdf_processor, "ProcessPoolExecutor", _InlineExecutor)
+    return pdf_processor.PDFProcessor(ConfigManager(), setup_logging=False)
+
+
+def test_process_files_in_processes_keeps_order_and_rebuilds_stats(monkeypatch):
+    init_args = []
+    monkeypatch.setattr(
+        pdf_processor, "_init_file_worker", lambda *args: init_args.append(args)
+    )
+
+    def fake_worker(file_path, masking_method, embed_coordinates):
+        assert (masking_method, embed_coordinates) == ("highlight", True)
+        if file_path == "missing.pdf":
+            raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
+        if file_path == "skip.pdf":
+            return pdf_processor.PDFProcessor._skipped_result(file_path)
+        count = {"a.pdf": 2, "b.pdf": 1}[file_path]
+        return {
+            "input_file": file_path,
+            "total_entities_found": count,
+            "entities_by_type": {"PERSON": count, "LOCATION": 1},
+        }
+
+    monkeypatch.setattr(pdf_processor, "_process_file_in_worker", fake_worker)
+    processor = _make_processor(monkeypatch)
+    files = ["a.pdf", "missing.pdf", "skip.pdf", "b.pdf"]
+
+    results = processor._process_files_in_processes(files, "highlight", True)
+
+    assert [result["input_file"] for result in results] == files
+    assert results[1] == {
+        "input_file": "missing.pdf",
+        "error": "ファイルが見つかりません: missing.pdf",
+    }
+    assert results[2]["skipped"] is True
+    stats = processor.processing_stats
+    assert stats["files_processed"] == 2
+    assert stats["files_failed"] == 1
+    assert stats["total_entities_found"] == 3
+    assert stats["entities_by_type"] == {"PERSON": 3, "LOCATION": 2}
+    assert _InlineExecutor.instances[0].submitted == files
+    # ワーカーには設定とログ転送用のキューを渡し、親では解析エンジンを構築しない
+    assert init_args[0][0] is processor.config_manager
+    assert processor._analyzer is None
+
+
+def test_missing_file_counts_as_failed_in_sequential_path(tmp_path):
+    processor = pdf_processor.PDFProcessor(ConfigManager(), setup_logging=False)
+    missing = tmp_path / "missing.pdf"
+
+    with pytest.raises(FileNotFoundError, match="ファイルが見つかりません"):
+        processor.process_pdf_file(str(missing))
+
+    assert processor.processing_stats["files_failed"] == 1
+    assert processor._analyzer is None
+
+
+def test_read_files_in_processes_merges_skipped_and_worker_results(monkeypatch):
+    init_args = []
+    monkeypatch.setattr(
+        pdf_processor, "_init_read_worker", lambda *args: init_args.append(args)
+    )
+
+    def fake_reader(pdf_path):
+        if pdf_path == "broken.pdf":
+            raise RuntimeError("cannot open")
+        return {"input_file": pdf_path, "total_annotations": len(pdf_path)}
+
+    monkeypatch.setattr(pdf_processor, "_read_file_in_worker", fake_reader)
+    processor = _make_processor(monkeypatch)
+    processor._exclusion_regex = processor._compile_exclusion_regex(["draft_*"])
+    files = ["draft_1.pdf", "a.pdf", "broken.pdf", "draft_2.pdf", "bb.pdf"]
+
+    results = processor._read_files_in_processes(files)
+
+    assert results == [
+        processor._skipped_result("draft_1.pdf"),
+        {"input_file": "a.pdf", "total_annotations": 5},
+        {"input_file": "broken.pdf", "error": "cannot open"},
+        processor._skipped_result("draft_2.pdf"),
+        {"input_file": "bb.pdf", "total_annotations": 6},
+    ]
+    # 除外したファイルはワーカーへ渡さない
+    executor = _InlineExecutor.instances[0]
+    assert executor.submitted == ["a.pdf", "broken.pdf", "bb.pdf"]
+    assert executor.max_workers <= min(pdf_processor.MAX_FILE_WORKERS, 3)
+    assert init_args == [(processor.config_manager,)]
+
+
+def test_read_files_in_processes_skips_pool_when_all_files_are_excluded(monkeypatch):
+    processor = _make_processor(monkeypatch)
+    processor._exclusion_regex = processor._compile_exclusion_regex(["*.pdf"])
+
+    results = processor._read_files_in_processes(["a.pdf", "b.pdf"])
+
+    assert all(result["skipped"] for result in results)
+    assert _InlineExecutor.instances == []